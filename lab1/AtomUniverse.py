@@ -0,0 +1,99 @@
+class AtomUniverse:
+    """
+    @brief Словарь атомов, сопоставляющий каждому атому номер бита.
+    @details Общий объект для набора BitsetCantorSet: множество атомов этого
+             словаря - целое число, в котором бит i установлен, если атом с
+             номером i входит в множество. Номера выдаются в порядке
+             добавления. Фиксированный словарь (fixed=True) не пополняется и
+             отвергает неизвестные атомы.
+    """
+
+    __slots__ = ("_positions", "_atoms", "_fixed")
+
+    def __init__(self, atoms=(), fixed=False):
+        """
+        @brief Создает словарь атомов.
+        @param atoms Начальные атомы (строки; пробелы по краям отбрасываются).
+        @param fixed True - запретить добавление новых атомов.
+        """
+        self._positions = {}
+        self._atoms = []
+        self._fixed = False
+        for atom in atoms:
+            self.position(atom)
+        self._fixed = fixed
+
+    @property
+    def fixed(self):
+        """@brief Запрещено ли пополнение словаря."""
+        return self._fixed
+
+    @property
+    def atoms(self):
+        """@brief Атомы в порядке номеров (копия списка)."""
+        return self._atoms[:]
+
+    def __len__(self):
+        return len(self._atoms)
+
+    def __contains__(self, atom):
+        return atom in self._positions
+
+    def position(self, atom):
+        """
+        @brief Номер бита атома; новый атом добавляется в нефиксированный словарь.
+        @param atom Строка.
+        @return Номер бита.
+        @throws ValueError для неизвестного атома фиксированного словаря.
+        @throws TypeError, если атом не строка.
+        """
+        position = self._positions.get(atom)
+        if position is not None:
+            return position
+        if not isinstance(atom, str):
+            raise TypeError("Атом должен быть строкой: {!r}".format(atom))
+        item = atom.strip()
+        position = self._positions.get(item)
+        if position is not None:
+            return position
+        if self._fixed:
+            raise ValueError("Атом отсутствует в фиксированном словаре: {}".format(item))
+        position = len(self._atoms)
+        self._positions[item] = position
+        self._atoms.append(item)
+        return position
+
+    def atom(self, position):
+        """
+        @brief Атом с номером бита position.
+        """
+        return self._atoms[position]
+
+    def mask(self, atoms):
+        """
+        @brief Битовая маска набора атомов.
+        @param atoms Итерируемый объект строк (пустые строки пропускаются).
+        @return Целое число.
+        """
+        result = 0
+        for atom in atoms:
+            if isinstance(atom, str) and not atom.strip():
+                continue
+            result |= 1 << self.position(atom)
+        return result
+
+    def atoms_of(self, mask):
+        """
+        @brief Атомы маски в порядке номеров.
+        @return Список строк.
+        """
+        atoms = self._atoms
+        result = []
+        while mask:
+            low = mask & -mask
+            result.append(atoms[low.bit_length() - 1])
+            mask ^= low
+        return result
+
+    def __repr__(self):
+        return "AtomUniverse({} atoms{})".format(len(self._atoms), ", fixed" if self._fixed else "")
@@ -0,0 +1,208 @@
+from AtomUniverse import AtomUniverse
+from CantorSet import CantorSet
+
+
+class BitsetCantorSet:
+    """
+    @brief Плоское множество атомов общего словаря, хранящееся битовой маской.
+    @details Атомы сопоставляются битам общим объектом AtomUniverse, само
+             множество - одно целое число Python. Объединение, пересечение и
+             разность (+, *, -) - битовые операции |, &, & ~ над масками,
+             проверка принадлежности - проверка одного бита. Операнды операций
+             должны использовать один и тот же словарь. Вложенные множества не
+             поддерживаются (для них - CantorSet).
+    """
+
+    __slots__ = ("_universe", "_mask")
+
+    def __init__(self, data=None, universe=None):
+        """
+        @brief Создает множество.
+        @param data Строка "{a, b}", CantorSet без вложенных множеств,
+               BitsetCantorSet или iterable атомов.
+        @param universe Словарь атомов (по умолчанию - новый пустой словарь).
+        @throws TypeError, если data содержит вложенные множества.
+        """
+        self._universe = universe if universe is not None else AtomUniverse()
+        self._mask = 0
+        if data is None:
+            return
+        if isinstance(data, BitsetCantorSet) and data._universe is self._universe:
+            self._mask = data._mask
+            return
+        if isinstance(data, str):
+            data = CantorSet(data)
+        atoms = data.elements if isinstance(data, (CantorSet, BitsetCantorSet)) else list(data)
+        for atom in atoms:
+            if isinstance(atom, CantorSet):
+                raise TypeError("BitsetCantorSet не поддерживает вложенные множества")
+        self._mask = self._universe.mask(atoms)
+
+    @staticmethod
+    def _from_mask(universe, mask):
+        """Создает множество из готовой маски без проверок."""
+        result = object.__new__(BitsetCantorSet)
+        result._universe = universe
+        result._mask = mask
+        return result
+
+    # Управление доступом - свойства только для чтения
+    @property
+    def universe(self):
+        """@brief Общий словарь атомов."""
+        return self._universe
+
+    @property
+    def mask(self):
+        """@brief Битовая маска множества."""
+        return self._mask
+
+    @property
+    def elements(self):
+        """@brief Атомы множества в порядке словаря (копия)."""
+        return self._universe.atoms_of(self._mask)
+
+    @property
+    def size(self):
+        """@brief Мощность множества."""
+        return bin(self._mask).count("1")
+
+    def get_cardinality(self):
+        """
+        @brief Мощность множества.
+        """
+        return self.size
+
+    def is_empty(self):
+        """
+        @brief Проверка пустоты множества.
+        """
+        return self._mask == 0
+
+    def contains(self, element):
+        """
+        @brief Проверка принадлежности атома множеству.
+        @return True, если атом есть в словаре и его бит установлен.
+        """
+        try:
+            position = self._universe._positions.get(element)
+        except TypeError:  # Нехешируемый объект не может быть атомом
+            return False
+        return position is not None and (self._mask >> position) & 1 == 1
+
+    def __getitem__(self, element):
+        return self.contains(element)
+
+    def add(self, element):
+        """
+        @brief Добавляет атом (пустые строки игнорируются).
+        @throws TypeError для вложенного множества.
+        """
+        if isinstance(element, (CantorSet, BitsetCantorSet)):
+            raise TypeError("BitsetCantorSet не поддерживает вложенные множества")
+        self._mask |= self._universe.mask((element,))
+
+    def remove(self, element):
+        """
+        @brief Удаляет атом. Если атома нет, выбрасывает KeyError.
+        """
+        if not self.contains(element):
+            raise KeyError("Элемент не найден в множестве: {}".format(element))
+        self._mask &= ~(1 << self._universe._positions[element])
+
+    def to_cantor_set(self):
+        """
+        @brief Преобразует в обычный CantorSet.
+        """
+        return CantorSet(self.elements)
+
+    # Алгебра множеств - битовые операции
+    def _other_mask(self, other):
+        if not isinstance(other, BitsetCantorSet):
+            return None
+        if other._universe is not self._universe:
+            raise ValueError("Множества используют разные словари атомов")
+        return other._mask
+
+    def __add__(self, other):
+        """
+        @brief Объединение множеств (возвращает новый объект).
+        """
+        mask = self._other_mask(other)
+        if mask is None:
+            return NotImplemented
+        return BitsetCantorSet._from_mask(self._universe, self._mask | mask)
+
+    def __iadd__(self, other):
+        """
+        @brief Объединение множеств (in-place).
+        """
+        mask = self._other_mask(other)
+        if mask is None:
+            return NotImplemented
+        self._mask |= mask
+        return self
+
+    def __mul__(self, other):
+        """
+        @brief Пересечение множеств (возвращает новый объект).
+        """
+        mask = self._other_mask(other)
+        if mask is None:
+            return NotImplemented
+        return BitsetCantorSet._from_mask(self._universe, self._mask & mask)
+
+    def __imul__(self, other):
+        """
+        @brief Пересечение множеств (in-place).
+        """
+        mask = self._other_mask(other)
+        if mask is None:
+            return NotImplemented
+        self._mask &= mask
+        return self
+
+    def __sub__(self, other):
+        """
+        @brief Разность множеств (возвращает новый объект).
+        """
+        mask = self._other_mask(other)
+        if mask is None:
+            return NotImplemented
+        return BitsetCantorSet._from_mask(self._universe, self._mask & ~mask)
+
+    def __isub__(self, other):
+        """
+        @brief Разность множеств (in-place).
+        """
+        mask = self._other_mask(other)
+        if mask is None:
+            return NotImplemented
+        self._mask &= ~mask
+        return self
+
+    def clone(self):
+        """
+        @brief Копия множества над тем же словарем.
+        """
+        return BitsetCantorSet._from_mask(self._universe, self._mask)
+
+    def __eq__(self, other):
+        """
+        @brief Равенство с BitsetCantorSet (сравнение масок для общего словаря) или CantorSet.
+        """
+        if isinstance(other, BitsetCantorSet):
+            if other._universe is self._universe:
+                return self._mask == other._mask
+            return set(self.elements) == set(other.elements)
+        if isinstance(other, CantorSet):
+            return self.to_cantor_set() == other
+        return False
+
+    __hash__ = None
+
+    def __repr__(self):
+        """
+        @brief Строковое представление множества (в формате CantorSet).
+        """
+        return "{" + ", ".join(self.elements) + "}"
@@ -1,9 +1,17 @@
-import itertools
+import io
 
 class CantorSet:
     """
     @brief Класс неориентированного множества (с поддержкой вложений),
            способного парсить строковое представление вида "{a, b, {c, d}, ...}".
+    @details Элементы хранятся в словаре-индексе {элемент: None}: он сохраняет
+             порядок добавления и дает проверку принадлежности, добавление и
+             удаление за O(1) в среднем. Вложенные множества хранятся как
+             интернированные FrozenCantorSet: одинаковые подмножества - один
+             общий неизменяемый объект, поэтому объединение, пересечение, булеан
+             и клонирование не копируют их. Ключи индекса сравниваются по
+             структурному хешу, не зависящему от порядка элементов; хеш
+             кешируется и сбрасывается при изменении множества.
     """
 
     # Статическая переменная класса
@@ -13,7 +21,8 @@ class CantorSet:
         @brief Инициализирует множество. Если передана строка, парсит ее.
         @param data Строка (тип str) для парсинга или другой CantorSet или iterable.
         """
-        self._elements = []  # Приватное поле
+        self._elements = {}  # Приватное поле: упорядоченный индекс элементов
+        self._hash = None  # Кешированный структурный хеш
         CantorSet._instance_count += 1
 
         if data is None:
@@ -36,83 +45,9 @@ class CantorSet:
             self.add(e)
 
     def _initialize_from_string(self, data_str):
-        """Парсит строковое представление множества."""
-        s = data_str.strip()
-        self._validate_string_format(s)
-        
-        inner = s[1:-1].strip()
-        if inner == "":
-            return
-            
-        self._parse_inner_string(inner)
-
-    def _validate_string_format(self, s):
-        """Проверяет корректность формата строки."""
-        if not s.startswith("{") or not s.endswith("}"):
-            raise ValueError("Неправильный формат множества: {}".format(s))
-
-    def _parse_inner_string(self, inner):
-        """Парсит внутреннее содержимое строкового представления."""
-        i = 0
-        while i < len(inner):
-            i = self._skip_whitespace(inner, i)
-            if i >= len(inner):
-                break
-                
-            if inner[i] == '{':
-                i = self._parse_nested_set(inner, i)
-            else:
-                i = self._parse_atomic_element(inner, i)
-            
-            i = self._skip_separators(inner, i)
-
-    def _skip_whitespace(self, inner, i):
-        """Пропускает пробельные символы."""
-        while i < len(inner) and inner[i].isspace():
-            i += 1
-        return i
-
-    def _skip_separators(self, inner, i):
-        """Пропускает запятые и пробелы."""
-        while i < len(inner) and inner[i] in {',', ' '}:
-            i += 1
-        return i
-
-    def _parse_nested_set(self, inner, i):
-        """Парсит вложенное множество."""
-        start = i
-        i = self._find_matching_brace(inner, i)
-        sub_str = inner[start:i+1]
-        sub_set = CantorSet(sub_str)
-        self.add(sub_set)
-        return i + 1
-
-    def _find_matching_brace(self, inner, i):
-        """Находит закрывающую скобку, соответствующую открывающей."""
-        level = 0
-        while i < len(inner):
-            if inner[i] == '{':
-                level += 1
-            elif inner[i] == '}':
-                level -= 1
-                if level == 0:
-                    break
-            i += 1
-            
-        if level != 0:
-            raise ValueError("Несоответствие скобок в множестве")
-        return i
-
-    def _parse_atomic_element(self, inner, i):
-        """Парсит атомарный элемент (не множество)."""
-        start = i
-        while i < len(inner) and inner[i] not in {',', '}'}:
-            i += 1
-            
-        item = inner[start:i].strip()
-        if item != "":
-            self.add(item)
-        return i
+        """Парсит строковое представление множества (см. CantorSetParser)."""
+        from CantorSetParser import CantorSetParser  # Отложенный импорт: разборщик зависит от CantorSet
+        self._elements = CantorSetParser().parse_elements(data_str)
 
     def _initialize_from_iterable(self, data):
         """Инициализирует множество из iterable объекта."""
@@ -123,7 +58,7 @@ class CantorSet:
     @property
     def elements(self):
         """@brief Получение элементов множества (только чтение)."""
-        return self._elements[:]  # Возвращаем копию для защиты
+        return list(self._elements)  # Возвращаем копию для защиты
 
     @property
     def size(self):
@@ -159,6 +94,37 @@ class CantorSet:
         """
         return CantorSet(elements)
 
+    @staticmethod
+    def from_stream(stream):
+        """
+        @brief Читает множество из текстового потока однопроходным разборщиком.
+        @param stream Объект с методом read(size) (открытый файл, io.StringIO).
+        @return Новое множество.
+        """
+        from CantorSetParser import CantorSetParser  # Отложенный импорт: разборщик зависит от CantorSet
+        return CantorSetParser().parse_stream(stream)
+
+    @staticmethod
+    def from_file(path, encoding="utf-8"):
+        """
+        @brief Читает множество из текстового файла.
+        @param path Путь к файлу.
+        @param encoding Кодировка файла.
+        @return Новое множество.
+        """
+        from CantorSetParser import CantorSetParser  # Отложенный импорт: разборщик зависит от CantorSet
+        return CantorSetParser().parse_file(path, encoding)
+
+    @staticmethod
+    def from_bytes(data):
+        """
+        @brief Декодирует множество из компактного двоичного формата (см. CantorSetCodec).
+        @param data Объект bytes, memoryview или mmap.
+        @return Новое множество.
+        """
+        from CantorSetCodec import CantorSetCodec  # Отложенный импорт: кодек зависит от CantorSet
+        return CantorSetCodec().loads(data)
+
     @classmethod
     def get_instance_count(cls):
         """
@@ -188,12 +154,10 @@ class CantorSet:
         @param element Проверяемый элемент.
         @return True, если элемент принадлежит множеству, иначе False.
         """
-        for e in self._elements:
-            if isinstance(e, CantorSet) and isinstance(element, CantorSet) and e == element:
-                return True
-            if not isinstance(e, CantorSet) and not isinstance(element, CantorSet) and e == element:
-                return True
-        return False
+        try:
+            return element in self._elements
+        except TypeError:  # Нехешируемый объект не может быть элементом
+            return False
 
     def get_cardinality(self):
         """
@@ -213,38 +177,30 @@ class CantorSet:
             self._add_atomic_element(element)
 
     def _add_cantor_set(self, cantor_set):
-        """Добавляет вложенное множество."""
-        for e in self._elements:
-            if isinstance(e, CantorSet) and e == cantor_set:
-                return
-        self._elements.append(CantorSet(cantor_set))
+        """Добавляет вложенное множество (в виде интернированного FrozenCantorSet)."""
+        from FrozenCantorSet import FrozenCantorSet  # Отложенный импорт: модуль-наследник
+        if cantor_set in self._elements:
+            return
+        self._elements[FrozenCantorSet(cantor_set)] = None
+        self._hash = None
 
     def _add_atomic_element(self, element):
         """Добавляет атомарный элемент."""
         item = element.strip()
-        if item == "":
+        if item == "" or item in self._elements:
             return
-            
-        for e in self._elements:
-            if not isinstance(e, CantorSet) and e == item:
-                return
-        self._elements.append(item)
+        self._elements[item] = None
+        self._hash = None
 
     def remove(self, element):
         """
         @brief Удаляет элемент из множества. Если элемента нет, выбрасывает исключение.
         @param element Удаляемый элемент.
         """
-        for i, e in enumerate(self._elements):
-            if isinstance(element, CantorSet) and isinstance(e, CantorSet):
-                if e == element:
-                    del self._elements[i]
-                    return
-            elif not isinstance(element, CantorSet) and not isinstance(e, CantorSet):
-                if e == element:
-                    del self._elements[i]
-                    return
-        raise KeyError("Элемент не найден в множестве: {}".format(element))
+        if not self.contains(element):
+            raise KeyError("Элемент не найден в множестве: {}".format(element))
+        del self._elements[element]
+        self._hash = None
 
     def __getitem__(self, element):
         """
@@ -257,28 +213,31 @@ class CantorSet:
     def __eq__(self, other):
         """
         @brief Проверяет равенство двух множеств (без учёта порядка элементов).
+        @details Сначала сравниваются размеры и структурные хеши, затем каждый
+                 элемент ищется в индексе другого множества.
         """
         if not isinstance(other, CantorSet):
             return False
-        if len(self._elements) != len(other._elements):
+        if self is other:
+            return True
+        if len(self._elements) != len(other._elements) or hash(self) != hash(other):
             return False
-            
+
         return self._check_elements_equality(other)
 
     def _check_elements_equality(self, other):
         """Проверяет, что все элементы текущего множества есть в другом."""
-        for e in self._elements:
-            found = False
-            for oe in other._elements:
-                if isinstance(e, CantorSet) and isinstance(oe, CantorSet) and e == oe:
-                    found = True
-                    break
-                if not isinstance(e, CantorSet) and not isinstance(oe, CantorSet) and e == oe:
-                    found = True
-                    break
-            if not found:
-                return False
-        return True
+        return all(e in other._elements for e in self._elements)
+
+    def __hash__(self):
+        """
+        @brief Структурный хеш, не зависящий от порядка элементов (кешируется).
+        @details Равные множества имеют равные хеши. Хеш пересчитывается после
+                 изменения множества.
+        """
+        if self._hash is None:
+            self._hash = hash(frozenset(self._elements))
+        return self._hash
 
     def __add__(self, other):
         """
@@ -304,21 +263,15 @@ class CantorSet:
         result = CantorSet()
         for e in self._elements:
             if other[e]:
-                if isinstance(e, CantorSet):
-                    result.add(e.clone())
-                else:
-                    result.add(e)
+                result.add(e)
         return result
 
     def __imul__(self, other):
         """
         @brief Пересечение множеств (in-place).
         """
-        to_keep = []
-        for e in self._elements:
-            if other[e]:
-                to_keep.append(e if not isinstance(e, CantorSet) else CantorSet(e))
-        self._elements = to_keep
+        self._elements = {e: None for e in self._elements if other[e]}
+        self._hash = None
         return self
 
     def __sub__(self, other):
@@ -335,45 +288,177 @@ class CantorSet:
         """
         @brief Разность множеств (in-place).
         """
-        self._elements = [e for e in self._elements if not other[e]]
+        self._elements = {e: None for e in self._elements if not other[e]}
+        self._hash = None
         return self
 
+    # Операции над наборами множеств
+    @staticmethod
+    def union_all(sets):
+        """
+        @brief Объединение любого числа множеств за один проход.
+        @details Элементы всех множеств добавляются в один индекс результата,
+                 время пропорционально суммарному размеру входных множеств.
+        @param sets Итерируемый объект множеств CantorSet.
+        @return Новое множество (пустое для пустого набора).
+        """
+        elements = {}
+        for s in sets:
+            elements.update(CantorSet._elements_of(s))
+        result = CantorSet()
+        result._elements = elements
+        return result
+
+    @staticmethod
+    def intersection_all(sets):
+        """
+        @brief Пересечение любого числа множеств.
+        @details Множества перебираются по возрастанию размера: элементы
+                 наименьшего проверяются по индексам остальных, перебор
+                 прекращается, как только пересечение становится пустым.
+        @param sets Итерируемый объект множеств CantorSet.
+        @return Новое множество (элементы в порядке наименьшего из множеств).
+        @throws ValueError для пустого набора множеств.
+        """
+        indexes = sorted((CantorSet._elements_of(s) for s in sets), key=len)
+        if not indexes:
+            raise ValueError("Пересечение пустого набора множеств не определено")
+        elements = dict(indexes[0])
+        for index in indexes[1:]:
+            if not elements:
+                break
+            elements = {e: None for e in elements if e in index}
+        result = CantorSet()
+        result._elements = elements
+        return result
+
+    @staticmethod
+    def _elements_of(s):
+        """Индекс элементов множества (без копирования для CantorSet)."""
+        if not isinstance(s, CantorSet):
+            raise TypeError("Ожидается объект CantorSet: {!r}".format(s))
+        return s._elements
+
+    def is_subset(self, other):
+        """
+        @brief Проверяет, что все элементы множества принадлежат other.
+        @details Сначала сравниваются размеры, затем элементы ищутся в индексе other.
+        """
+        other_elements = CantorSet._elements_of(other)
+        if len(self._elements) > len(other_elements):
+            return False
+        return all(e in other_elements for e in self._elements)
+
+    def is_superset(self, other):
+        """
+        @brief Проверяет, что множество содержит все элементы other.
+        """
+        other_elements = CantorSet._elements_of(other)
+        if len(other_elements) > len(self._elements):
+            return False
+        return all(e in self._elements for e in other_elements)
+
+    def __le__(self, other):
+        if not isinstance(other, CantorSet):
+            return NotImplemented
+        return self.is_subset(other)
+
+    def __ge__(self, other):
+        if not isinstance(other, CantorSet):
+            return NotImplemented
+        return self.is_superset(other)
+
     def bullean(self):
         """
         @brief Строит булеан (множество всех подмножеств данного множества).
+        @details Материализует все 2^n подмножеств - только для небольших n;
+                 для больших множеств используйте ленивый power_set().
         @return Список множеств (CantorSet), представляющих все подмножества текущего.
         """
-        all_subsets = []
-        n = len(self._elements)
-        # Используем itertools.combinations для генерации всех подмножеств
-        for r in range(n+1):
-            for combo in itertools.combinations(range(n), r):
-                subset = CantorSet()
-                for idx in combo:
-                    elem = self._elements[idx]
-                    if isinstance(elem, CantorSet):
-                        subset.add(elem.clone())
-                    else:
-                        subset.add(elem)
-                all_subsets.append(subset)
-        return all_subsets
+        return list(self.power_set().iter_by_size())
+
+    def power_set(self):
+        """
+        @brief Ленивый булеан: подмножества строятся по запросу (см. PowerSet).
+        @return Объект PowerSet.
+        """
+        from PowerSet import PowerSet  # Отложенный импорт: PowerSet зависит от CantorSet
+        return PowerSet(self)
+
+    def product(self, *others):
+        """
+        @brief Ленивое декартово произведение с другими множествами (см. ProductView).
+        @param others Остальные сомножители.
+        @return Объект ProductView; materialize() строит множество пар.
+        """
+        from CantorSetView import ProductView  # Отложенный импорт: представления зависят от CantorSet
+        return ProductView(self, *others)
+
+    def filter(self, predicate):
+        """
+        @brief Ленивое подмножество элементов, удовлетворяющих predicate (см. FilterView).
+        @return Объект FilterView.
+        """
+        from CantorSetView import FilterView  # Отложенный импорт: представления зависят от CantorSet
+        return FilterView(self, predicate)
+
+    def map(self, function):
+        """
+        @brief Ленивый образ множества под действием function (см. MapView).
+        @return Объект MapView.
+        """
+        from CantorSetView import MapView  # Отложенный импорт: представления зависят от CantorSet
+        return MapView(self, function)
 
     def clone(self):
         """
-        @brief Клонирует текущее множество (глубокая копия).
+        @brief Клонирует текущее множество.
+        @details Вложенные множества неизменяемы и общие, поэтому копия верхнего
+                 уровня независима от оригинала, как глубокая копия.
         @return Новый объект CantorSet, эквивалентный текущему.
         """
         return CantorSet(self)
 
-    def __repr__(self):
+    def to_bytes(self):
         """
-        @brief Строковое представление множества.
+        @brief Кодирует множество в компактный двоичный формат (см. CantorSetCodec).
+        @return Объект bytes.
         """
-        elems_str = []
-        for e in self._elements:
-            if isinstance(e, CantorSet):
-                elems_str.append(repr(e))
+        from CantorSetCodec import CantorSetCodec  # Отложенный импорт: кодек зависит от CantorSet
+        return CantorSetCodec().dumps(self)
+
+    def write_text(self, stream):
+        """
+        @brief Записывает строковое представление множества в текстовый поток.
+        @details Обход в глубину с явным стеком итераторов: глубина вложенности
+                 не ограничена стеком вызовов, каждый символ записывается один
+                 раз, промежуточные строки вложенных множеств не создаются.
+        @param stream Объект с методом write(str) (открытый файл, io.StringIO).
+        """
+        write = stream.write
+        write("{")
+        stack = [iter(self._elements)]
+        first = True
+        while stack:
+            for e in stack[-1]:
+                if not first:
+                    write(", ")
+                if isinstance(e, CantorSet):
+                    write("{")
+                    stack.append(iter(e._elements))
+                    first = True
+                    break
+                write(str(e))
+                first = False
             else:
-                elems_str.append(str(e))
-        return "{" + ", ".join(elems_str) + "}"
-    
+                stack.pop()
+                write("}")
+                first = False
+
+    def __repr__(self):
+        """
+        @brief Строковое представление множества (см. write_text).
+        """
+        buffer = io.StringIO()
+        self.write_text(buffer)
+        return buffer.getvalue()
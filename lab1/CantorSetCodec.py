@@ -0,0 +1,258 @@
+import mmap
+import struct
+import sys
+from array import array
+from itertools import accumulate, count, filterfalse
+
+from CantorSet import CantorSet
+from FrozenCantorSet import FrozenCantorSet
+
+
+class CantorSetCodec:
+    """
+    @brief Компактный двоичный формат множеств Кантора.
+    @details Файл состоит из секций, выровненных на 8 байт:
+             - заголовок HEADER: сигнатура, версия, ширина целых (4 или 8 байт),
+               число атомов, число множеств, длина таблицы строк;
+             - таблица строк: смещения атомов (число атомов + 1) и их байты UTF-8;
+             - множества: смещения (число множеств + 1) в массив ссылок и сам
+               массив ссылок на элементы. Ссылка i < числа атомов - атом i,
+               иначе - множество i - (число атомов).
+             Каждое вложенное множество записывается один раз (интернированные
+             FrozenCantorSet совпадают по тождеству) и далее упоминается по
+             номеру; множества идут после своих элементов, последнее - корень.
+             Все целые - little-endian одной ширины, поэтому секции читаются
+             целиком без разбора (в том числе из mmap). Чтение и запись идут
+             секциями по потоку, без рекурсии; атомы и множества при чтении
+             лежат в одной таблице, так что элементы множества - выборка из нее
+             по массиву ссылок.
+    """
+
+    MAGIC = b"CSET"
+    VERSION = 1
+    # Сигнатура, версия, ширина целых, число атомов, число множеств, длина строк
+    HEADER = struct.Struct("<4sHHQQQ")
+    ALIGNMENT = 8
+
+    # Кодирование
+    def dumps(self, cantor_set):
+        """
+        @brief Кодирует множество в байты.
+        @param cantor_set Объект CantorSet.
+        @return Объект bytes.
+        """
+        chunks = []
+        self._write(cantor_set, chunks.append)
+        return b"".join(chunks)
+
+    def dump(self, cantor_set, stream):
+        """
+        @brief Записывает множество в двоичный поток.
+        @param cantor_set Объект CantorSet.
+        @param stream Объект с методом write(bytes) (файл, открытый в режиме "wb").
+        """
+        self._write(cantor_set, stream.write)
+
+    def dump_file(self, cantor_set, path):
+        """
+        @brief Записывает множество в файл.
+        """
+        with open(path, "wb") as stream:
+            self.dump(cantor_set, stream)
+
+    def _write(self, cantor_set, write):
+        if not isinstance(cantor_set, CantorSet):
+            raise TypeError("Кодируется только объект CantorSet")
+        atoms, set_offsets, refs = CantorSetCodec._flatten(cantor_set)
+        blob, atom_offsets = CantorSetCodec._string_table(atoms)
+        largest = max(len(blob), len(refs), len(atoms) + len(set_offsets))
+        typecode = CantorSetCodec._typecode(4 if largest < 1 << 32 else 8)
+
+        header = CantorSetCodec.HEADER.pack(CantorSetCodec.MAGIC, CantorSetCodec.VERSION,
+                                            array(typecode).itemsize, len(atoms), len(set_offsets) - 1, len(blob))
+        written = [0]
+
+        def emit(data):
+            write(data)
+            written[0] += len(data)
+            padding = -written[0] % CantorSetCodec.ALIGNMENT
+            if padding:
+                write(bytes(padding))
+                written[0] += padding
+
+        emit(header)
+        emit(CantorSetCodec._to_bytes(array(typecode, atom_offsets)))
+        emit(blob)
+        emit(CantorSetCodec._to_bytes(array(typecode, set_offsets)))
+        emit(CantorSetCodec._to_bytes(array(typecode, refs)))
+
+    @staticmethod
+    def _flatten(root):
+        """
+        @brief Нумерует атомы и множества обходом в глубину с явным стеком.
+        @return Тройка (атомы, смещения множеств в массиве ссылок, ссылки).
+        """
+        atoms = {}
+        set_ids = {}  # id(множество) -> номер; множества живут, пока жив корень
+        set_offsets = [0]
+        refs = []
+        set_refs = []  # Позиции ссылок на множества: номер атомов к ним прибавляется в конце
+        # Для каждого узла на стеке - итератор по его вложенным множествам
+        stack = [(root, CantorSetCodec._nested(root))]
+        while stack:
+            node, children = stack[-1]
+            for e in children:
+                if id(e) not in set_ids:
+                    stack.append((e, CantorSetCodec._nested(e)))
+                    break
+            else:
+                stack.pop()
+                if not stack and not set_ids and set(map(type, node._elements)) <= {str}:
+                    # Плоское множество: атомы в порядке элементов, ссылки - их номера
+                    return list(node._elements), [0, len(node._elements)], range(len(node._elements))
+                if set(map(type, node._elements)) <= {str}:
+                    # Только атомы: нумерация новых атомов и выборка номеров без цикла Python
+                    unseen = list(filterfalse(atoms.__contains__, node._elements))
+                    atoms.update(zip(unseen, count(len(atoms))))
+                    refs.extend(map(atoms.__getitem__, node._elements))
+                else:
+                    CantorSetCodec._append_refs(node, atoms, set_ids, refs, set_refs)
+                set_ids[id(node)] = len(set_offsets) - 1
+                set_offsets.append(len(refs))
+        for position in set_refs:
+            refs[position] += len(atoms)
+        return list(atoms), set_offsets, refs
+
+    @staticmethod
+    def _nested(node):
+        """Итератор по вложенным множествам узла."""
+        return (e for e in node._elements if isinstance(e, CantorSet))
+
+    @staticmethod
+    def _append_refs(node, atoms, set_ids, refs, set_refs):
+        """Добавляет ссылки на элементы множества со вложенными множествами."""
+        start = len(refs)
+        for i, e in enumerate(node._elements):
+            if isinstance(e, CantorSet):
+                refs.append(set_ids[id(e)])
+                set_refs.append(start + i)
+            else:
+                refs.append(atoms.setdefault(e, len(atoms)))
+
+    @staticmethod
+    def _string_table(atoms):
+        """
+        @brief Байты атомов UTF-8 подряд и смещения начала каждого атома.
+        @details Для ASCII-атомов длины в байтах равны длинам строк, и таблица
+                 кодируется одной операцией.
+        """
+        text = "".join(atoms)
+        if text.isascii():
+            return text.encode("ascii"), [0] + list(accumulate(map(len, atoms)))
+        encoded = [atom.encode("utf-8") for atom in atoms]
+        return b"".join(encoded), [0] + list(accumulate(map(len, encoded)))
+
+    # Декодирование
+    def loads(self, buffer):
+        """
+        @brief Декодирует множество из байтов, memoryview или mmap.
+        @return Новый объект CantorSet.
+        @throws ValueError при неверной сигнатуре, версии или обрезанных данных.
+        """
+        view = memoryview(buffer)
+        position = [0]
+        slices = []
+
+        def read(size):
+            data = view[position[0]:position[0] + size]
+            slices.append(data)
+            position[0] += size
+            return data
+
+        try:
+            return self._read(read)
+        finally:
+            # Освобождаем все представления, в том числе при ошибке: иначе ссылки
+            # из трассировки не дали бы закрыть mmap в load_file (BufferError)
+            for data in slices:
+                data.release()
+            view.release()
+
+    def load(self, stream):
+        """
+        @brief Читает множество из двоичного потока (файл, открытый в режиме "rb").
+        @return Новый объект CantorSet.
+        """
+        return self._read(stream.read)
+
+    def load_file(self, path):
+        """
+        @brief Читает множество из файла через mmap.
+        @return Новый объект CantorSet.
+        """
+        with open(path, "rb") as stream:
+            with mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return self.loads(mapped)
+
+    def _read(self, read):
+        consumed = [0]
+
+        def section(size):
+            data = read(size)
+            if len(data) != size:
+                raise ValueError("Двоичные данные множества обрезаны")
+            padding = -(consumed[0] + size) % CantorSetCodec.ALIGNMENT
+            if padding and len(read(padding)) != padding:
+                raise ValueError("Двоичные данные множества обрезаны")
+            consumed[0] += size + padding
+            return data
+
+        magic, version, width, atom_count, set_count, total = CantorSetCodec.HEADER.unpack(
+            section(CantorSetCodec.HEADER.size))
+        if magic != CantorSetCodec.MAGIC:
+            raise ValueError("Неверная сигнатура двоичного множества")
+        if version != CantorSetCodec.VERSION:
+            raise ValueError("Неподдерживаемая версия формата: {}".format(version))
+        if width not in (4, 8) or set_count == 0:
+            raise ValueError("Поврежденный заголовок двоичного множества")
+        typecode = CantorSetCodec._typecode(width)
+
+        atom_offsets = CantorSetCodec._from_bytes(typecode, section(width * (atom_count + 1)))
+        blob = bytes(section(total))
+        if blob.isascii():
+            text = blob.decode("ascii")
+            table = [text[start:stop] for start, stop in zip(atom_offsets, atom_offsets[1:])]
+        else:
+            table = [blob[start:stop].decode("utf-8") for start, stop in zip(atom_offsets, atom_offsets[1:])]
+        set_offsets = CantorSetCodec._from_bytes(typecode, section(width * (set_count + 1)))
+        refs = CantorSetCodec._from_bytes(typecode, section(width * set_offsets[-1]))
+
+        # Таблица элементов: атомы, затем множества в порядке номеров
+        for j in range(set_count - 1):
+            table.append(FrozenCantorSet._intern(list(map(table.__getitem__, refs[set_offsets[j]:set_offsets[j + 1]]))))
+        result = CantorSet()
+        result._elements = dict.fromkeys(map(table.__getitem__, refs[set_offsets[-2]:set_offsets[-1]]))
+        return result
+
+    # Вспомогательные функции
+    @staticmethod
+    def _typecode(width):
+        """Код типа array для беззнаковых целых заданной ширины."""
+        for code in ("I", "L", "Q"):
+            if array(code).itemsize == width:
+                return code
+        raise ValueError("Нет беззнакового целого типа шириной {} байт".format(width))
+
+    @staticmethod
+    def _to_bytes(values):
+        if sys.byteorder != "little":
+            values.byteswap()
+        return values.tobytes()
+
+    @staticmethod
+    def _from_bytes(typecode, data):
+        values = array(typecode)
+        values.frombytes(data)
+        if sys.byteorder != "little":
+            values.byteswap()
+        return values
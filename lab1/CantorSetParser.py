@@ -0,0 +1,132 @@
+import re
+
+from CantorSet import CantorSet
+from FrozenCantorSet import FrozenCantorSet
+
+
+class CantorSetParser:
+    """
+    @brief Однопроходный потоковый разборщик строкового представления "{a, {b, c}, ...}".
+    @details Текст читается фрагментами и делится регулярным выражением на
+             лексемы "{", "}", "," и текст атома. Открытые множества лежат на
+             явном стеке (без рекурсии и без копирования подстрок), поэтому
+             разбор линеен по длине текста, глубина вложенности не ограничена
+             стеком вызовов, а дополнительная память - стек открытых множеств и
+             текущий атом. Закрытое вложенное множество сразу интернируется как
+             FrozenCantorSet. Текст можно передавать частями (feed/finish), а
+             также читать из файла или текстового потока.
+    """
+
+    # Размер фрагмента при чтении из потока (символов)
+    CHUNK_SIZE = 1 << 16
+
+    _TOKEN = re.compile(r"[{},]|[^{},]+")
+
+    def __init__(self):
+        """
+        @brief Создает разборщик в начальном состоянии.
+        """
+        self._stack = []  # Элементы открытых множеств: {элемент: None}
+        self._atom = []  # Части текущего атома (атом может пересекать границу фрагментов)
+        self._result = None  # Элементы внешнего множества после его закрытия
+
+    def feed(self, chunk):
+        """
+        @brief Обрабатывает очередной фрагмент текста.
+        @param chunk Строка.
+        @throws ValueError при нарушении формата.
+        """
+        stack = self._stack
+        for match in CantorSetParser._TOKEN.finditer(chunk):
+            token = match.group()
+            if token == "{":
+                if self._result is not None or "".join(self._atom).strip():
+                    raise ValueError("Неправильный формат множества: неожиданная '{'")
+                self._atom.clear()
+                stack.append({})
+            elif token == "}":
+                if not stack:
+                    raise ValueError("Неправильный формат множества: лишняя '}'")
+                self._flush_atom()
+                elements = stack.pop()
+                if stack:
+                    stack[-1].setdefault(FrozenCantorSet._intern(elements))
+                else:
+                    self._result = elements
+            elif token == ",":
+                if not stack:
+                    raise ValueError("Неправильный формат множества: ',' вне скобок")
+                self._flush_atom()
+            elif stack:
+                self._atom.append(token)
+            elif not token.isspace():
+                raise ValueError("Неправильный формат множества: {!r} вне скобок".format(token[:40]))
+
+    def _flush_atom(self):
+        """Добавляет накопленный атом (без пробелов по краям) в текущее множество."""
+        if self._atom:
+            item = "".join(self._atom).strip()
+            self._atom.clear()
+            if item:
+                self._stack[-1].setdefault(item)
+
+    def finish(self):
+        """
+        @brief Завершает разбор и возвращает элементы внешнего множества.
+        @return Упорядоченный словарь {элемент: None}.
+        @throws ValueError, если текст пуст или скобки не сбалансированы.
+        """
+        if self._stack:
+            raise ValueError("Несоответствие скобок в множестве")
+        if self._result is None:
+            raise ValueError("Неправильный формат множества: нет открывающей '{'")
+        result = self._result
+        self.__init__()
+        return result
+
+    def parse_elements(self, text):
+        """
+        @brief Разбирает строку целиком.
+        @return Упорядоченный словарь {элемент: None} внешнего множества.
+        """
+        self.feed(text)
+        return self.finish()
+
+    def parse(self, text):
+        """
+        @brief Разбирает строку в CantorSet.
+        @param text Строковое представление множества.
+        @return Новый объект CantorSet.
+        """
+        return CantorSetParser._build(self.parse_elements(text))
+
+    def parse_stream(self, stream, chunk_size=None):
+        """
+        @brief Разбирает множество из текстового потока, читая его фрагментами.
+        @param stream Объект с методом read(size) (открытый файл, io.StringIO).
+        @param chunk_size Размер фрагмента (по умолчанию CHUNK_SIZE).
+        @return Новый объект CantorSet.
+        """
+        size = chunk_size or CantorSetParser.CHUNK_SIZE
+        while True:
+            chunk = stream.read(size)
+            if not chunk:
+                break
+            self.feed(chunk)
+        return CantorSetParser._build(self.finish())
+
+    def parse_file(self, path, encoding="utf-8"):
+        """
+        @brief Разбирает множество из текстового файла.
+        @param path Путь к файлу.
+        @param encoding Кодировка файла.
+        @return Новый объект CantorSet.
+        """
+        with open(path, encoding=encoding) as stream:
+            return self.parse_stream(stream)
+
+    @staticmethod
+    def _build(elements):
+        result = CantorSet()
+        result._elements = elements
+        return result
@@ -0,0 +1,197 @@
+import itertools
+from abc import ABC, abstractmethod
+
+from CantorSet import CantorSet
+from FrozenCantorSet import FrozenCantorSet
+
+
+class CantorSetView(ABC):
+    """
+    @brief Ленивое представление множества, вычисляемое из исходных множеств по запросу.
+    @details Представление не хранит элементов: итерация, len() и проверка
+             принадлежности каждый раз обращаются к исходным множествам (и
+             отражают их текущее состояние). materialize() строит обычный
+             CantorSet одним проходом прямо в его хеш-индекс, без повторных
+             вызовов add. Представления можно сцеплять через filter() и map().
+             Абстрактный класс: подкласс определяет __iter__ и __contains__.
+    """
+
+    @abstractmethod
+    def __iter__(self):
+        """
+        @brief Перебирает элементы представления.
+        """
+
+    def __len__(self):
+        """
+        @brief Число элементов (по умолчанию - подсчетом при итерации).
+        """
+        return sum(1 for _ in self)
+
+    @abstractmethod
+    def __contains__(self, element):
+        """
+        @brief Проверка принадлежности по исходным множествам.
+        """
+
+    def contains(self, element):
+        """
+        @brief Проверка принадлежности (как у CantorSet).
+        """
+        return element in self
+
+    def __getitem__(self, element):
+        return element in self
+
+    def filter(self, predicate):
+        """
+        @brief Ленивое подмножество элементов, удовлетворяющих predicate.
+        @return Объект FilterView.
+        """
+        return FilterView(self, predicate)
+
+    def map(self, function):
+        """
+        @brief Ленивый образ представления под действием function.
+        @return Объект MapView.
+        """
+        return MapView(self, function)
+
+    def _encode(self, element):
+        """Элемент в виде, пригодном для хранения в CantorSet."""
+        return element
+
+    def materialize(self):
+        """
+        @brief Строит CantorSet из элементов представления одним проходом.
+        @details Атомы очищаются от пробелов по краям (пустые пропускаются),
+                 вложенные множества интернируются как FrozenCantorSet.
+        @return Новое множество.
+        @throws TypeError, если элемент не строка и не множество.
+        """
+        elements = dict.fromkeys(map(CantorSetView._normalize, map(self._encode, self)))
+        elements.pop("", None)
+        result = CantorSet()
+        result._elements = elements
+        return result
+
+    @staticmethod
+    def _normalize(element):
+        """Атом без пробелов по краям или интернированное вложенное множество."""
+        if isinstance(element, CantorSet):
+            return FrozenCantorSet(element)
+        if isinstance(element, str):
+            return element.strip()
+        raise TypeError("Элемент множества должен быть строкой или CantorSet: {!r}".format(element))
+
+    @staticmethod
+    def _iterate(source):
+        """Элементы источника: хеш-индекс CantorSet без копирования или само представление."""
+        return iter(source._elements) if isinstance(source, CantorSet) else iter(source)
+
+    @staticmethod
+    def _source_contains(source, element):
+        try:
+            return source.contains(element)
+        except TypeError:
+            return False
+
+    def __repr__(self):
+        return "{}(...)".format(type(self).__name__)
+
+
+class ProductView(CantorSetView):
+    """
+    @brief Ленивое декартово произведение множеств.
+    @details Элементы - кортежи (по одному элементу из каждого множества);
+             мощность - произведение мощностей, принадлежность кортежа
+             проверяется по индексам сомножителей. При материализации кортеж
+             (a, b) кодируется упорядоченной парой Куратовского {{a}, {a, b}},
+             кортежи большей длины - вложенными парами (a, (b, c)).
+    """
+
+    def __init__(self, *sets):
+        """
+        @brief Создает произведение.
+        @param sets Сомножители (CantorSet или представления), не меньше одного.
+        """
+        if not sets:
+            raise ValueError("Произведение требует хотя бы одного множества")
+        self._sets = sets
+
+    def __iter__(self):
+        return itertools.product(*map(CantorSetView._iterate, self._sets))
+
+    def __len__(self):
+        result = 1
+        for s in self._sets:
+            result *= len(s) if isinstance(s, CantorSetView) else s.size
+        return result
+
+    def __contains__(self, element):
+        if not isinstance(element, tuple) or len(element) != len(self._sets):
+            return False
+        return all(CantorSetView._source_contains(s, e) for s, e in zip(self._sets, element))
+
+    def _encode(self, element):
+        return ProductView.pair(element) if len(element) > 1 else element[0]
+
+    @staticmethod
+    def pair(elements):
+        """
+        @brief Кодирует кортеж вложенными парами Куратовского.
+        @param elements Кортеж атомов и множеств длины не меньше 2.
+        @return FrozenCantorSet.
+        """
+        value = CantorSetView._normalize(elements[-1])
+        for first in reversed(elements[:-1]):
+            first = CantorSetView._normalize(first)
+            value = FrozenCantorSet._intern([FrozenCantorSet._intern([first]),
+                                             FrozenCantorSet._intern(dict.fromkeys([first, value]))])
+        return value
+
+
+class FilterView(CantorSetView):
+    """
+    @brief Ленивое подмножество элементов источника, удовлетворяющих предикату.
+    """
+
+    def __init__(self, source, predicate):
+        """
+        @param source CantorSet или представление.
+        @param predicate Функция элемент -> bool.
+        """
+        self._source = source
+        self._predicate = predicate
+
+    def __iter__(self):
+        return filter(self._predicate, CantorSetView._iterate(self._source))
+
+    def __contains__(self, element):
+        return CantorSetView._source_contains(self._source, element) and bool(self._predicate(element))
+
+
+class MapView(CantorSetView):
+    """
+    @brief Ленивый образ источника под действием функции (без повторов).
+    @details Итерация пропускает уже встречавшиеся значения; проверка
+             принадлежности перебирает источник до первого совпадения.
+    """
+
+    def __init__(self, source, function):
+        """
+        @param source CantorSet или представление.
+        @param function Функция элемент -> значение (строка, множество или кортеж).
+        """
+        self._source = source
+        self._function = function
+
+    def __iter__(self):
+        seen = set()
+        for value in map(self._function, CantorSetView._iterate(self._source)):
+            if value not in seen:
+                seen.add(value)
+                yield value
+
+    def __contains__(self, element):
+        return any(value == element for value in map(self._function, CantorSetView._iterate(self._source)))
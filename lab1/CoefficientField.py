@@ -0,0 +1,414 @@
+from abc import ABC, abstractmethod
+from fractions import Fraction
+import numbers
+
+try:
+    import numpy as np
+except ImportError:  # NumPy - необязательная зависимость
+    np = None
+
+from PolynomialMultiplier import PolynomialMultiplier
+from PolynomialDivider import PolynomialDivider
+
+
+class CoefficientField(ABC):
+    """
+    @brief Базовый класс кольца (поля) коэффициентов многочлена.
+    @details Определяет приведение коэффициентов, скалярное деление и ядра
+             умножения и деления с остатком. Подклассы: IntegerRing (Z),
+             RationalField (Q, fractions.Fraction) и PrimeField (GF(p)).
+             Абстрактный класс: подкласс обязан определить convert и div.
+    """
+
+    # Имя поля для строкового представления
+    name = "field"
+
+    def __init__(self):
+        self.multiplier = PolynomialMultiplier()
+        self.divider = PolynomialDivider(self.multiplier)
+
+    @abstractmethod
+    def convert(self, value):
+        """
+        @brief Приводит значение к типу коэффициентов поля.
+        @param value Число.
+        @return Элемент поля.
+        """
+
+    def convert_all(self, values):
+        """
+        @brief Приводит последовательность значений к коэффициентам поля.
+        @return Список элементов поля.
+        """
+        return [self.convert(value) for value in values]
+
+    def reduce_in_place(self, values):
+        """
+        @brief Приводит коэффициенты к полю на месте, если это возможно.
+        @param values Список или массив NumPy коэффициентов.
+        @return Тот же объект (список) или новый массив, если тип элементов меняется.
+        """
+        if np is not None and isinstance(values, np.ndarray):
+            return np.asarray(self.convert_all(values))
+        for i, value in enumerate(values):
+            values[i] = self.convert(value)
+        return values
+
+    @abstractmethod
+    def div(self, x, y):
+        """
+        @brief Точное деление элементов поля.
+        @throws ZeroDivisionError при делении на ноль.
+        """
+
+    @property
+    def bounded(self):
+        """@brief True, если размер коэффициентов ограничен (например, GF(p))."""
+        return False
+
+    @property
+    def prefers_numpy(self):
+        """@brief True, если коэффициенты выгодно хранить в массиве NumPy."""
+        return False
+
+    def multiply(self, a, b):
+        """
+        @brief Произведение многочленов над полем.
+        @param a Коэффициенты первого многочлена.
+        @param b Коэффициенты второго многочлена.
+        @return Коэффициенты произведения.
+        """
+        return self.multiplier.multiply(a, b)
+
+    def divmod(self, a, b):
+        """
+        @brief Деление многочленов с остатком над полем.
+        @return Пара списков (частное, остаток).
+        """
+        return self.divider.divmod(a, b, field=self)
+
+    def evaluate(self, coeffs, x):
+        """
+        @brief Значение многочлена в точке по схеме Горнера.
+        """
+        result = 0
+        for coef in reversed(coeffs):
+            result = result * x + coef
+        return result
+
+    def __eq__(self, other):
+        """
+        @brief Поля равны, если совпадают их тип и параметры.
+        """
+        return type(self) is type(other) and self._key() == other._key()
+
+    def __hash__(self):
+        return hash((type(self).__name__, self._key()))
+
+    def _key(self):
+        """Параметры, определяющие поле."""
+        return ()
+
+    def __repr__(self):
+        return self.name
+
+
+class IntegerRing(CoefficientField):
+    """
+    @brief Кольцо целых чисел Z: коэффициенты - int Python произвольной длины.
+    @details Деление возможно только нацело; при неделящемся частном
+             выбрасывается ValueError (используйте RationalField).
+    """
+
+    name = "ZZ"
+
+    def convert(self, value):
+        """
+        @brief Приводит значение к int без потери точности.
+        @throws ValueError для нецелых значений.
+        """
+        if isinstance(value, numbers.Integral):
+            return int(value)
+        if isinstance(value, (float, Fraction)) and value == int(value):
+            return int(value)
+        raise ValueError("Коэффициент не является целым числом: {}".format(value))
+
+    def div(self, x, y):
+        """
+        @brief Деление нацело в Z.
+        @throws ValueError, если x не делится на y.
+        """
+        if y == 0:
+            raise ZeroDivisionError("Деление на ноль")
+        if x % y != 0:
+            raise ValueError("Деление {} на {} не выполняется в кольце целых чисел".format(x, y))
+        return x // y
+
+
+class RationalField(CoefficientField):
+    """
+    @brief Поле рациональных чисел Q: коэффициенты - fractions.Fraction.
+    """
+
+    name = "QQ"
+
+    def convert(self, value):
+        """
+        @brief Приводит значение к Fraction (float переводится точно).
+        """
+        if type(value) is Fraction:
+            return value
+        return Fraction(value)
+
+    def div(self, x, y):
+        """
+        @brief Точное деление в Q.
+        """
+        if y == 0:
+            raise ZeroDivisionError("Деление на ноль")
+        return Fraction(x) / y
+
+
+class PrimeField(CoefficientField):
+    """
+    @brief Конечное поле GF(p) вычетов по простому модулю p.
+    @details При p < 2^31 и наличии NumPy коэффициенты хранятся в массивах int64,
+             а умножение, деление и вычисление значений выполняются векторными
+             модульными ядрами: все промежуточные произведения меньше p^2 < 2^62.
+             Умножение больших многочленов использует NTT по трем модулям с
+             восстановлением по КТО сразу по модулю p.
+    """
+
+    # Наибольший модуль, для которого применимы ядра int64
+    MAX_VECTORIZED_MODULUS = (1 << 31) - 1
+    # Длина меньшего операнда, начиная с которой NTT быстрее np.convolve
+    NTT_THRESHOLD = 4096
+    # То же, если np.convolve может переполнить int64 (большие p)
+    NTT_THRESHOLD_WIDE = 64
+
+    def __init__(self, p):
+        """
+        @brief Создает поле GF(p).
+        @param p Простое число.
+        @throws ValueError, если p не является простым.
+        """
+        if not isinstance(p, numbers.Integral) or not PrimeField.is_prime(int(p)):
+            raise ValueError("Модуль поля должен быть простым числом: {}".format(p))
+        super().__init__()
+        self.p = int(p)
+        self.name = "GF({})".format(self.p)
+
+    @staticmethod
+    def is_prime(n):
+        """
+        @brief Детерминированный тест Миллера-Рабина (точен для n < 3.3 * 10^24).
+        """
+        if n < 2:
+            return False
+        small = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+        for q in small:
+            if n % q == 0:
+                return n == q
+        d, s = n - 1, 0
+        while d % 2 == 0:
+            d //= 2
+            s += 1
+        for a in small:
+            x = pow(a, d, n)
+            if x in (1, n - 1):
+                continue
+            for _ in range(s - 1):
+                x = x * x % n
+                if x == n - 1:
+                    break
+            else:
+                return False
+        return True
+
+    def _key(self):
+        return (self.p,)
+
+    @property
+    def bounded(self):
+        return True
+
+    @property
+    def prefers_numpy(self):
+        return np is not None and self.p <= PrimeField.MAX_VECTORIZED_MODULUS
+
+    def convert(self, value):
+        """
+        @brief Приводит целое число (или дробь) к вычету по модулю p.
+        @throws ValueError для нецелых float.
+        """
+        if isinstance(value, numbers.Integral):
+            return int(value) % self.p
+        if isinstance(value, Fraction):
+            return value.numerator * pow(value.denominator, -1, self.p) % self.p
+        if isinstance(value, float) and value == int(value):
+            return int(value) % self.p
+        raise ValueError("Коэффициент нельзя привести к GF({}): {}".format(self.p, value))
+
+    def convert_all(self, values):
+        """
+        @brief Приводит коэффициенты к вычетам; целочисленные массивы - одной операцией.
+        @return Массив NumPy int64 (если поле векторизовано), иначе список.
+        """
+        if self.prefers_numpy:
+            if not isinstance(values, np.ndarray) and values and all(type(v) is int for v in values):
+                values = np.array(values, dtype=object if max(map(abs, values)) >> 62 else np.int64)
+            if isinstance(values, np.ndarray) and values.dtype.kind in "iu":
+                return values.astype(np.int64) % self.p
+            if isinstance(values, np.ndarray) and values.dtype == object and \
+                    all(type(v) is int for v in values.tolist()):
+                return (values % self.p).astype(np.int64)
+            return np.array([self.convert(value) for value in values], dtype=np.int64)
+        return [self.convert(value) for value in values]
+
+    def reduce_in_place(self, values):
+        """
+        @brief Приведение по модулю p; массив int64 изменяется без копирования.
+        """
+        if np is not None and isinstance(values, np.ndarray) and values.dtype == np.int64:
+            np.remainder(values, self.p, out=values)
+            return values
+        return super().reduce_in_place(values)
+
+    def div(self, x, y):
+        """
+        @brief Деление в GF(p): умножение на обратный элемент.
+        """
+        y = int(y) % self.p
+        if y == 0:
+            raise ZeroDivisionError("Деление на ноль в GF({})".format(self.p))
+        return int(x) * pow(y, -1, self.p) % self.p
+
+    def _residues(self, values):
+        """Массив вычетов int64 для векторных ядер."""
+        if isinstance(values, np.ndarray) and values.dtype == np.int64:
+            return values % self.p
+        return self.convert_all(values)
+
+    def multiply(self, a, b):
+        """
+        @brief Произведение многочленов над GF(p) векторными модульными ядрами.
+        @details NTT для больших операндов (свертки длиннее NTT_MAX_SIZE
+                 считаются блоками, см. PolynomialMultiplier.convolve_mod_any);
+                 np.convolve, если свертка не переполняет int64; иначе
+                 построчное накопление по модулю.
+        """
+        if not self.prefers_numpy:
+            return [x % self.p for x in self.multiplier.multiply([int(x) for x in a], [int(x) for x in b])]
+        a = self._residues(a)
+        b = self._residues(b)
+        if len(a) == 0 or len(b) == 0:
+            return np.zeros(0, dtype=np.int64)
+        if len(a) < len(b):
+            a, b = b, a
+        fits = len(b) * (self.p - 1) ** 2 < 1 << 63
+        if len(b) >= (PrimeField.NTT_THRESHOLD if fits else PrimeField.NTT_THRESHOLD_WIDE):
+            result = self.multiplier.convolve_mod_any(a, b, self.p)
+            if result is not None:
+                return result
+        if fits:
+            return np.convolve(a, b) % self.p
+        result = np.zeros(len(a) + len(b) - 1, dtype=np.int64)
+        for i, coef in enumerate(b.tolist()):
+            if coef:
+                segment = result[i:i + len(a)]
+                segment += a * coef % self.p
+                segment %= self.p
+        return result
+
+    def divmod(self, a, b):
+        """
+        @brief Деление с остатком над GF(p).
+        @details Для малых степеней - деление столбиком, где каждый шаг - одна
+                 векторная операция над строкой делителя; для больших - обращение
+                 ряда Ньютоном поверх модульного умножения.
+        """
+        if not self.prefers_numpy:
+            return self.divider.divmod(a, b, field=self)
+        a = self._residues(a)
+        b = self._residues(b)
+        nonzero = np.flatnonzero(b)
+        if nonzero.size == 0:
+            raise ZeroDivisionError("Деление на нулевой многочлен")
+        b = b[:nonzero[-1] + 1]
+        m = len(b) - 1
+        n = len(a) - 1
+        if n < m:
+            return PrimeField._trim([0]), PrimeField._trim(a.tolist())
+        if min(m, n - m + 1) >= PolynomialDivider.NEWTON_THRESHOLD:
+            quotient = self._divide_newton(a, b)
+            product = self.multiply(b, quotient)
+            remainder = (a[:m] - product[:m]) % self.p
+            return PrimeField._trim(quotient.tolist()), PrimeField._trim(remainder.tolist())
+
+        inverse = pow(int(b[m]), -1, self.p)
+        remainder = a.copy()
+        quotient = np.zeros(n - m + 1, dtype=np.int64)
+        divisor = b[:m]
+        for shift in range(n - m, -1, -1):
+            coef = int(remainder[m + shift]) * inverse % self.p
+            quotient[shift] = coef
+            if coef and m:
+                segment = remainder[shift:shift + m]
+                segment -= divisor * coef % self.p
+                segment %= self.p
+        return PrimeField._trim(quotient.tolist()), PrimeField._trim(remainder[:m].tolist())
+
+    def _inverse_series(self, f, precision):
+        """Обращение ряда Ньютоном над массивами вычетов: g = g - g * (f * g - 1)."""
+        g = np.array([pow(int(f[0]), -1, self.p)], dtype=np.int64)
+        length = 1
+        while length < precision:
+            length = min(2 * length, precision)
+            error = self.multiply(f[:length], g)[:length]
+            error[0] -= 1
+            correction = self.multiply(g, error)[:length]
+            g = np.concatenate((g, np.zeros(length - len(g), dtype=np.int64)))
+            g[:len(correction)] -= correction
+            g %= self.p
+        return g[:precision]
+
+    def _divide_newton(self, a, b):
+        """Частное rev(q) = rev(a) * rev(b)^(-1) mod x^(n-m+1) без списков Python."""
+        size = len(a) - len(b) + 1
+        inverse = self._inverse_series(b[::-1].copy(), size)
+        reversed_q = self.multiply(a[::-1][:size].copy(), inverse)[:size]
+        quotient = np.zeros(size, dtype=np.int64)
+        quotient[:len(reversed_q)] = reversed_q
+        return quotient[::-1].copy()
+
+    @staticmethod
+    def _trim(coeffs):
+        """Удаляет ведущие нули (оставляя хотя бы один коэффициент)."""
+        while len(coeffs) > 1 and coeffs[-1] == 0:
+            coeffs.pop()
+        return coeffs or [0]
+
+    def evaluate(self, coeffs, x):
+        """
+        @brief Схема Горнера с приведением по модулю на каждом шаге.
+        """
+        x = self.convert(x)
+        result = 0
+        for coef in reversed(coeffs):
+            result = (result * x + int(coef)) % self.p
+        return result
+
+    def evaluate_array(self, coeffs, points):
+        """
+        @brief Векторная схема Горнера по модулю p над массивом точек.
+        @param coeffs Коэффициенты многочлена.
+        @param points Массив целых точек.
+        @return Массив вычетов int64.
+        """
+        points = np.asarray(points).astype(np.int64) % self.p
+        result = np.zeros(points.shape, dtype=np.int64)
+        for coef in self._residues(coeffs)[::-1].tolist():
+            result *= points
+            result += coef
+            result %= self.p
+        return result
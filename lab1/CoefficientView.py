@@ -0,0 +1,56 @@
+from collections.abc import Sequence
+
+
+class CoefficientView(Sequence):
+    """
+    @brief Представление коэффициентов многочлена только для чтения, без копирования.
+    @details Оборачивает внутренний список коэффициентов (или словарь членов
+             разреженного многочлена) и не допускает записи. Представление
+             отражает состояние многочлена на момент создания и остается
+             действительным, пока многочлен не изменен операцией на месте
+             (как представления массивов NumPy).
+    """
+
+    __slots__ = ("_values", "_length")
+
+    def __init__(self, values, length=None):
+        """
+        @brief Создает представление.
+        @param values Список коэффициентов или словарь {степень: коэффициент}.
+        @param length Число коэффициентов (обязательно для словаря).
+        """
+        self._values = values
+        self._length = len(values) if length is None else length
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        """
+        @brief Коэффициент при x^index (поддерживаются отрицательные индексы).
+        @return Коэффициент или список коэффициентов для среза.
+        """
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("Индекс коэффициента вне диапазона")
+        if isinstance(self._values, dict):
+            return self._values.get(index, 0)
+        return self._values[index]
+
+    def __iter__(self):
+        if isinstance(self._values, dict):
+            return (self._values.get(i, 0) for i in range(self._length))
+        return iter(self._values)
+
+    def __eq__(self, other):
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "CoefficientView({})".format(list(self))
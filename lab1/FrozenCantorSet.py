@@ -0,0 +1,122 @@
+import weakref
+
+from CantorSet import CantorSet
+
+
+class FrozenCantorSet(CantorSet):
+    """
+    @brief Неизменяемое множество Кантора, интернируемое по структуре.
+    @details Все структурно равные неизменяемые множества - один и тот же объект:
+             таблица интернирования (слабые ссылки, ключ - frozenset элементов,
+             вложенные множества в котором уже интернированы) возвращает
+             существующий экземпляр вместо создания копии. Поэтому равенство двух
+             FrozenCantorSet - проверка тождества, а повторяющиеся вложенные
+             подмножества хранятся в памяти один раз. CantorSet хранит вложенные
+             множества именно в таком виде. Операции, изменяющие множество,
+             запрещены; +=, *= и -= связывают имя с новым объектом, как у frozenset.
+    """
+
+    # Таблица интернирования: {frozenset элементов: экземпляр}
+    _interned = weakref.WeakValueDictionary()
+
+    def __new__(cls, data=None):
+        """
+        @brief Возвращает интернированное множество с элементами data.
+        @param data Строка, CantorSet, FrozenCantorSet или iterable (как у CantorSet).
+        """
+        if isinstance(data, FrozenCantorSet):
+            return data
+        if isinstance(data, CantorSet):
+            elements = data._elements
+        else:
+            elements = CantorSet(data)._elements if data is not None else {}
+        return cls._intern(elements)
+
+    def __init__(self, data=None):
+        """
+        @brief Объект полностью создается в __new__ (повторный вызов ничего не меняет).
+        """
+
+    @classmethod
+    def _intern(cls, elements):
+        """
+        @brief Находит или создает экземпляр для упорядоченного набора элементов.
+        @param elements Итерируемый объект атомов и интернированных множеств.
+        """
+        key = frozenset(elements)
+        instance = cls._interned.get(key)
+        if instance is None:
+            instance = object.__new__(cls)
+            instance._elements = dict.fromkeys(elements)
+            instance._hash = hash(key)  # Совпадает со структурным хешем CantorSet
+            cls._interned[key] = instance
+            CantorSet._instance_count += 1
+        return instance
+
+    @classmethod
+    def interned_count(cls):
+        """
+        @brief Количество живых интернированных множеств.
+        """
+        return len(cls._interned)
+
+    def thaw(self):
+        """
+        @brief Создает изменяемую копию верхнего уровня (вложенные множества общие).
+        @return Объект CantorSet.
+        """
+        return CantorSet(self)
+
+    def clone(self):
+        """
+        @brief Неизменяемое множество не требует копирования.
+        @return Этот же объект.
+        """
+        return self
+
+    def __copy__(self):
+        """
+        @brief Неизменяемое множество копируется как есть.
+        """
+        return self
+
+    def __deepcopy__(self, memo):
+        """
+        @brief Вложенные множества тоже неизменяемы, поэтому и глубокая копия - сам объект.
+        """
+        return self
+
+    def __reduce__(self):
+        """
+        @brief Восстановление (pickle) проходит через таблицу интернирования.
+        @details Стандартный протокол вызвал бы __new__ без данных, получил бы общее
+                 пустое множество и записал бы в него чужие элементы.
+        """
+        return FrozenCantorSet, (tuple(self._elements),)
+
+    def __eq__(self, other):
+        """
+        @brief Для двух интернированных множеств равенство - тождество объектов.
+        """
+        if isinstance(other, FrozenCantorSet):
+            return self is other
+        return CantorSet.__eq__(self, other)
+
+    def __hash__(self):
+        return self._hash
+
+    # Изменяющие операции запрещены
+    def add(self, element):
+        raise TypeError("FrozenCantorSet не поддерживает изменение")
+
+    def remove(self, element):
+        raise TypeError("FrozenCantorSet не поддерживает изменение")
+
+    def __iadd__(self, other):
+        return FrozenCantorSet(self + other)
+
+    def __imul__(self, other):
+        return FrozenCantorSet(self * other)
+
+    def __isub__(self, other):
+        return FrozenCantorSet(self - other)
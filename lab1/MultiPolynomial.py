@@ -0,0 +1,557 @@
+import heapq
+import numbers
+
+try:
+    import numpy as np
+except ImportError:  # NumPy - необязательная зависимость
+    np = None
+
+from Polynomial import Polynomial
+from PolynomialMultiplier import PolynomialMultiplier
+
+
+class MultiPolynomial:
+    """
+    @brief Разреженный многочлен от нескольких переменных x0, x1, ..., x(n-1).
+    @details Хранит словарь {кортеж показателей: коэффициент} только для ненулевых
+             членов. Для умножения показатели упаковываются в одно целое число
+             (по полю бит на переменную, x0 - старшее), так что сложение
+             показателей и сравнение мономов в лексикографическом порядке - одна
+             операция над int. Алгоритмы умножения:
+             - "heap" - слияние потоков f_i * g куче Джонсона: члены результата
+               выходят уже упорядоченными, в куче не более min(|f|, |g|) элементов;
+             - "dict" - накопление произведений в словаре;
+             - "numpy" - то же слияние потоков векторно: блоки потоков по
+               VECTOR_BLOCK произведений сортируются по моному и сворачиваются
+               np.add.reduceat (только для машинных чисел, если мономы
+               помещаются в int64, а целые коэффициенты не переполняются);
+             - "kronecker" - подстановка Кронекера в одномерный многочлен и
+               быстрое умножение общим движком Polynomial.get_multiplier()
+               (для плотных произведений).
+             В режиме "auto" алгоритм выбирается по плотности произведения -
+             отношению длины L одномерного образа к числу |f| * |g| попарных
+             произведений членов:
+             - L <= KRONECKER_DENSITY * |f| * |g| (и L <= KRONECKER_MAX_LENGTH) -
+               "kronecker";
+             - L > SPARSE_DENSITY * |f| * |g| (произведения почти не совпадают
+               по мономам) - "heap": в памяти только куча из min(|f|, |g|) потоков;
+             - иначе - "numpy", если он применим (много совпадающих мономов
+               сворачиваются векторно), или "heap".
+    """
+
+    METHODS = ("auto", "heap", "dict", "numpy", "kronecker")
+
+    # Допустимая разреженность одномерного образа для подстановки Кронекера
+    KRONECKER_DENSITY = 4
+    # Разреженность образа, начиная с которой режим "auto" выбирает "heap"
+    SPARSE_DENSITY = 64
+    # Наибольшая длина одномерного образа в режиме "auto"
+    KRONECKER_MAX_LENGTH = 1 << 20
+    # Число попарных произведений членов в одном блоке метода "numpy"
+    VECTOR_BLOCK = 1 << 22
+    # Наибольшее число точек * членов, обрабатываемое одним блоком NumPy
+    EVALUATE_BLOCK = 1 << 20
+
+    def __init__(self, terms=None, nvars=None):
+        """
+        @brief Инициализирует многочлен.
+        @param terms Словарь {кортеж показателей: коэффициент} или итерируемый объект
+               пар. Нулевые коэффициенты отбрасываются, одинаковые мономы суммируются.
+        @param nvars Число переменных (обязательно, если terms пуст).
+        @throws ValueError при показателях разной длины или отрицательных показателях.
+        """
+        items = terms.items() if isinstance(terms, dict) else (terms or ())
+        merged = {}
+        for exps, coef in items:
+            exps = tuple(exps)
+            if nvars is None:
+                nvars = len(exps)
+            if len(exps) != nvars:
+                raise ValueError("Мономы должны содержать {} показателей: {}".format(nvars, exps))
+            if not all(isinstance(e, numbers.Integral) and e >= 0 for e in exps):
+                raise ValueError("Показатели должны быть неотрицательными целыми числами: {}".format(exps))
+            merged[exps] = merged.get(exps, 0) + coef
+        if nvars is None:
+            raise ValueError("Для нулевого многочлена необходимо указать число переменных")
+        self._terms = {exps: coef for exps, coef in sorted(merged.items()) if coef != 0}
+        self._nvars = nvars
+
+    @staticmethod
+    def _from_terms(terms, nvars):
+        """Создает многочлен из проверенного словаря без нулевых членов."""
+        result = MultiPolynomial.__new__(MultiPolynomial)
+        result._terms = terms
+        result._nvars = nvars
+        return result
+
+    @staticmethod
+    def variable(index, nvars):
+        """
+        @brief Создает многочлен x_index от nvars переменных.
+        """
+        if not 0 <= index < nvars:
+            raise ValueError("Номер переменной вне диапазона: {}".format(index))
+        exps = [0] * nvars
+        exps[index] = 1
+        return MultiPolynomial({tuple(exps): 1})
+
+    @staticmethod
+    def constant(value, nvars):
+        """
+        @brief Создает константный многочлен от nvars переменных.
+        """
+        return MultiPolynomial({(0,) * nvars: value}, nvars=nvars)
+
+    @staticmethod
+    def from_polynomial(polynomial, nvars=1, index=0):
+        """
+        @brief Переводит одномерный Polynomial в многочлен от переменной x_index.
+        @param polynomial Объект Polynomial (плотный или разреженный).
+        @param nvars Общее число переменных.
+        @param index Номер переменной.
+        """
+        terms = {}
+        for exp, coef in polynomial._nonzero_terms():
+            exps = [0] * nvars
+            exps[index] = exp
+            terms[tuple(exps)] = coef
+        return MultiPolynomial(terms, nvars=nvars)
+
+    # Управление доступом - свойства только для чтения
+    @property
+    def terms(self):
+        """@brief Копия словаря ненулевых членов."""
+        return dict(self._terms)
+
+    @property
+    def nvars(self):
+        """@brief Число переменных."""
+        return self._nvars
+
+    @property
+    def degree(self):
+        """@brief Полная степень (0 для нулевого многочлена)."""
+        return max((sum(exps) for exps in self._terms), default=0)
+
+    def degrees(self):
+        """
+        @brief Степени по каждой переменной.
+        @return Кортеж наибольших показателей.
+        """
+        result = [0] * self._nvars
+        for exps in self._terms:
+            result = [max(r, e) for r, e in zip(result, exps)]
+        return tuple(result)
+
+    def used_variables(self):
+        """
+        @brief Номера переменных, входящих хотя бы в один член.
+        """
+        return tuple(v for v, d in enumerate(self.degrees()) if d > 0)
+
+    def __len__(self):
+        return len(self._terms)
+
+    def to_polynomial(self):
+        """
+        @brief Переводит многочлен от одной (фактически) переменной в Polynomial.
+        @return Polynomial (или SparsePolynomial для высоких разреженных степеней).
+        @throws ValueError, если используется больше одной переменной.
+        """
+        used = self.used_variables()
+        if len(used) > 1:
+            raise ValueError("Многочлен зависит от нескольких переменных: {}".format(used))
+        index = used[0] if used else 0
+        return Polynomial.from_terms({exps[index]: coef for exps, coef in self._terms.items()})
+
+    # Вычисление значений
+    def evaluate(self, point):
+        """
+        @brief Значение многочлена в точке.
+        @param point Последовательность из nvars значений.
+        """
+        if len(point) != self._nvars:
+            raise ValueError("Точка должна содержать {} координат".format(self._nvars))
+        powers = [{} for _ in range(self._nvars)]
+        result = 0
+        for exps, coef in self._terms.items():
+            term = coef
+            for v, e in enumerate(exps):
+                if e:
+                    cache = powers[v]
+                    if e not in cache:
+                        cache[e] = point[v] ** e
+                    term = term * cache[e]
+            result = result + term
+        return result
+
+    def evaluate_many(self, points):
+        """
+        @brief Значения многочлена в наборе точек.
+        @details Для массива NumPy (или вещественных точек) степени всех
+                 переменных вычисляются векторно, а сумма членов - одним
+                 матричным умножением на вектор коэффициентов, блоками по
+                 EVALUATE_BLOCK элементов. Целые точки-списки вычисляются точно.
+        @param points Двумерный массив формы (m, nvars) или список точек.
+        @return Массив NumPy для входного массива, иначе список значений.
+        """
+        is_array = np is not None and isinstance(points, np.ndarray)
+        if np is not None and self._terms and len(points) > 0:
+            matrix = points if is_array else np.asarray(points)
+            if matrix.ndim != 2 or matrix.shape[1] != self._nvars:
+                raise ValueError("Точки должны образовывать матрицу (m, {})".format(self._nvars))
+            coeffs = np.asarray(list(self._terms.values()))
+            if is_array or np.result_type(matrix, coeffs).kind in "fc":
+                values = self._evaluate_matrix(matrix, coeffs)
+                return values if is_array else values.tolist()
+        values = [self.evaluate(point) for point in points]
+        return np.array(values) if is_array else values
+
+    def _evaluate_matrix(self, matrix, coeffs):
+        """Векторное вычисление: значения = (prod_v x_v ^ E[:, v]) @ coeffs."""
+        exponents = np.array(list(self._terms), dtype=np.int64)
+        dtype = np.result_type(matrix, coeffs)
+        block = max(1, MultiPolynomial.EVALUATE_BLOCK // len(coeffs))
+        result = np.empty(matrix.shape[0], dtype=dtype)
+        for start in range(0, matrix.shape[0], block):
+            chunk = matrix[start:start + block].astype(dtype, copy=False)
+            monomials = np.ones((chunk.shape[0], len(coeffs)), dtype=dtype)
+            for v in range(self._nvars):
+                column = exponents[:, v]
+                if column.any():
+                    monomials *= chunk[:, v, np.newaxis] ** column
+            result[start:start + block] = monomials @ coeffs.astype(dtype, copy=False)
+        return result
+
+    def __call__(self, *point):
+        """
+        @brief p(x0, x1, ...) - значение в точке.
+        """
+        return self.evaluate(point)
+
+    # Арифметика
+    def _check(self, other):
+        if other._nvars != self._nvars:
+            raise ValueError("Многочлены от разного числа переменных: {} и {}".format(self._nvars, other._nvars))
+
+    def _coerce(self, other):
+        """Приводит скаляр или Polynomial к MultiPolynomial (или возвращает None)."""
+        if isinstance(other, MultiPolynomial):
+            self._check(other)
+            return other
+        if isinstance(other, Polynomial):
+            return MultiPolynomial.from_polynomial(other, self._nvars)
+        if isinstance(other, numbers.Number):
+            return MultiPolynomial.constant(other, self._nvars)
+        return None
+
+    def _combine(self, other, sign):
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        terms = dict(self._terms)
+        for exps, coef in other._terms.items():
+            terms[exps] = terms.get(exps, 0) + sign * coef
+        return MultiPolynomial._from_terms({e: c for e, c in sorted(terms.items()) if c != 0}, self._nvars)
+
+    def __add__(self, other):
+        """
+        @brief Сложение с многочленом или скаляром (возвращает новый).
+        """
+        return self._combine(other, 1)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        """
+        @brief Вычитание многочлена или скаляра (возвращает новый).
+        """
+        return self._combine(other, -1)
+
+    def __rsub__(self, other):
+        return -self + other
+
+    def __neg__(self):
+        return MultiPolynomial._from_terms({e: -c for e, c in self._terms.items()}, self._nvars)
+
+    def __mul__(self, other):
+        """
+        @brief Умножение на многочлен или скаляр (возвращает новый).
+        """
+        if isinstance(other, numbers.Number):
+            if other == 0:
+                return MultiPolynomial({}, nvars=self._nvars)
+            return MultiPolynomial._from_terms({e: c * other for e, c in self._terms.items()}, self._nvars)
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        return self.multiply(other)
+
+    __rmul__ = __mul__
+
+    def __pow__(self, exponent):
+        """
+        @brief Возведение в целую неотрицательную степень (бинарный метод).
+        """
+        if not isinstance(exponent, numbers.Integral):
+            return NotImplemented
+        if exponent < 0:
+            raise ValueError("Показатель степени должен быть неотрицательным: {}".format(exponent))
+        result = MultiPolynomial.constant(1, self._nvars)
+        base = self
+        while exponent:
+            if exponent & 1:
+                result = result.multiply(base)
+            exponent >>= 1
+            if exponent:
+                base = base.multiply(base)
+        return result
+
+    def multiply(self, other, method="auto"):
+        """
+        @brief Произведение многочленов выбранным алгоритмом.
+        @param other MultiPolynomial от того же числа переменных.
+        @param method "auto", "heap", "dict", "numpy" или "kronecker".
+        @return Новый многочлен.
+        @throws ValueError, если метод "numpy" неприменим к коэффициентам.
+        """
+        if method not in MultiPolynomial.METHODS:
+            raise ValueError("Неизвестный алгоритм умножения: {}".format(method))
+        self._check(other)
+        if not self._terms or not other._terms:
+            return MultiPolynomial({}, nvars=self._nvars)
+        bounds = [a + b for a, b in zip(self.degrees(), other.degrees())]
+        # Поле бит на переменную вмещает показатели произведения
+        bits = max(max(bounds).bit_length(), 1)
+        if method == "auto":
+            method = self._auto_method(other, bounds)
+        if method == "numpy":
+            dtype = self._vector_dtype(other, bits)
+            if dtype is None:
+                raise ValueError("Алгоритм 'numpy' неприменим к данным коэффициентам и степеням")
+        if method == "kronecker":
+            return self._multiply_kronecker(other, bounds)
+        left = self._packed(bits)
+        right = other._packed(bits)
+        if method == "numpy":
+            keys, coeffs = MultiPolynomial._vector_product(left, right, dtype)
+            shifts = bits * np.arange(self._nvars - 1, -1, -1, dtype=np.int64)
+            exponents = (keys[:, np.newaxis] >> shifts) & ((1 << bits) - 1)
+            return MultiPolynomial._from_terms(dict(zip(map(tuple, exponents.tolist()), coeffs)), self._nvars)
+        if method == "heap":
+            packed = MultiPolynomial._heap_product(left, right)
+        else:
+            packed = MultiPolynomial._dict_product(left, right)
+        return MultiPolynomial._from_terms(self._unpack(packed, bits), self._nvars)
+
+    def _auto_method(self, other, bounds):
+        """Алгоритм режима "auto" по плотности произведения (см. описание класса)."""
+        products = len(self._terms) * len(other._terms)
+        dense_length = 1
+        for bound in bounds:
+            dense_length *= bound + 1
+        if dense_length <= min(MultiPolynomial.KRONECKER_DENSITY * products, MultiPolynomial.KRONECKER_MAX_LENGTH):
+            return "kronecker"
+        if dense_length > MultiPolynomial.SPARSE_DENSITY * products:
+            return "heap"
+        bits = max(max(bounds).bit_length(), 1)
+        return "numpy" if self._vector_dtype(other, bits) is not None else "heap"
+
+    def _vector_dtype(self, other, bits):
+        """
+        @brief Тип NumPy для метода "numpy" или None, если метод неприменим.
+        @details Требуются упакованные мономы не длиннее 63 бит и коэффициенты
+                 int/float/complex; для целых сумма произведений по модулю не
+                 должна превышать 2^63.
+        """
+        if np is None or bits * self._nvars > 63:
+            return None
+        kinds = set()
+        for coeffs in (self._terms.values(), other._terms.values()):
+            for coef in coeffs:
+                if isinstance(coef, (bool, int)):
+                    kinds.add("int")
+                elif isinstance(coef, float):
+                    kinds.add("float")
+                elif isinstance(coef, complex):
+                    kinds.add("complex")
+                else:
+                    return None
+        if "complex" in kinds:
+            return np.complex128
+        if "float" in kinds:
+            return np.float64
+        bound = max(abs(c) for c in self._terms.values()) * max(abs(c) for c in other._terms.values())
+        if bound * min(len(self._terms), len(other._terms)) >= 1 << 63:
+            return None
+        return np.int64
+
+    def _packed(self, bits):
+        """Члены в виде пар (упакованный моном, коэффициент) по возрастанию монома."""
+        result = []
+        for exps, coef in self._terms.items():
+            key = 0
+            for e in exps:
+                key = (key << bits) | e
+            result.append((key, coef))
+        return result
+
+    def _unpack(self, packed, bits):
+        """Словарь {кортеж показателей: коэффициент} из упакованных пар."""
+        mask = (1 << bits) - 1
+        terms = {}
+        for key, coef in packed:
+            exps = [0] * self._nvars
+            for v in range(self._nvars - 1, -1, -1):
+                exps[v] = key & mask
+                key >>= bits
+            terms[tuple(exps)] = coef
+        return terms
+
+    @staticmethod
+    def _heap_product(left, right):
+        """
+        @brief Умножение слиянием потоков кучей (алгоритм Джонсона).
+        @details Поток i - члены left[i] * right[j], j = 0, 1, ...; в куче лежит
+                 текущая голова каждого потока. Элемент кучи - одно целое число
+                 (моном << bits) | i, поэтому сравнения в куче - сравнения int, а
+                 не кортежей; позиции j потоков хранятся в отдельном списке.
+                 Произведения с одинаковым мономом выходят подряд и сразу
+                 складываются.
+        @return Список пар (моном, коэффициент) по возрастанию монома.
+        """
+        if len(left) > len(right):
+            left, right = right, left
+        left_keys = [key for key, _ in left]
+        left_coeffs = [coef for _, coef in left]
+        right_keys = [key for key, _ in right]
+        right_coeffs = [coef for _, coef in right]
+        shift = max(len(left) - 1, 1).bit_length()
+        mask = (1 << shift) - 1
+        size = len(right)
+        positions = [0] * len(left)
+        heap = [((key + right_keys[0]) << shift) | i for i, key in enumerate(left_keys)]
+        heapq.heapify(heap)
+        heappop, heapreplace = heapq.heappop, heapq.heapreplace
+        result = []
+        append = result.append
+        while heap:
+            key = heap[0] >> shift
+            coef = 0
+            while heap and heap[0] >> shift == key:
+                i = heap[0] & mask
+                j = positions[i]
+                coef += left_coeffs[i] * right_coeffs[j]
+                j += 1
+                if j < size:
+                    positions[i] = j
+                    heapreplace(heap, ((left_keys[i] + right_keys[j]) << shift) | i)
+                else:
+                    heappop(heap)
+            if coef != 0:
+                append((key, coef))
+        return result
+
+    @staticmethod
+    def _vector_product(left, right, dtype):
+        """
+        @brief Векторное слияние потоков left[i] * right блоками строк.
+        @details Каждый блок потоков сортируется по моному вместе с уже
+                 накопленным результатом, одинаковые мономы сворачиваются
+                 np.add.reduceat. Накопленный результат не длиннее итогового.
+        @return Массив мономов по возрастанию и список их коэффициентов.
+        """
+        left_keys = np.array([key for key, _ in left], dtype=np.int64)
+        left_coeffs = np.array([coef for _, coef in left], dtype=dtype)
+        right_keys = np.array([key for key, _ in right], dtype=np.int64)
+        right_coeffs = np.array([coef for _, coef in right], dtype=dtype)
+        keys = np.empty(0, dtype=np.int64)
+        coeffs = np.empty(0, dtype=dtype)
+        block = max(1, MultiPolynomial.VECTOR_BLOCK // len(right))
+        for start in range(0, len(left), block):
+            stop = start + block
+            keys = np.concatenate((keys, (left_keys[start:stop, np.newaxis] + right_keys).ravel()))
+            coeffs = np.concatenate((coeffs, (left_coeffs[start:stop, np.newaxis] * right_coeffs).ravel()))
+            order = np.argsort(keys, kind="stable")
+            keys = keys[order]
+            starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+            keys = keys[starts]
+            coeffs = np.add.reduceat(coeffs[order], starts)
+        nonzero = coeffs != 0
+        return keys[nonzero], coeffs[nonzero].tolist()
+
+    @staticmethod
+    def _dict_product(left, right):
+        """Умножение накоплением в словаре; результат упорядочен по моному."""
+        terms = {}
+        for key_a, coef_a in left:
+            for key_b, coef_b in right:
+                key = key_a + key_b
+                terms[key] = terms.get(key, 0) + coef_a * coef_b
+        return [(key, coef) for key, coef in sorted(terms.items()) if coef != 0]
+
+    def _multiply_kronecker(self, other, bounds):
+        """
+        @brief Подстановка Кронекера x_v -> x^(s_v), s_v = prod_{u > v}(bounds_u + 1).
+        @details Произведение одномерных образов однозначно раскладывается обратно,
+                 так как показатели результата не превосходят bounds. Для
+                 float/complex коэффициентов сохраняются только мономы, в которые
+                 попадает хотя бы одно произведение членов (как у "dict" и "heap").
+        """
+        strides = [1] * self._nvars
+        for v in range(self._nvars - 2, -1, -1):
+            strides[v] = strides[v + 1] * (bounds[v + 1] + 1)
+        length = strides[0] * (bounds[0] + 1)
+
+        def image(terms):
+            top = max(sum(e * s for e, s in zip(exps, strides)) for exps in terms)
+            coeffs = [0] * (top + 1)
+            for exps, coef in terms.items():
+                coeffs[sum(e * s for e, s in zip(exps, strides))] = coef
+            return coeffs
+
+        left, right = image(self._terms), image(other._terms)
+        engine = Polynomial.get_multiplier()
+        product = engine.multiply(left, right)
+        support = None
+        if PolynomialMultiplier.coefficient_kind(left, right) in ("float", "complex"):
+            # БПФ оставляет шум округления там, где нет ни одного произведения;
+            # точная целочисленная свертка носителей отмечает настоящие мономы
+            support = engine.multiply([1 if c != 0 else 0 for c in left], [1 if c != 0 else 0 for c in right])
+        terms = {}
+        for index, coef in enumerate(product[:length]):
+            if coef != 0 and (support is None or support[index]):
+                exps = []
+                for stride in strides:
+                    exps.append(index // stride)
+                    index %= stride
+                terms[tuple(exps)] = coef.item() if hasattr(coef, "item") else coef
+        return MultiPolynomial._from_terms(dict(sorted(terms.items())), self._nvars)
+
+    def __eq__(self, other):
+        """
+        @brief Равенство с многочленом или скаляром.
+        """
+        coerced = self._coerce(other) if not isinstance(other, MultiPolynomial) else other
+        if coerced is None:
+            return NotImplemented
+        return self._nvars == coerced._nvars and self._terms == coerced._terms
+
+    __hash__ = None
+
+    def __repr__(self):
+        """
+        @brief Строковое представление: члены по возрастанию мономов.
+        """
+        terms = []
+        for exps, coef in self._terms.items():
+            term = str(coef)
+            for v, e in enumerate(exps):
+                if e > 0:
+                    term += "*x{}".format(v)
+                    if e > 1:
+                        term += "^{}".format(e)
+            terms.append(term)
+        if not terms:
+            return "0"
+        return " + ".join(terms)
@@ -1,23 +1,158 @@
+import array
+import numbers
+from itertools import zip_longest
+
+try:
+    import numpy as np
+except ImportError:  # NumPy - необязательная зависимость
+    np = None
+
+from PolynomialMultiplier import PolynomialMultiplier
+from PolynomialDivider import PolynomialDivider
+from CoefficientField import CoefficientField
+from SubproductTree import SubproductTree
+from CoefficientView import CoefficientView
+from PolynomialRoots import PolynomialRoots
+
+
+def _trim_array(arr):
+    """
+    @brief Удаляет ведущие нули массива коэффициентов одной векторной операцией.
+    @param arr Одномерный массив NumPy.
+    @return Срез массива без ведущих нулей (не короче одного элемента).
+    """
+    nonzero = np.flatnonzero(arr)
+    if nonzero.size == 0:
+        return arr[:1]
+    if nonzero[-1] + 1 == arr.size:
+        return arr
+    return arr[:nonzero[-1] + 1]
+
+
+def _magnitude(arr):
+    """Наибольший модуль элемента целочисленного массива (целое Python)."""
+    if arr.size == 0:
+        return 0
+    return max(abs(int(arr.min())), abs(int(arr.max())))
+
+
+def _exact_int_dtype(dtype, bound):
+    """
+    @brief Тип результата целочисленной операции, в котором она не переполнится.
+    @param dtype Тип результата по правилам NumPy.
+    @param bound Верхняя оценка модуля результата (целое Python).
+    @return dtype, если он знаковый и вмещает bound; иначе int64, если bound
+            в него помещается; иначе object (точная арифметика целых Python).
+    """
+    if dtype.kind == "i" and bound <= np.iinfo(dtype).max:
+        return dtype
+    if bound < 1 << 63:
+        return np.dtype(np.int64)
+    return np.dtype(object)
+
+
+def _horner_bound(coeff_bound, point_bound, degree):
+    """
+    @brief Верхняя оценка модуля значений (и промежуточных сумм схемы Горнера)
+           многочлена степени degree с |коэффициенты| <= coeff_bound в точках
+           с |x| <= point_bound.
+    @return Целое Python; не меньше 2^63, если оценка заведомо больше int64.
+    """
+    if point_bound <= 1:
+        return coeff_bound * (degree + 1)
+    if coeff_bound and (coeff_bound.bit_length() - 1) + degree * (point_bound.bit_length() - 1) >= 63:
+        return 1 << 63  # coeff_bound * point_bound^degree уже не меньше 2^63
+    return coeff_bound * (point_bound ** (degree + 1) - 1) // (point_bound - 1)
+
+
+def _sum_dtype(a, b):
+    """Тип суммы или разности массивов a и b без целочисленного переполнения."""
+    dtype = np.result_type(a, b)
+    if a.dtype.kind in "biu" and b.dtype.kind in "biu":
+        return _exact_int_dtype(dtype, _magnitude(a) + _magnitude(b))
+    return dtype
+
+
+def _scaled_dtype(a, factor):
+    """Тип произведения массива a на скаляр factor без целочисленного переполнения."""
+    if a.dtype.kind in "biu" and isinstance(factor, numbers.Integral):
+        return _exact_int_dtype(a.dtype, _magnitude(a) * abs(int(factor)))
+    return np.result_type(a, factor)
+
+
 class Polynomial:
     """
     @brief Класс многочлена от одной переменной, заданного массивом коэффициентов.
+    @details Коэффициенты хранятся либо в списке Python (режим "list"),
+             либо в массиве NumPy (режим "numpy"). В режиме "numpy" сложение,
+             вычитание, умножение на скаляр, сравнение и удаление ведущих нулей
+             выполняются целиком над массивом; целочисленные операции остаются
+             точными: если результат может не поместиться в int64, массив
+             переводится в dtype=object (целые Python).
+             Необязательное поле коэффициентов (IntegerRing, RationalField,
+             PrimeField) задает точную арифметику: все операции, включая
+             деление, выполняются в этом поле.
     """
 
+    # Поддерживаемые режимы хранения коэффициентов
+    STORAGE_LIST = "list"
+    STORAGE_NUMPY = "numpy"
+    STORAGE_SPARSE = "sparse"  # Используется подклассом SparsePolynomial
+
     # Статическая переменная класса (аналог статического поля в C++)
     _instance_count = 0
 
-    def __init__(self, coeffs, degree=None):
+    # Поле коэффициентов по умолчанию (None - обычная арифметика Python)
+    _field = None
+
+    # Общий движок умножения (выбор алгоритма по размеру входных данных)
+    _multiplier = PolynomialMultiplier()
+    # Движок деления с остатком поверх движка умножения
+    _divider = PolynomialDivider(_multiplier)
+
+    def __init__(self, coeffs, degree=None, storage=None, field=None):
         """
         @brief Инициализирует многочлен.
-        @param coeffs Список коэффициентов (начиная с константы до старшей степени).
+        @param coeffs Список коэффициентов (начиная с константы до старшей степени)
+               или одномерный массив NumPy.
         @param degree Степень многочлена. Должно совпадать с len(coeffs)-1 (если задан).
-        """
-        if not isinstance(coeffs, (list, tuple)):
+        @param storage Режим хранения: "list" или "numpy". По умолчанию "numpy"
+               для массивов NumPy и полей с векторными ядрами (GF(p)),
+               "list" для остальных входных данных. В режиме "numpy" целые
+               хранятся в int64, пока значения помещаются в него; результаты
+               операций, которые могут выйти за пределы int64, хранятся в
+               массиве dtype=object, так что арифметика точна, как в режиме "list".
+        @param field Поле коэффициентов (CoefficientField) или None.
+        """
+        is_array = np is not None and isinstance(coeffs, np.ndarray)
+        if not is_array and not isinstance(coeffs, (list, tuple)):
             raise TypeError("Коэффициенты должны быть списком или кортежем")
-        coeffs = list(coeffs)
-        # Удаляем ведущие нули
-        while len(coeffs) > 1 and coeffs[-1] == 0:
-            coeffs.pop()
+        if field is not None and not isinstance(field, CoefficientField):
+            raise TypeError("Поле коэффициентов должно быть объектом CoefficientField")
+        if storage is None:
+            is_array = is_array or (field is not None and field.prefers_numpy)
+            storage = Polynomial.STORAGE_NUMPY if is_array else Polynomial.STORAGE_LIST
+        if field is not None:
+            coeffs = field.convert_all(coeffs)
+            if storage == Polynomial.STORAGE_LIST and not isinstance(coeffs, list):
+                coeffs = coeffs.tolist()
+
+        if storage == Polynomial.STORAGE_NUMPY:
+            if np is None:
+                raise ImportError("Для режима хранения 'numpy' требуется пакет NumPy")
+            # Собственная копия данных (результат convert_all уже принадлежит объекту)
+            coeffs = np.asarray(coeffs) if field is not None else np.array(coeffs)
+            if coeffs.ndim != 1:
+                raise ValueError("Массив коэффициентов должен быть одномерным")
+            # Удаляем ведущие нули
+            coeffs = _trim_array(coeffs)
+        elif storage == Polynomial.STORAGE_LIST:
+            coeffs = list(coeffs)
+            # Удаляем ведущие нули
+            while len(coeffs) > 1 and coeffs[-1] == 0:
+                coeffs.pop()
+        else:
+            raise ValueError("Неизвестный режим хранения коэффициентов: {}".format(storage))
         if degree is None:
             self._degree = len(coeffs) - 1  # Приватное поле
         else:
@@ -25,6 +160,8 @@ class Polynomial:
                 raise ValueError("Несовпадение степени и длины списка коэффициентов")
             self._degree = degree
         self._coeffs = coeffs  # Приватное поле
+        self._storage = storage
+        self._field = field
 
         # Увеличиваем счетчик созданных экземпляров
         Polynomial._instance_count += 1
@@ -33,13 +170,122 @@ class Polynomial:
     @property
     def coeffs(self):
         """@brief Получение коэффициентов (только чтение)."""
+        if self._storage == Polynomial.STORAGE_NUMPY:
+            return self._coeffs.tolist()  # Копия всего массива одной операцией
         return self._coeffs[:]  # Возвращаем копию для защиты
 
+    @property
+    def coeffs_view(self):
+        """
+        @brief Коэффициенты без копирования, только для чтения.
+        @details Для режима "numpy" - массив-представление с запретом записи, для
+                 режима "list" - CoefficientView над внутренним списком.
+                 Представление действительно до изменения многочлена на месте.
+        """
+        if self._storage == Polynomial.STORAGE_NUMPY:
+            view = self._coeffs.view()
+            view.flags.writeable = False
+            return view
+        return CoefficientView(self._coeffs)
+
     @property
     def degree(self):
         """@brief Получение степени многочлена (только чтение)."""
         return self._degree
 
+    @property
+    def field(self):
+        """@brief Поле коэффициентов или None (только чтение)."""
+        return self._field
+
+    @property
+    def storage(self):
+        """@brief Режим хранения коэффициентов: "list" или "numpy" (только чтение)."""
+        return self._storage
+
+    def to_numpy(self):
+        """
+        @brief Возвращает копию коэффициентов в виде массива NumPy.
+        @return Одномерный массив коэффициентов.
+        """
+        if np is None:
+            raise ImportError("Для преобразования в массив требуется пакет NumPy")
+        return np.array(self._coeffs)
+
+    def with_storage(self, storage):
+        """
+        @brief Создает копию многочлена с другим режимом хранения.
+        @param storage Режим хранения: "list", "numpy" или "sparse".
+        @return Новый многочлен с теми же коэффициентами и полем.
+        @throws ValueError для "sparse" у многочлена над полем коэффициентов.
+        """
+        if storage == Polynomial.STORAGE_SPARSE:
+            return self.to_sparse()
+        if storage == Polynomial.STORAGE_LIST and self._storage == Polynomial.STORAGE_NUMPY:
+            return Polynomial(self._coeffs.tolist(), storage=storage, field=self._field)
+        return Polynomial(self._coeffs, storage=storage, field=self._field)
+
+    def to_sparse(self):
+        """
+        @brief Создает разреженную копию многочлена (только ненулевые члены).
+        @return Объект SparsePolynomial.
+        @throws ValueError для многочлена над полем коэффициентов (разреженное
+                хранение полей не поддерживает).
+        """
+        from SparsePolynomial import SparsePolynomial  # Отложенный импорт: модуль-наследник
+        if self._field is not None:
+            raise ValueError("Разреженное хранение не поддерживает поле {}".format(self._field))
+        return SparsePolynomial(dict(self._nonzero_terms()))
+
+    def _nonzero_terms(self):
+        """
+        @brief Перебирает ненулевые члены многочлена в порядке возрастания степени.
+        @return Итератор пар (степень, коэффициент).
+        """
+        if self._storage == Polynomial.STORAGE_NUMPY:
+            exps = np.flatnonzero(self._coeffs)
+            return zip(exps.tolist(), self._coeffs[exps].tolist())
+        return ((exp, coef) for exp, coef in enumerate(self._coeffs) if coef != 0)
+
+    def _coefficient_list(self):
+        """Коэффициенты в виде списка Python (без копирования для режима "list")."""
+        if self._storage == Polynomial.STORAGE_NUMPY:
+            return self._coeffs.tolist()
+        return self._coeffs
+
+    def _wrap(self, coeffs, other=None):
+        """
+        @brief Создает многочлен-результат операции над self и other.
+        @return Многочлен в режиме "numpy", если он был хотя бы у одного операнда,
+                над общим полем коэффициентов операндов.
+        """
+        field = self._common_field(other)
+        if self._uses_numpy(other):
+            return Polynomial(np.asarray(coeffs), storage=Polynomial.STORAGE_NUMPY, field=field)
+        return Polynomial(list(coeffs), field=field)
+
+    def _common_field(self, other=None):
+        """
+        @brief Определяет поле коэффициентов результата операции над self и other.
+        @throws ValueError, если операнды заданы над разными полями.
+        """
+        if other is None or other._field is None:
+            return self._field
+        if self._field is None or self._field == other._field:
+            return other._field
+        raise ValueError("Многочлены заданы над разными полями: {} и {}".format(self._field, other._field))
+
+    def _uses_numpy(self, other=None):
+        """Проверяет, хранит ли хотя бы один из операндов коэффициенты в NumPy."""
+        if self._storage == Polynomial.STORAGE_NUMPY:
+            return True
+        return other is not None and other._storage == Polynomial.STORAGE_NUMPY
+
+    @staticmethod
+    def _is_scalar(value):
+        """Проверяет, является ли значение скаляром (числом)."""
+        return isinstance(value, numbers.Number) and not isinstance(value, Polynomial)
+
     # Статические методы
     @staticmethod
     def zero():
@@ -61,13 +307,25 @@ class Polynomial:
     def monomial(degree, coeff=1):
         """
         @brief Создает моном x^degree с заданным коэффициентом.
+        @details Мономы высокой степени создаются в разреженном представлении
+                 (см. SparsePolynomial.from_terms), чтобы не хранить degree нулей.
         @param degree Степень монома.
         @param coeff Коэффициент (по умолчанию 1).
         @return Многочлен вида coeff*x^degree.
         """
-        coeffs = [0] * (degree + 1)
-        coeffs[degree] = coeff
-        return Polynomial(coeffs)
+        return Polynomial.from_terms({degree: coeff})
+
+    @staticmethod
+    def from_terms(terms):
+        """
+        @brief Создает многочлен по словарю {степень: коэффициент}.
+        @details Представление выбирается по плотности: разреженное, если ненулевых
+                 членов мало относительно степени, иначе плотное.
+        @param terms Словарь или итерируемый объект пар (степень, коэффициент).
+        @return Объект Polynomial или SparsePolynomial.
+        """
+        from SparsePolynomial import SparsePolynomial  # Отложенный импорт: модуль-наследник
+        return SparsePolynomial.from_terms(terms)
 
     @classmethod
     def get_instance_count(cls):
@@ -84,18 +342,148 @@ class Polynomial:
         """
         cls._instance_count = 0
 
+    @classmethod
+    def get_multiplier(cls):
+        """
+        @brief Возвращает движок умножения, используемый операторами * и *=.
+        @return Объект PolynomialMultiplier.
+        """
+        return cls._multiplier
+
+    @classmethod
+    def set_multiplier(cls, multiplier):
+        """
+        @brief Устанавливает движок умножения (например, с фиксированным алгоритмом).
+        @param multiplier Объект PolynomialMultiplier.
+        """
+        if not isinstance(multiplier, PolynomialMultiplier):
+            raise TypeError("Ожидается объект PolynomialMultiplier")
+        cls._multiplier = multiplier
+        cls._divider.multiplier = multiplier
+
     # Константный метод - не изменяет состояние объекта
     def evaluate(self, x):
         """
         @brief Константный метод вычисления значения многочлена в точке x.
+        @details Использует схему Горнера: n умножений и n сложений без возведения в степень.
         @param x Значение переменной.
         @return Значение многочлена.
         """
+        if self._field is not None:
+            return self._field.evaluate(self._coeffs, x)
         result = 0
-        for exp, coef in enumerate(self._coeffs):
-            result += coef * (x ** exp)
+        for coef in reversed(self._coefficient_list()):  # Целые Python, без переполнения int64
+            result = result * x + coef
+        return result
+
+    def evaluate_many(self, xs):
+        """
+        @brief Константный метод вычисления значений многочлена во множестве точек.
+        @details Схема Горнера выполняется за один проход по коэффициентам, на каждом
+                 шаге - одна векторная операция над всеми точками. Массивы NumPy и
+                 array.array обрабатываются без копирования входных данных.
+        @param xs Список, кортеж, array.array или массив NumPy значений переменной.
+        @return Массив NumPy для входных array.array и ndarray (если NumPy доступен),
+                иначе список значений. Для целых массивов результат точный: если
+                значения могут не поместиться в int64, возвращается массив
+                dtype=object с целыми Python.
+        """
+        is_array = np is not None and isinstance(xs, np.ndarray)
+        if np is not None and isinstance(xs, array.array):
+            xs = np.frombuffer(xs, dtype=xs.typecode)  # Представление без копирования
+            is_array = True
+        if not is_array and not isinstance(xs, (list, tuple, array.array)):
+            raise TypeError("Точки должны быть списком, кортежем, array.array или массивом NumPy")
+
+        if np is not None and len(xs) > 0 and self._degree >= 0:
+            points = xs if is_array else np.asarray(xs)
+            coeffs = np.asarray(self._coefficient_values())
+            dtype = np.result_type(coeffs, points)
+            # Целые числа Python вычисляем точно, без переполнения int64
+            # (вычеты GF(p) точны и в int64)
+            prefers_numpy = self._field is not None and self._field.prefers_numpy
+            if is_array or dtype.kind in "fc" or prefers_numpy:
+                if not prefers_numpy and coeffs.dtype.kind in "biu" and points.dtype.kind in "biu":
+                    bound = _horner_bound(_magnitude(coeffs), _magnitude(points), self._degree)
+                    dtype = _exact_int_dtype(dtype, bound)
+                    points = points.astype(dtype, copy=False)
+                values = self._evaluate_array(points, dtype)
+                return values if is_array else values.tolist()
+
+        values = [self.evaluate(x) for x in xs]
+        return np.array(values) if is_array else values
+
+    def _coefficient_values(self):
+        """Последовательность хранимых коэффициентов (для определения типа результата)."""
+        return self._coeffs
+
+    def _evaluate_array(self, points, dtype):
+        """
+        @brief Векторная схема Горнера над массивом точек.
+        @param points Массив точек произвольной формы.
+        @param dtype Тип результата.
+        @return Массив значений той же формы, что и points.
+        """
+        if self._field is not None and self._field.prefers_numpy:
+            return self._field.evaluate_array(self._coeffs, points)
+        coeffs = np.asarray(self._coeffs).astype(dtype, copy=False)
+        result = np.zeros(points.shape, dtype=dtype)
+        for coef in coeffs[::-1]:
+            result *= points
+            result += coef
         return result
 
+    def evaluate_at(self, points):
+        """
+        @brief Константный метод многоточечного вычисления через дерево подпроизведений.
+        @details Над полями с ограниченными коэффициентами (GF(p)) остаток от деления
+                 на произведение (x - x_i) спускается по дереву (см. SubproductTree):
+                 O(M(n) log n) вместо O(n * deg) у Горнера. Над int и Fraction спуск
+                 медленнее Горнера из-за роста чисел, над float и complex неустойчив,
+                 поэтому для них значения считаются схемой Горнера (evaluate_many).
+                 Результат для int, Fraction и полей коэффициентов точный.
+        @param points Последовательность точек.
+        @return Список значений в порядке точек.
+        """
+        points = points.tolist() if np is not None and isinstance(points, np.ndarray) else list(points)
+        if self._field is None or not self._field.bounded:
+            return self.evaluate_many(points)
+        tree = SubproductTree(points, Polynomial._multiplier, Polynomial._divider, self._field)
+        return tree.evaluate(self._coefficient_list())
+
+    @staticmethod
+    def interpolate(xs, ys, field=None):
+        """
+        @brief Создает многочлен степени < n по n значениям (интерполяция Лагранжа).
+        @details Использует дерево подпроизведений: O(M(n) log n) операций над
+                 GF(p). Для целых данных коэффициенты точные (int или Fraction), но
+                 из-за роста чисел стоимость не квазилинейна.
+        @param xs Попарно различные точки.
+        @param ys Значения в точках.
+        @param field Поле коэффициентов (CoefficientField) или None.
+        @return Новый многочлен.
+        @throws ValueError при повторяющихся точках или разной длине xs и ys.
+        """
+        tree = SubproductTree(xs, Polynomial._multiplier, Polynomial._divider, field)
+        return Polynomial(tree.interpolate(list(ys)), field=field)
+
+    def roots(self, method="auto"):
+        """
+        @brief Константный метод поиска всех комплексных корней многочлена.
+        @details Сопровождающая матрица для умеренных степеней, итерация
+                 Аберта-Эрлиха для больших (см. PolynomialRoots).
+        @param method "auto", "companion" или "aberth".
+        @return Комплексный массив NumPy из degree корней (с учетом кратности).
+        @throws ValueError для нулевого многочлена и конечных полей коэффициентов.
+        """
+        if self._field is not None and self._field.bounded:
+            raise ValueError("Поиск корней над {} не поддерживается".format(self._field))
+        solver = PolynomialRoots(method)
+        coeffs = self._coefficient_list()
+        if PolynomialMultiplier.coefficient_kind(coeffs) not in ("int", "float", "complex"):
+            coeffs = [complex(c) for c in coeffs]  # Fraction и прочие числа
+        return solver.roots(coeffs)
+
     # Константный метод - возвращает копию коэффициента
     def get_coefficient(self, exp):
         """
@@ -105,7 +493,10 @@ class Polynomial:
         """
         if exp < 0 or exp > self._degree:
             return 0
-        return self._coeffs[exp]
+        coef = self._coeffs[exp]
+        if self._storage == Polynomial.STORAGE_NUMPY and isinstance(coef, np.generic):
+            return coef.item()  # Скаляр NumPy -> число Python
+        return coef
 
     def __getitem__(self, exp):
         """
@@ -117,10 +508,14 @@ class Polynomial:
 
     def __call__(self, x):
         """
-        @brief Вычисляет значение многочлена в точке x.
-        @param x Значение переменной.
-        @return Значение многочлена.
+        @brief Вычисляет значение многочлена в точке x или во множестве точек.
+        @param x Значение переменной либо список, кортеж, array.array или массив NumPy.
+        @return Значение многочлена (см. evaluate и evaluate_many).
         """
+        if isinstance(x, (list, tuple, array.array)):
+            return self.evaluate_many(x)
+        if np is not None and isinstance(x, np.ndarray) and x.ndim > 0:
+            return self.evaluate_many(x)
         return self.evaluate(x)
 
     def __eq__(self, other):
@@ -129,112 +524,455 @@ class Polynomial:
         """
         if not isinstance(other, Polynomial):
             return False
+        if self._uses_numpy(other):
+            return bool(np.array_equal(np.asarray(self._coeffs), np.asarray(other._coeffs)))
         return self._coeffs == other._coeffs
 
+    def _combine(self, other, subtract):
+        """
+        @brief Поэлементно складывает или вычитает коэффициенты двух многочленов.
+        @param other Второй многочлен.
+        @param subtract True для вычитания, False для сложения.
+        @return Новый многочлен; режим "numpy", если он был хотя бы у одного операнда.
+        """
+        if not isinstance(other, Polynomial):
+            return NotImplemented
+        if self._uses_numpy(other):
+            a = np.asarray(self._coeffs)
+            b = np.asarray(other._coeffs)
+            result = np.zeros(max(a.size, b.size), dtype=_sum_dtype(a, b))
+            result[:a.size] = a
+            if subtract:
+                result[:b.size] -= b
+            else:
+                result[:b.size] += b
+            return Polynomial(result, storage=Polynomial.STORAGE_NUMPY, field=self._common_field(other))
+        if subtract:
+            new_coeffs = [a - b for a, b in zip_longest(self._coeffs, other._coeffs, fillvalue=0)]
+        else:
+            new_coeffs = [a + b for a, b in zip_longest(self._coeffs, other._coeffs, fillvalue=0)]
+        return Polynomial(new_coeffs, field=self._common_field(other))
+
     def __add__(self, other):
         """
         @brief Сложение двух многочленов (возвращает новый).
         """
-        max_deg = max(self._degree, other._degree)
-        new_coeffs = []
-        for i in range(max_deg+1):
-            new_coeffs.append(self[i] + other[i])
-        return Polynomial(new_coeffs)
+        return self._combine(other, subtract=False)
 
     def __iadd__(self, other):
         """
-        @brief Сложение (in-place).
+        @brief Сложение (in-place): коэффициенты изменяются без создания нового объекта.
         """
-        result = self + other
-        self._coeffs = result._coeffs
-        self._degree = result._degree
-        return self
+        return self._combine_in_place(other, subtract=False)
 
     def __sub__(self, other):
         """
         @brief Вычитание двух многочленов (возвращает новый).
         """
-        max_deg = max(self._degree, other._degree)
-        new_coeffs = []
-        for i in range(max_deg+1):
-            new_coeffs.append(self[i] - other[i])
-        return Polynomial(new_coeffs)
+        return self._combine(other, subtract=True)
 
     def __isub__(self, other):
         """
-        @brief Вычитание (in-place).
+        @brief Вычитание (in-place): коэффициенты изменяются без создания нового объекта.
         """
-        result = self - other
-        self._coeffs = result._coeffs
-        self._degree = result._degree
-        return self
+        return self._combine_in_place(other, subtract=True)
 
     def __mul__(self, other):
         """
-        @brief Умножение двух многочленов (возвращает новый).
+        @brief Умножение многочлена на многочлен или на скаляр (возвращает новый).
         """
-        new_coeffs = [0] * (self._degree + other._degree + 1)
-        for i, a in enumerate(self._coeffs):
-            for j, b in enumerate(other._coeffs):
-                new_coeffs[i+j] += a * b
-        return Polynomial(new_coeffs)
+        if Polynomial._is_scalar(other):
+            return self._scale(other)
+        if not isinstance(other, Polynomial):
+            return NotImplemented
+        field = self._common_field(other)
+        if field is not None:
+            return self._wrap(field.multiply(self._coeffs, other._coeffs), other)
+        new_coeffs = Polynomial._multiplier.multiply(self._coeffs, other._coeffs)
+        return self._wrap(new_coeffs, other)
+
+    def __rmul__(self, other):
+        """
+        @brief Умножение скаляра на многочлен (возвращает новый).
+        """
+        if Polynomial._is_scalar(other):
+            return self._scale(other)
+        return NotImplemented
+
+    def _scale(self, factor):
+        """
+        @brief Умножает все коэффициенты на скаляр.
+        @param factor Скалярный множитель.
+        @return Новый многочлен того же режима хранения.
+        """
+        if self._field is not None:
+            factor = self._field.convert(factor)
+        if self._storage == Polynomial.STORAGE_NUMPY:
+            coeffs = self._coeffs.astype(_scaled_dtype(self._coeffs, factor), copy=False)
+            return Polynomial(coeffs * factor, storage=Polynomial.STORAGE_NUMPY, field=self._field)
+        return Polynomial([a * factor for a in self._coeffs], field=self._field)
 
     def __imul__(self, other):
         """
         @brief Умножение (in-place).
-        """
-        result = self * other
-        self._coeffs = result._coeffs
-        self._degree = result._degree
-        return self
+        @details Умножение на скаляр выполняется над текущим буфером коэффициентов;
+                 произведение многочленов записывается в объект без создания
+                 промежуточного Polynomial.
+        """
+        if Polynomial._is_scalar(other):
+            factor = self._field.convert(other) if self._field is not None else other
+            if self._storage == Polynomial.STORAGE_NUMPY:
+                dtype = _scaled_dtype(self._coeffs, factor)
+                if dtype == self._coeffs.dtype:
+                    self._coeffs *= factor
+                else:
+                    self._coeffs = self._coeffs.astype(dtype) * factor
+            else:
+                for i in range(len(self._coeffs)):
+                    self._coeffs[i] *= factor
+            return self._normalize_in_place()
+        if not isinstance(other, Polynomial):
+            return NotImplemented
+        field = self._common_field(other)
+        if field is not None:
+            return self._assign(field.multiply(self._coeffs, other._coeffs), other)
+        return self._assign(Polynomial._multiplier.multiply(self._coeffs, other._coeffs), other)
 
     def __truediv__(self, other):
         """
         @brief Деление многочленов (возвращает частное, игнорируя остаток).
+        @details Над полем коэффициентов деление выполняется точно в этом поле.
         """
+        field = self._common_field(other)
+        if field is not None:
+            quotient, _ = field.divmod(self._coeffs, other._coeffs)
+            return self._wrap(quotient, other)
         if other._degree == 0:
             c = other._coeffs[0]
             if c == 0:
                 raise ZeroDivisionError("Деление на нулевой многочлен")
+            if self._storage == Polynomial.STORAGE_NUMPY:
+                return Polynomial(self._coeffs / c, storage=Polynomial.STORAGE_NUMPY)
             new_coeffs = [a / c for a in self._coeffs]
             return Polynomial(new_coeffs)
-        if other._degree < 0 or other._coeffs == []:
-            raise ZeroDivisionError("Деление на нулевой многочлен")
-        # стандартное деление столбиком
-        A = self._coeffs[:]
-        degA = self._degree
-        degB = other._degree
-        if degA < degB:
-            return Polynomial([0])
-        B = other._coeffs[:]
-        quotient = [0] * (degA - degB + 1)
-        while degA >= degB and abs(A[degA]) > 1e-12:
-            coef = A[degA] / B[degB]
-            shift = degA - degB
-            quotient[shift] = coef
-            for i in range(degB+1):
-                A[i+shift] -= coef * B[i]
-            while degA >= 0 and abs(A[degA]) < 1e-12:
-                degA -= 1
-        return Polynomial(quotient)
+        # Деление столбиком или через обращение ряда (см. PolynomialDivider)
+        quotient, _ = Polynomial._divider.divmod(self._coefficient_list(), other._coefficient_list(), mode="true")
+        return self._wrap(quotient, other)
+
+    def __divmod__(self, other):
+        """
+        @brief Деление многочленов с остатком: divmod(a, b) -> (частное, остаток).
+        @details Для целых и Fraction коэффициентов деление точное (целые частные
+                 остаются int, остальные становятся Fraction), без допусков.
+        @return Пара многочленов (q, r), где a = b*q + r и deg(r) < deg(b).
+        """
+        if not isinstance(other, Polynomial):
+            return NotImplemented
+        field = self._common_field(other)
+        if field is not None:
+            quotient, remainder = field.divmod(self._coeffs, other._coeffs)
+        else:
+            quotient, remainder = Polynomial._divider.divmod(self._coefficient_list(), other._coefficient_list())
+        return self._wrap(quotient, other), self._wrap(remainder, other)
+
+    def __floordiv__(self, other):
+        """
+        @brief Частное от деления с остатком (точное для int и Fraction).
+        """
+        if not isinstance(other, Polynomial):
+            return NotImplemented
+        return divmod(self, other)[0]
+
+    def __mod__(self, other):
+        """
+        @brief Остаток от деления многочленов.
+        """
+        if not isinstance(other, Polynomial):
+            return NotImplemented
+        return divmod(self, other)[1]
+
+    def __pow__(self, exponent, modulo=None):
+        """
+        @brief Возведение в целую неотрицательную степень (возвращает новый).
+        @details Бинарное возведение: O(log k) умножений движком PolynomialMultiplier
+                 (Карацуба, FFT, NTT) или полем коэффициентов.
+        @param exponent Показатель степени k >= 0.
+        @param modulo Многочлен-модуль для pow(p, k, m): после каждого умножения
+               берется остаток от деления на m.
+        @return Многочлен p^k (или p^k mod m).
+        @throws ValueError при отрицательном показателе.
+        """
+        if not isinstance(exponent, numbers.Integral):
+            return NotImplemented
+        if exponent < 0:
+            raise ValueError("Показатель степени должен быть неотрицательным: {}".format(exponent))
+        if modulo is not None and not isinstance(modulo, Polynomial):
+            return NotImplemented
+        field = self._common_field(modulo)
+
+        def reduce(coeffs):
+            if modulo is None:
+                return coeffs
+            if field is not None:
+                return field.divmod(coeffs, modulo._coeffs)[1]
+            return Polynomial._divider.divmod(PolynomialDivider._as_list(coeffs), modulo._coefficient_list())[1]
+
+        base = reduce(self._coefficient_list())
+        result = reduce([1])
+        while exponent:
+            if exponent & 1:
+                result = reduce(self._multiply_coeffs(result, base, field))
+            exponent >>= 1
+            if exponent:
+                base = reduce(self._multiply_coeffs(base, base, field))
+        return self._wrap(result, modulo)
+
+    def compose(self, other):
+        """
+        @brief Композиция многочленов p(q(x)) (возвращает новый).
+        @details Разделяй и властвуй: p = p_low + x^h * p_high, откуда
+                 p(q) = p_low(q) + q^h * p_high(q). Степени q^(2^i) вычисляются
+                 один раз; итого O(M(nm) log n) вместо n умножений схемы Горнера.
+        @param other Многочлен q.
+        @return Многочлен p(q(x)).
+        """
+        if not isinstance(other, Polynomial):
+            raise TypeError("Композиция определена только для многочленов")
+        field = self._common_field(other)
+        coeffs = self._coefficient_list()
+        inner = other._coefficient_list()
+        if not coeffs:
+            return self._wrap([0], other)
+        if other._degree <= 0:
+            return self._wrap([self.evaluate(inner[0] if inner else 0)], other)
+        powers = [inner]  # powers[i] = q^(2^i)
+        while 1 << len(powers) < len(coeffs):
+            powers.append(self._multiply_coeffs(powers[-1], powers[-1], field))
+
+        def compose_range(low, high, level):
+            # Композиция коэффициентов coeffs[low:high], high - low <= 2^level
+            if high - low == 1:
+                return [coeffs[low]]
+            middle = low + (1 << (level - 1))
+            if middle >= high:
+                return compose_range(low, high, level - 1)
+            upper = self._multiply_coeffs(powers[level - 1], compose_range(middle, high, level - 1), field)
+            return Polynomial._add_coeffs(compose_range(low, middle, level - 1), upper, field)
+
+        return self._wrap(compose_range(0, len(coeffs), len(powers)), other)
+
+    def shift(self, a):
+        """
+        @brief Сдвиг Тейлора: многочлен p(x + a) (возвращает новый).
+        @details Над GF(p) при p > deg - одна свертка:
+                 b_k * k! = sum_i (a_i * i!) * a^(i-k) / (i-k)!, т.е. O(M(n)) (NTT).
+                 Для float/complex - композиция с x + a за O(M(n) log n) на FFT.
+                 Для точных int и Fraction - синтетическое деление O(n^2) операций
+                 с малыми числами: быстрые схемы здесь оперируют целыми длины O(n)
+                 бит и в CPython медленнее.
+        @note Ограничение: над int и Fraction (а также над GF(p) при p <= степени)
+              сдвиг не квазилинейный - O(n^2), около 0.65 с для 2000 и 5 с для
+              4000 целых коэффициентов. Замер: "polynomial.shift" в
+              benchmarks/BenchSuite.py (и "polynomial.shift_gf" для быстрого пути).
+        @param a Величина сдвига.
+        @return Многочлен p(x + a).
+        """
+        field = self._field
+        coeffs = self._coefficient_list()
+        if len(coeffs) <= 1:
+            return self._wrap(coeffs or [0])
+        if field is not None:
+            a = field.convert(a)
+            if field.bounded and field.p >= len(coeffs):
+                return self._wrap(self._shift_convolution(coeffs, a))
+        kind = PolynomialMultiplier.coefficient_kind(coeffs, [a])
+        if kind in ("float", "complex"):
+            return self.compose(Polynomial([a, 1], field=field))
+        shifted = list(coeffs)
+        n = len(shifted)
+        for i in range(n - 1):
+            for j in range(n - 2, i - 1, -1):
+                shifted[j] += a * shifted[j + 1]
+        if field is not None:
+            shifted = field.convert_all(shifted)
+        return self._wrap(shifted)
+
+    def _shift_convolution(self, coeffs, a):
+        """Сдвиг Тейлора над GF(p) одной сверткой (требует p > степени)."""
+        field = self._field
+        p = field.p
+        n = len(coeffs)
+        factorials = [1] * n
+        for i in range(1, n):
+            factorials[i] = factorials[i - 1] * i % p
+        inverse = [1] * n
+        inverse[-1] = pow(factorials[-1], -1, p)
+        for i in range(n - 1, 0, -1):
+            inverse[i - 1] = inverse[i] * i % p
+        weighted = [int(c) * f % p for c, f in zip(coeffs, factorials)][::-1]
+        powers = [1] * n
+        for j in range(1, n):
+            powers[j] = powers[j - 1] * a % p
+        kernel = [x * y % p for x, y in zip(powers, inverse)]
+        product = PolynomialDivider._as_list(field.multiply(weighted, kernel))
+        return [int(product[n - 1 - k]) * inverse[k] % p for k in range(n)]
+
+    def derivative(self):
+        """
+        @brief Производная многочлена (возвращает новый).
+        """
+        if self._storage == Polynomial.STORAGE_NUMPY and self._coeffs.size > 1:
+            return self._wrap(self._coeffs[1:] * np.arange(1, self._coeffs.size))
+        return self._wrap([i * c for i, c in enumerate(self._coeffs)][1:] or [0])
+
+    def integral(self, constant=0):
+        """
+        @brief Первообразная многочлена (возвращает новый).
+        @details Для режима "list" коэффициенты делятся точно (int, если делится
+                 нацело, иначе Fraction), для режима "numpy" - обычным делением
+                 массива, над полем коэффициентов - в поле.
+        @param constant Свободный член первообразной.
+        @return Многочлен P с P' = p и P(0) = constant.
+        """
+        if self._field is not None:
+            values = [self._field.div(c, i + 1) for i, c in enumerate(self._coefficient_list())]
+        elif self._storage == Polynomial.STORAGE_NUMPY:
+            values = self._coeffs / np.arange(1, self._coeffs.size + 1)
+            return self._wrap(np.concatenate(([constant], values)))
+        else:
+            values = [PolynomialDivider.exact_div(c, i + 1) for i, c in enumerate(self._coeffs)]
+        return self._wrap([constant] + values)
+
+    def _multiply_coeffs(self, a, b, field=None):
+        """Произведение последовательностей коэффициентов в поле или движком умножения."""
+        if field is not None:
+            return field.multiply(a, b)
+        return Polynomial._multiplier.multiply(a, b)
+
+    @staticmethod
+    def _add_coeffs(a, b, field=None):
+        """Сумма последовательностей коэффициентов (списков или массивов NumPy)."""
+        if np is not None and (isinstance(a, np.ndarray) or isinstance(b, np.ndarray)):
+            a, b = np.asarray(a), np.asarray(b)
+            if a.size < b.size:
+                a, b = b, a
+            total = a.astype(np.result_type(a, b))
+            total[:b.size] += b
+        else:
+            total = [x + y for x, y in zip_longest(a, b, fillvalue=0)]
+        return field.convert_all(total) if field is not None else total
 
     def __itruediv__(self, other):
         """
         @brief Деление (in-place, устанавливает текущее многочлен равным частному).
+        @details Деление на константу выполняется над текущим буфером коэффициентов.
         """
-        result = self / other
-        self._coeffs = result._coeffs
-        self._degree = result._degree
+        if not isinstance(other, Polynomial):
+            return NotImplemented
+        field = self._common_field(other)
+        if field is not None:
+            return self._assign(field.divmod(self._coeffs, other._coeffs)[0], other)
+        if other._degree == 0:
+            c = other._coeffs[0]
+            if c == 0:
+                raise ZeroDivisionError("Деление на нулевой многочлен")
+            if self._storage == Polynomial.STORAGE_NUMPY:
+                if self._coeffs.dtype.kind in "fc" and np.result_type(self._coeffs, c) == self._coeffs.dtype:
+                    self._coeffs /= c
+                else:
+                    self._coeffs = self._coeffs / c
+            else:
+                for i in range(len(self._coeffs)):
+                    self._coeffs[i] = self._coeffs[i] / c
+            return self._normalize_in_place()
+        quotient, _ = Polynomial._divider.divmod(self._coefficient_list(), other._coefficient_list(), mode="true")
+        return self._assign(quotient, other)
+
+    # Вспомогательные методы операций на месте (не создают новых объектов)
+    def _combine_in_place(self, other, subtract):
+        """
+        @brief Прибавляет (вычитает) коэффициенты other к текущему буферу.
+        @details Буфер заменяется новым только если other длиннее или тип
+                 элементов массива NumPy должен измениться.
+        """
+        if not isinstance(other, Polynomial):
+            return NotImplemented
+        self._field = self._common_field(other)
+        if other._storage == Polynomial.STORAGE_SPARSE:
+            terms = list(other._nonzero_terms())
+            size = terms[-1][0] + 1 if terms else 0
+        else:
+            terms = None
+            size = len(other._coeffs)
+
+        if self._uses_numpy(other):
+            a = self._coeffs if self._storage == Polynomial.STORAGE_NUMPY else np.array(self._coeffs)
+            if terms is None:
+                exps, values = None, np.asarray(other._coeffs)
+            else:
+                exps = np.array([exp for exp, _ in terms], dtype=np.intp)
+                values = np.array([coef for _, coef in terms])
+            dtype = _sum_dtype(a, values) if values.size else a.dtype
+            if size > a.size or dtype != a.dtype:
+                grown = np.zeros(max(size, a.size), dtype=dtype)
+                grown[:a.size] = a
+                a = grown
+            if exps is None:
+                target = a[:size]  # Представление: операция выполняется в буфере a
+                if subtract:
+                    target -= values
+                else:
+                    target += values
+            elif subtract:
+                a[exps] -= values
+            else:
+                a[exps] += values
+            self._coeffs = a
+            self._storage = Polynomial.STORAGE_NUMPY
+        else:
+            a = self._coeffs
+            if size > len(a):
+                a.extend([0] * (size - len(a)))
+            items = enumerate(other._coeffs) if terms is None else terms
+            if subtract:
+                for exp, coef in items:
+                    a[exp] -= coef
+            else:
+                for exp, coef in items:
+                    a[exp] += coef
+        return self._normalize_in_place()
+
+    def _normalize_in_place(self):
+        """Приводит коэффициенты к полю и удаляет ведущие нули без копирования."""
+        if self._field is not None:
+            self._coeffs = self._field.reduce_in_place(self._coeffs)
+        if self._storage == Polynomial.STORAGE_NUMPY:
+            self._coeffs = _trim_array(self._coeffs)
+        else:
+            while len(self._coeffs) > 1 and self._coeffs[-1] == 0:
+                self._coeffs.pop()
+        self._degree = len(self._coeffs) - 1
         return self
 
+    def _assign(self, coeffs, other=None):
+        """
+        @brief Записывает в текущий объект результат операции над self и other.
+        @details Аналог _wrap, изменяющий self вместо создания нового многочлена.
+        """
+        self._field = self._common_field(other)
+        if self._uses_numpy(other):
+            self._coeffs = np.asarray(coeffs)
+            self._storage = Polynomial.STORAGE_NUMPY
+        else:
+            self._coeffs = PolynomialDivider._as_list(coeffs)
+        return self._normalize_in_place()
+
     def __repr__(self):
         """
         @brief Строковое представление многочлена.
         """
         terms = []
-        for exp, coef in enumerate(self._coeffs):
-            if coef == 0:
-                continue
+        for exp, coef in self._nonzero_terms():
             term = str(coef)
             if exp > 0:
                 term += "*x"
@@ -0,0 +1,283 @@
+import numbers
+from itertools import chain
+
+try:
+    import numpy as np
+except ImportError:  # NumPy - необязательная зависимость
+    np = None
+
+from Polynomial import Polynomial
+from PolynomialRoots import PolynomialRoots
+
+
+class PolynomialArray:
+    """
+    @brief Набор многочленов, хранящийся одной матрицей коэффициентов.
+    @details Строка i матрицы - коэффициенты i-го многочлена (от младшей степени
+             к старшей), дополненные нулями до общей ширины. Сложение, умножение,
+             вычисление значений и дифференцирование выполняются векторными
+             операциями NumPy над всем набором сразу, без объектов Python на
+             каждый многочлен. Требует NumPy; коэффициенты - числа одного dtype
+             (переполнение целых int64 не контролируется), поля коэффициентов
+             не поддерживаются.
+    """
+
+    # Ширина (число коэффициентов), начиная с которой умножение идет через FFT
+    FFT_THRESHOLD = 64
+
+    def __init__(self, coeffs):
+        """
+        @brief Создает набор по матрице коэффициентов.
+        @param coeffs Двумерный массив (список списков одинаковой длины) формы
+               (число многочленов, ширина). Данные копируются.
+        """
+        if np is None:
+            raise ImportError("Для PolynomialArray требуется пакет NumPy")
+        coeffs = np.array(coeffs)
+        if coeffs.ndim != 2:
+            raise ValueError("Матрица коэффициентов должна быть двумерной")
+        if coeffs.dtype.kind not in "iufc":
+            raise TypeError("Коэффициенты должны быть числами")
+        self._coeffs = PolynomialArray._trim(coeffs)
+
+    @staticmethod
+    def _trim(matrix):
+        """Удаляет общие ведущие нулевые столбцы (ширина не меньше 1)."""
+        if matrix.shape[1] == 0:
+            return np.zeros((matrix.shape[0], 1), dtype=matrix.dtype)
+        nonzero = np.flatnonzero(matrix.any(axis=0))
+        width = nonzero[-1] + 1 if nonzero.size else 1
+        return matrix[:, :width]
+
+    @staticmethod
+    def _from_matrix(matrix):
+        """Создает набор из готовой матрицы без копирования."""
+        result = PolynomialArray.__new__(PolynomialArray)
+        result._coeffs = PolynomialArray._trim(matrix)
+        return result
+
+    @staticmethod
+    def from_polynomials(polynomials):
+        """
+        @brief Собирает набор из объектов Polynomial.
+        @details Коэффициенты всех многочленов укладываются в матрицу одним
+                 векторным разбросом по вычисленным позициям.
+        @param polynomials Итерируемый объект многочленов.
+        @return Новый PolynomialArray.
+        @throws ValueError для многочленов над полем коэффициентов.
+        """
+        if np is None:
+            raise ImportError("Для PolynomialArray требуется пакет NumPy")
+        rows = []
+        for p in polynomials:
+            if not isinstance(p, Polynomial):
+                raise TypeError("Ожидается объект Polynomial: {!r}".format(p))
+            if p.field is not None:
+                raise ValueError("PolynomialArray не поддерживает поля коэффициентов")
+            rows.append(p.coeffs_view if p.storage != Polynomial.STORAGE_SPARSE else p.coeffs)
+        lengths = np.array([len(row) for row in rows], dtype=np.intp)
+        width = int(lengths.max()) if len(rows) else 1
+        values = np.array(list(chain.from_iterable(rows)))
+        matrix = np.zeros((len(rows), max(width, 1)), dtype=values.dtype if values.size else np.int64)
+        if values.size:
+            offsets = np.repeat(np.cumsum(lengths) - lengths, lengths)
+            columns = np.arange(values.size) - offsets
+            matrix[np.repeat(np.arange(len(rows)), lengths), columns] = values
+        return PolynomialArray._from_matrix(matrix)
+
+    def to_polynomials(self, storage=None):
+        """
+        @brief Преобразует набор в список объектов Polynomial.
+        @param storage Режим хранения многочленов: "list" (по умолчанию) или "numpy".
+        @return Список многочленов.
+        """
+        if storage == Polynomial.STORAGE_NUMPY:
+            return [Polynomial(row, storage=storage) for row in self._coeffs]
+        return [Polynomial(row) for row in self._coeffs.tolist()]
+
+    # Управление доступом - свойства только для чтения
+    @property
+    def coeffs(self):
+        """@brief Копия матрицы коэффициентов."""
+        return self._coeffs.copy()
+
+    @property
+    def shape(self):
+        """@brief Форма матрицы коэффициентов (число многочленов, ширина)."""
+        return self._coeffs.shape
+
+    @property
+    def dtype(self):
+        """@brief Тип коэффициентов."""
+        return self._coeffs.dtype
+
+    @property
+    def degrees(self):
+        """@brief Массив степеней многочленов (нулевой многочлен имеет степень 0)."""
+        nonzero = self._coeffs != 0
+        width = self._coeffs.shape[1]
+        last = width - 1 - np.argmax(nonzero[:, ::-1], axis=1)
+        return np.where(nonzero.any(axis=1), last, 0)
+
+    def __len__(self):
+        return self._coeffs.shape[0]
+
+    def __getitem__(self, index):
+        """
+        @brief Многочлен по индексу или поднабор по срезу (маске, массиву индексов).
+        """
+        if isinstance(index, numbers.Integral):
+            return Polynomial(self._coeffs[index].tolist())
+        return PolynomialArray._from_matrix(self._coeffs[index])
+
+    def __iter__(self):
+        return iter(self.to_polynomials())
+
+    # Векторная арифметика
+    def _operand(self, other):
+        """Матрица второго операнда или None, если тип не поддерживается."""
+        if isinstance(other, PolynomialArray):
+            if len(other) not in (1, len(self)) and len(self) != 1:
+                raise ValueError("Несовместимые размеры наборов: {} и {}".format(len(self), len(other)))
+            return other._coeffs
+        if isinstance(other, Polynomial):
+            return np.asarray(other.coeffs)[np.newaxis, :]
+        return None
+
+    @staticmethod
+    def _pad(matrix, width):
+        """Дополняет матрицу нулевыми столбцами до ширины width."""
+        if matrix.shape[1] >= width:
+            return matrix
+        return np.pad(matrix, ((0, 0), (0, width - matrix.shape[1])))
+
+    def _combine(self, other, subtract):
+        b = self._operand(other)
+        if b is None:
+            return NotImplemented
+        width = max(self._coeffs.shape[1], b.shape[1])
+        a = PolynomialArray._pad(self._coeffs, width)
+        b = PolynomialArray._pad(b, width)
+        return PolynomialArray._from_matrix(a - b if subtract else a + b)
+
+    def __add__(self, other):
+        """
+        @brief Поэлементное сложение с набором (той же длины или длины 1) или многочленом.
+        """
+        return self._combine(other, subtract=False)
+
+    def __radd__(self, other):
+        return self._combine(other, subtract=False)
+
+    def __sub__(self, other):
+        """
+        @brief Поэлементное вычитание набора или многочлена.
+        """
+        return self._combine(other, subtract=True)
+
+    def __rsub__(self, other):
+        result = self._combine(other, subtract=True)
+        if result is NotImplemented:
+            return result
+        return PolynomialArray._from_matrix(-result._coeffs)
+
+    def __neg__(self):
+        return PolynomialArray._from_matrix(-self._coeffs)
+
+    def __mul__(self, other):
+        """
+        @brief Поэлементное умножение на набор, многочлен или скаляр.
+        @details Узкие многочлены перемножаются сдвиговым накоплением (одна векторная
+                 операция на столбец меньшего операнда), широкие - через FFT по
+                 строкам матрицы.
+        """
+        if isinstance(other, numbers.Number):
+            return PolynomialArray._from_matrix(self._coeffs * other)
+        b = self._operand(other)
+        if b is None:
+            return NotImplemented
+        return PolynomialArray._from_matrix(PolynomialArray._convolve_rows(self._coeffs, b))
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    @staticmethod
+    def _convolve_rows(a, b):
+        """Построчная свертка матриц (строки длины 1 распространяются на все строки)."""
+        rows = max(a.shape[0], b.shape[0])
+        width = a.shape[1] + b.shape[1] - 1
+        dtype = np.result_type(a, b)
+        if min(a.shape[1], b.shape[1]) >= PolynomialArray.FFT_THRESHOLD and dtype.kind in "iuf":
+            size = 1 << (width - 1).bit_length()
+            bound = np.abs(a).max() * np.abs(b).max() * min(a.shape[1], b.shape[1])
+            if dtype.kind == "f" or bound < 2 ** 50:
+                product = np.fft.irfft(np.fft.rfft(a, size) * np.fft.rfft(b, size), size)[:, :width]
+                return product if dtype.kind == "f" else np.rint(product).astype(dtype)
+        if a.shape[1] < b.shape[1]:
+            a, b = b, a
+        result = np.zeros((rows, width), dtype=dtype)
+        for j in range(b.shape[1]):
+            result[:, j:j + a.shape[1]] += a * b[:, j:j + 1]
+        return result
+
+    # Вычисление значений
+    def evaluate(self, x):
+        """
+        @brief Значения всех многочленов по схеме Горнера (одна операция на столбец).
+        @param x Общая точка (скаляр) или массив из len(self) точек - по одной
+               на многочлен.
+        @return Массив значений длины len(self).
+        """
+        x = np.asarray(x)
+        result = np.zeros(np.broadcast_shapes(x.shape, (len(self),)), dtype=np.result_type(self._coeffs, x))
+        for column in self._coeffs.T[::-1]:
+            result *= x
+            result += column
+        return result
+
+    def evaluate_many(self, xs):
+        """
+        @brief Значения всех многочленов во всех точках.
+        @param xs Одномерная последовательность точек.
+        @return Матрица формы (len(self), len(xs)).
+        """
+        xs = np.asarray(xs)
+        result = np.zeros((len(self), xs.size), dtype=np.result_type(self._coeffs, xs))
+        for column in self._coeffs.T[::-1]:
+            result *= xs
+            result += column[:, np.newaxis]
+        return result
+
+    def __call__(self, x):
+        return self.evaluate(x)
+
+    def derivative(self):
+        """
+        @brief Производные всех многочленов набора.
+        @return Новый PolynomialArray.
+        """
+        width = self._coeffs.shape[1]
+        if width == 1:
+            return PolynomialArray._from_matrix(np.zeros_like(self._coeffs))
+        return PolynomialArray._from_matrix(self._coeffs[:, 1:] * np.arange(1, width))
+
+    def roots(self, method="auto"):
+        """
+        @brief Корни всех многочленов набора (см. PolynomialRoots.batch).
+        @return Комплексный массив формы (len(self), наибольшая степень); у
+                многочленов меньшей степени лишние позиции заполнены nan.
+        """
+        return PolynomialRoots(method).batch(self._coeffs)
+
+    def __eq__(self, other):
+        """
+        @brief Наборы равны, если совпадают все многочлены.
+        """
+        if not isinstance(other, PolynomialArray):
+            return NotImplemented
+        return self._coeffs.shape == other._coeffs.shape and bool(np.array_equal(self._coeffs, other._coeffs))
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "PolynomialArray({} polynomials, width {})".format(*self._coeffs.shape)
@@ -0,0 +1,248 @@
+import cmath
+from contextlib import nullcontext
+from fractions import Fraction
+import numbers
+
+try:
+    import numpy as np
+except ImportError:  # NumPy - необязательная зависимость
+    np = None
+
+from PolynomialMultiplier import PolynomialMultiplier
+
+
+class PolynomialDivider:
+    """
+    @brief Деление многочленов с остатком над последовательностями коэффициентов.
+    @details Для малых степеней используется деление столбиком O(n*m). Если и
+             делитель, и частное длиннее NEWTON_THRESHOLD, частное float/complex
+             многочленов находится через обращение степенного ряда итерациями
+             Ньютона поверх быстрого умножения PolynomialMultiplier: O(M(n))
+             вместо O(n*m). Над float/complex обращение развернутого делителя
+             расходится, если у делителя есть корни вне единичного круга, поэтому
+             частное проверяется: старшие коэффициенты a - b*q (степени >= deg b)
+             должны быть нулями с относительной точностью NEWTON_TOLERANCE, иначе
+             частное пересчитывается делением столбиком. Для int и Fraction
+             остается деление столбиком:
+             коэффициенты обратного ряда над Z/Q растут линейно по длине записи,
+             и обращение оказывается медленнее даже при малом частном.
+
+             Режимы деления коэффициентов:
+             - "exact" - для целых и Fraction результат точный (int, если делится
+               нацело, иначе Fraction); используется операторами //, % и divmod;
+             - "true" - обычное деление "/" Python (целые -> float), как у
+               оператора /.
+             Нули распознаются точно для точных типов; для float/complex остаток
+             очищается от шума с относительной точностью FLOAT_TOLERANCE.
+    """
+
+    MODES = ("exact", "true")
+
+    # Минимальная длина делителя и частного для деления через обращение ряда
+    NEWTON_THRESHOLD = 64
+    # Относительная точность отбрасывания ведущих "нулей" остатка (float/complex)
+    FLOAT_TOLERANCE = 1e-12
+    # Допустимая относительная невязка старших коэффициентов a - b*q после Ньютона
+    NEWTON_TOLERANCE = 1e-9
+
+    def __init__(self, multiplier=None):
+        """
+        @brief Создает движок деления.
+        @param multiplier Движок умножения (по умолчанию - PolynomialMultiplier()).
+        """
+        self.multiplier = multiplier if multiplier is not None else PolynomialMultiplier()
+
+    def divmod(self, a, b, mode="exact", field=None):
+        """
+        @brief Делит многочлен a на многочлен b с остатком.
+        @param a Коэффициенты делимого (от младшей степени к старшей).
+        @param b Коэффициенты делителя.
+        @param mode Режим деления коэффициентов: "exact" или "true".
+        @param field Поле коэффициентов (CoefficientField). Если задано, деление и
+               умножение выполняются в нем, а mode игнорируется.
+        @return Пара списков (частное, остаток), deg(остаток) < deg(b).
+        @throws ZeroDivisionError при делении на нулевой многочлен.
+        """
+        if mode not in PolynomialDivider.MODES:
+            raise ValueError("Неизвестный режим деления: {}".format(mode))
+        if field is not None:
+            a = PolynomialDivider._as_list(field.convert_all(a))
+            b = PolynomialDivider._as_list(field.convert_all(b))
+        a = list(a)
+        b = PolynomialDivider._trim_exact(list(b))
+        if not b or (len(b) == 1 and b[0] == 0):
+            raise ZeroDivisionError("Деление на нулевой многочлен")
+        if not a:
+            a = [0]
+
+        if field is not None:
+            inexact = False
+            divide = field.div
+            multiply = lambda x, y: PolynomialDivider._as_list(field.multiply(x, y))
+            use_newton = field.bounded
+        else:
+            inexact = PolynomialMultiplier.coefficient_kind(a, b) in ("float", "complex")
+            divide = PolynomialDivider._true_div if mode == "true" or inexact else PolynomialDivider.exact_div
+            multiply = lambda x, y: PolynomialDivider._as_list(self.multiplier.multiply(x, y))
+            use_newton = inexact
+
+        n, m = len(a) - 1, len(b) - 1
+        if n < m:
+            quotient, remainder = [0], a
+        elif m == 0:
+            quotient, remainder = [divide(x, b[0]) for x in a], [0]
+        else:
+            quotient = None
+            if use_newton and min(m, n - m + 1) >= PolynomialDivider.NEWTON_THRESHOLD:
+                quotient, remainder = self._divide_checked(a, b, divide, multiply, inexact)
+            if quotient is None:
+                quotient, remainder = PolynomialDivider._divide_long(a, b, divide)
+
+        if field is not None:
+            quotient = PolynomialDivider._as_list(field.convert_all(quotient))
+            remainder = PolynomialDivider._as_list(field.convert_all(remainder))
+        quotient = PolynomialDivider._trim_exact(quotient)
+        if inexact and n >= m:
+            # Шум округления оценивается относительно величины делимого
+            scale = max(max(abs(x) for x in a), max(abs(x) for x in b) * max(abs(x) for x in quotient))
+            remainder = PolynomialDivider._trim_tolerance(remainder, scale)
+        return quotient, PolynomialDivider._trim_exact(remainder) or [0]
+
+    def inverse_series(self, f, precision, mode="exact"):
+        """
+        @brief Обращает степенной ряд f по модулю x^precision итерациями Ньютона.
+        @details g_{2k} = g_k - g_k * (f * g_k - 1) mod x^{2k}; каждая итерация
+                 удваивает число верных коэффициентов.
+        @param f Коэффициенты ряда (f[0] != 0).
+        @param precision Число вычисляемых коэффициентов.
+        @param mode Режим деления коэффициентов: "exact" или "true".
+        @return Список из precision коэффициентов g с f*g = 1 mod x^precision.
+        """
+        if not f or f[0] == 0:
+            raise ZeroDivisionError("Свободный член обращаемого ряда равен нулю")
+        inexact = PolynomialMultiplier.coefficient_kind(f) in ("float", "complex")
+        divide = PolynomialDivider._true_div if mode == "true" or inexact else PolynomialDivider.exact_div
+        multiply = lambda x, y: PolynomialDivider._as_list(self.multiplier.multiply(x, y))
+        return self._inverse(list(f), precision, divide, multiply)
+
+    @staticmethod
+    def _inverse(f, precision, divide, multiply):
+        """Обращение ряда с заданными функциями деления и умножения коэффициентов."""
+        g = [divide(1, f[0])]
+        length = 1
+        while length < precision:
+            length = min(2 * length, precision)
+            error = multiply(f[:length], g)[:length]
+            error[0] -= 1
+            correction = multiply(g, error)[:length]
+            g = g + [0] * (length - len(g))
+            for i in range(len(correction)):
+                g[i] -= correction[i]
+        return g[:precision]
+
+    def _divide_checked(self, a, b, divide, multiply, inexact):
+        """
+        @brief Деление через обращение ряда с проверкой частного.
+        @return Пара (частное, остаток) или (None, None), если над float/complex
+                невязка старших коэффициентов превышает NEWTON_TOLERANCE.
+        """
+        m = len(b) - 1
+        # Расходящееся обращение дает переполнения; результат все равно проверяется
+        with np.errstate(over="ignore", invalid="ignore") if np is not None and inexact else nullcontext():
+            quotient = PolynomialDivider._divide_newton(a, b, divide, multiply)
+            product = multiply(b, quotient)
+        if inexact:
+            if not all(map(cmath.isfinite, quotient)):
+                return None, None
+            scale = max(max(abs(x) for x in a), max(abs(x) for x in b) * max(abs(x) for x in quotient))
+            threshold = PolynomialDivider.NEWTON_TOLERANCE * scale
+            # Сравнение с nan ложно, поэтому nan в произведении тоже отклоняет частное
+            if not (cmath.isfinite(threshold) and
+                    all(abs(a[i] - product[i]) <= threshold for i in range(m, len(a)))):
+                return None, None
+        return quotient, [a[i] - product[i] for i in range(m)]
+
+    @staticmethod
+    def _divide_newton(a, b, divide, multiply):
+        """
+        @brief Частное через обращение развернутого делителя.
+        @details rev(q) = rev(a) * rev(b)^(-1) mod x^(n-m+1).
+        """
+        size = len(a) - len(b) + 1
+        reversed_b = b[::-1]
+        inverse = PolynomialDivider._inverse(reversed_b, size, divide, multiply)
+        reversed_q = multiply(a[::-1][:size], inverse)[:size]
+        reversed_q += [0] * (size - len(reversed_q))
+        return reversed_q[::-1]
+
+    @staticmethod
+    def _as_list(values):
+        """Список Python из списка или массива NumPy."""
+        return values.tolist() if hasattr(values, "tolist") else list(values)
+
+    @staticmethod
+    def _divide_long(a, b, divide):
+        """Деление столбиком; старший коэффициент обнуляется точно на каждом шаге."""
+        remainder = a[:]
+        m = len(b) - 1
+        lead = b[m]
+        quotient = [0] * (len(a) - m)
+        for shift in range(len(quotient) - 1, -1, -1):
+            coef = divide(remainder[m + shift], lead)
+            quotient[shift] = coef
+            if coef != 0:
+                for i in range(m):
+                    remainder[i + shift] -= coef * b[i]
+            remainder[m + shift] = 0
+        return quotient, remainder[:m]
+
+    @staticmethod
+    def exact_div(x, y):
+        """
+        @brief Точное деление коэффициентов.
+        @return x // y для нацело делящихся целых, Fraction(x, y) для прочих целых,
+                иначе x / y.
+        """
+        if isinstance(x, numbers.Integral) and isinstance(y, numbers.Integral):
+            x, y = int(x), int(y)
+            return x // y if x % y == 0 else Fraction(x, y)
+        return x / y
+
+    @staticmethod
+    def _true_div(x, y):
+        """Обычное деление Python."""
+        return x / y
+
+    @staticmethod
+    def _trim_exact(coeffs):
+        """Удаляет точные ведущие нули."""
+        while len(coeffs) > 1 and coeffs[-1] == 0:
+            coeffs.pop()
+        return coeffs
+
+    @staticmethod
+    def _trim_tolerance(coeffs, scale):
+        """Удаляет ведущие коэффициенты, не превышающие FLOAT_TOLERANCE * scale."""
+        threshold = PolynomialDivider.FLOAT_TOLERANCE * scale
+        while coeffs and abs(coeffs[-1]) <= threshold:
+            coeffs.pop()
+        return coeffs
+
+
+def poly_divmod(a, b, mode="exact"):
+    """
+    @brief Делит многочлены, заданные последовательностями коэффициентов, с остатком.
+
+    @param a Коэффициенты делимого (от младшей степени к старшей)
+    @param b Коэффициенты делителя
+    @param mode "exact" (точное деление для int/Fraction) или "true" (деление "/")
+
+    @return Пара списков (частное, остаток)
+
+    @throws ZeroDivisionError при делении на нулевой многочлен
+
+    @code
+    poly_divmod([5, 1, 3, 2], [1, 1])  # ([0, 1, 2], [5])
+    @endcode
+    """
+    return PolynomialDivider().divmod(a, b, mode=mode)
@@ -0,0 +1,450 @@
+import functools
+import numbers
+
+try:
+    import numpy as np
+except ImportError:  # NumPy - необязательная зависимость
+    np = None
+
+
+class PolynomialMultiplier:
+    """
+    @brief Движок умножения (свертки) последовательностей коэффициентов многочленов.
+    @details Алгоритм выбирается автоматически по размеру и типу коэффициентов:
+             - "schoolbook" - наивное умножение O(n*m) для малых входов;
+             - "karatsuba" - метод Карацубы O(n^1.59), точный для любого кольца;
+             - "fft" - свертка через БПФ O(n log n) для float/complex коэффициентов;
+             - "ntt" - теоретико-числовое преобразование по трем простым модулям
+               с восстановлением по китайской теореме об остатках, точное для int.
+             Пороги подобраны по результатам benchmarks/BenchMultiplication.py.
+    """
+
+    METHODS = ("auto", "schoolbook", "karatsuba", "fft", "ntt")
+
+    # Длина меньшего операнда, до которой выгоднее наивное умножение
+    SCHOOLBOOK_THRESHOLD = 32
+    # Длина меньшего операнда, начиная с которой используется БПФ (float/complex)
+    FFT_THRESHOLD = 64
+    # Длина меньшего операнда, начиная с которой используется NTT (int)
+    NTT_THRESHOLD = 384
+
+    # Простые вида c*2^k+1 с первообразным корнем 3; произведение ~2^86
+    NTT_PRIMES = (998244353, 167772161, 469762049)
+    NTT_ROOT = 3
+    # Наибольшая длина NTT: корень порядка length существует, только если length
+    # делит p-1 для всех модулей; наименьшая степень двойки - у 998244353 = 119*2^23+1
+    NTT_MAX_SIZE = 1 << 23
+
+    def __init__(self, method="auto"):
+        """
+        @brief Создает движок умножения.
+        @param method Алгоритм: "auto" (выбор по размеру) или имя конкретного алгоритма.
+        """
+        if method not in PolynomialMultiplier.METHODS:
+            raise ValueError("Неизвестный алгоритм умножения: {}".format(method))
+        if method in ("fft", "ntt") and np is None:
+            raise ImportError("Алгоритм '{}' требует пакет NumPy".format(method))
+        self.method = method
+
+    def multiply(self, a, b):
+        """
+        @brief Вычисляет свертку двух последовательностей коэффициентов.
+        @param a Коэффициенты первого многочлена (список, кортеж или массив NumPy).
+        @param b Коэффициенты второго многочлена.
+        @return Коэффициенты произведения: массив NumPy, если хотя бы один вход -
+                массив, иначе список.
+        """
+        as_array = np is not None and (isinstance(a, np.ndarray) or isinstance(b, np.ndarray))
+        if len(a) == 0 or len(b) == 0:
+            return np.array([]) if as_array else []
+
+        method = self.method
+        if method == "auto":
+            method = self.select_method(a, b)
+        elif method == "ntt" and PolynomialMultiplier.coefficient_kind(a, b) != "int":
+            raise ValueError("Алгоритм 'ntt' применим только к целочисленным коэффициентам")
+
+        if method == "schoolbook":
+            if as_array and PolynomialMultiplier._convolve_is_exact(np.asarray(a), np.asarray(b)):
+                return np.convolve(np.asarray(a), np.asarray(b))
+            result = self._schoolbook(PolynomialMultiplier._as_list(a), PolynomialMultiplier._as_list(b))
+        elif method == "karatsuba":
+            result = self._karatsuba(PolynomialMultiplier._as_list(a), PolynomialMultiplier._as_list(b))
+        elif method == "fft":
+            result = self._fft(np.asarray(a), np.asarray(b))
+            return result if as_array else result.tolist()
+        else:
+            result = self._ntt_multiply(a, b)
+            if result is None:  # Результат не помещается в модули NTT
+                result = self._karatsuba(list(a), list(b))
+        return np.array(result) if as_array else result
+
+    def select_method(self, a, b):
+        """
+        @brief Выбирает алгоритм умножения по размеру и типу коэффициентов.
+        @param a Коэффициенты первого многочлена.
+        @param b Коэффициенты второго многочлена.
+        @return Имя алгоритма.
+        """
+        size = min(len(a), len(b))
+        if size <= PolynomialMultiplier.SCHOOLBOOK_THRESHOLD:
+            return "schoolbook"
+        if np is not None and size >= PolynomialMultiplier.FFT_THRESHOLD:
+            kind = PolynomialMultiplier.coefficient_kind(a, b)
+            if kind in ("float", "complex"):
+                return "fft"
+            if kind == "int" and size >= PolynomialMultiplier.NTT_THRESHOLD:
+                return "ntt"
+        if np is not None and (isinstance(a, np.ndarray) or isinstance(b, np.ndarray)):
+            # Свертка в C быстрее рекурсии Карацубы над скалярами NumPy
+            if PolynomialMultiplier.coefficient_kind(a, b) != "other":
+                return "schoolbook"
+        return "karatsuba"
+
+    @staticmethod
+    def _convolve_is_exact(a, b):
+        """
+        @brief Проверяет, что np.convolve над массивами не потеряет точность.
+        @details Целочисленная свертка в int64 переполняется молча, поэтому
+                 допускается, только если max|a| * max|b| * min(len) < 2^63 -
+                 та же оценка модуля коэффициентов, что и у пути NTT.
+        """
+        if a.dtype.kind not in "biu" or b.dtype.kind not in "biu":
+            return a.dtype != object and b.dtype != object
+        if a.dtype.kind == "b" or b.dtype.kind == "b":
+            return False  # Свертка bool в NumPy - логическая, а не целочисленная
+
+        def magnitude(values):
+            return max(abs(int(values.min())), abs(int(values.max())))
+
+        return magnitude(a) * magnitude(b) * min(len(a), len(b)) < 1 << 63
+
+    @staticmethod
+    def _as_list(values):
+        """Список коэффициентов; элементы массивов NumPy - числа Python (точная арифметика)."""
+        if np is not None and isinstance(values, np.ndarray):
+            return values.tolist()
+        return list(values)
+
+    @staticmethod
+    def coefficient_kind(*sequences):
+        """
+        @brief Определяет общий вид коэффициентов нескольких последовательностей.
+        @return "int", "float", "complex" или "other" (Fraction, Decimal и т.п.).
+        """
+        rank = {"int": 0, "float": 1, "complex": 2, "other": 3}
+        kind = "int"
+        for seq in sequences:
+            if np is not None and isinstance(seq, np.ndarray) and seq.dtype != object:
+                seq_kind = {"b": "int", "i": "int", "u": "int",
+                            "f": "float", "c": "complex"}.get(seq.dtype.kind, "other")
+            else:
+                seq_kind = "int"
+                for value in seq:
+                    if isinstance(value, numbers.Integral):
+                        continue
+                    if isinstance(value, float) or (np is not None and isinstance(value, np.floating)):
+                        seq_kind = "float" if seq_kind == "int" else seq_kind
+                    elif isinstance(value, complex) or (np is not None and isinstance(value, np.complexfloating)):
+                        seq_kind = "complex"
+                    else:
+                        seq_kind = "other"
+                        break
+            if rank[seq_kind] > rank[kind]:
+                kind = seq_kind
+        return kind
+
+    # Наивное умножение
+    @staticmethod
+    def _schoolbook(a, b):
+        """Наивное умножение O(n*m)."""
+        result = [0] * (len(a) + len(b) - 1)
+        for i, x in enumerate(a):
+            if x == 0:
+                continue
+            for j, y in enumerate(b):
+                result[i + j] += x * y
+        return result
+
+    # Метод Карацубы
+    def _karatsuba(self, a, b):
+        """
+        @brief Умножение методом Карацубы над произвольным кольцом коэффициентов.
+        @details Несбалансированные входы разбиваются на блоки длины меньшего операнда.
+        """
+        if len(a) < len(b):
+            a, b = b, a
+        n, m = len(a), len(b)
+        if m <= PolynomialMultiplier.SCHOOLBOOK_THRESHOLD:
+            return self._schoolbook(a, b)
+
+        result = [0] * (n + m - 1)
+        if n >= 2 * m:
+            for start in range(0, n, m):
+                PolynomialMultiplier._add_into(result, self._karatsuba(a[start:start + m], b), start)
+            return result
+
+        half = n // 2  # m > half, поэтому b1 не пуст
+        a0, a1 = a[:half], a[half:]
+        b0, b1 = b[:half], b[half:]
+        z0 = self._karatsuba(a0, b0)
+        z2 = self._karatsuba(a1, b1)
+        z1 = self._karatsuba(PolynomialMultiplier._sum(a0, a1), PolynomialMultiplier._sum(b0, b1))
+        for i, value in enumerate(z0):
+            z1[i] -= value
+        for i, value in enumerate(z2):
+            z1[i] -= value
+
+        PolynomialMultiplier._add_into(result, z0, 0)
+        PolynomialMultiplier._add_into(result, z1, half)
+        PolynomialMultiplier._add_into(result, z2, 2 * half)
+        return result
+
+    @staticmethod
+    def _sum(a, b):
+        """Поэлементная сумма списков разной длины."""
+        if len(a) < len(b):
+            a, b = b, a
+        result = a[:]
+        for i, value in enumerate(b):
+            result[i] += value
+        return result
+
+    @staticmethod
+    def _add_into(target, values, offset):
+        """Прибавляет values к target начиная с позиции offset (длина target достаточна)."""
+        for i, value in enumerate(values):
+            if i + offset < len(target):
+                target[i + offset] += value
+
+    # Быстрое преобразование Фурье
+    @staticmethod
+    def _fft(a, b):
+        """Свертка вещественных или комплексных массивов через БПФ."""
+        length = len(a) + len(b) - 1
+        size = 1 << (length - 1).bit_length()
+        if np.iscomplexobj(a) or np.iscomplexobj(b):
+            spectrum = np.fft.fft(a, size) * np.fft.fft(b, size)
+            return np.fft.ifft(spectrum)[:length]
+        spectrum = np.fft.rfft(a, size) * np.fft.rfft(b, size)
+        return np.fft.irfft(spectrum, size)[:length]
+
+    # Теоретико-числовое преобразование
+    def _ntt_multiply(self, a, b):
+        """
+        @brief Точное умножение целочисленных многочленов через NTT по трем модулям.
+        @details Если длина преобразования превышает NTT_MAX_SIZE, свертка
+                 считается блоками (см. _blockwise).
+        @return Список целых чисел Python или None, если коэффициенты результата
+                могут превысить диапазон восстановления по КТО.
+        """
+        a_values = [int(x) for x in a]
+        b_values = [int(x) for x in b]
+        bound = max(abs(x) for x in a_values) * max(abs(x) for x in b_values) * min(len(a), len(b))
+        if 2 * bound >= PolynomialMultiplier._ntt_modulus():
+            return None
+
+        length = len(a_values) + len(b_values) - 1
+        if PolynomialMultiplier._ntt_size(length) <= PolynomialMultiplier.NTT_MAX_SIZE:
+            return self._ntt_exact(a_values, b_values)
+        result = [0] * length
+        self._blockwise(a_values, b_values, self._ntt_exact,
+                        lambda part, offset: PolynomialMultiplier._add_into(result, part, offset))
+        return result
+
+    def _ntt_exact(self, a_values, b_values):
+        """Свертка целых чисел одним NTT по трем модулям (границы уже проверены)."""
+        length = len(a_values) + len(b_values) - 1
+        modulus = PolynomialMultiplier._ntt_modulus()
+        residues = [self.convolve_mod(a_values, b_values, prime) for prime in PolynomialMultiplier.NTT_PRIMES]
+        values = PolynomialMultiplier._garner(residues)[:length]
+        half = modulus // 2
+        return [x - modulus if x > half else x for x in values]
+
+    @staticmethod
+    def _blockwise(a, b, convolve, accumulate):
+        """
+        @brief Свертка блоками длины NTT_MAX_SIZE / 2.
+        @details Свертка двух блоков короче NTT_MAX_SIZE, поэтому каждое
+                 преобразование допустимо; частичные свертки передаются в
+                 accumulate(part, offset).
+        """
+        block = PolynomialMultiplier.NTT_MAX_SIZE // 2
+        for i in range(0, len(a), block):
+            for j in range(0, len(b), block):
+                accumulate(convolve(a[i:i + block], b[j:j + block]), i + j)
+
+    @staticmethod
+    def _ntt_modulus():
+        """Произведение модулей NTT_PRIMES."""
+        modulus = 1
+        for prime in PolynomialMultiplier.NTT_PRIMES:
+            modulus *= prime
+        return modulus
+
+    @staticmethod
+    def _ntt_size(length):
+        """Длина преобразования (степень двойки) для свертки длины length."""
+        return 1 << (length - 1).bit_length()
+
+    def convolve_mod(self, a, b, prime):
+        """
+        @brief Свертка по модулю NTT-простого числа (результат в диапазоне [0, prime)).
+        @param a Коэффициенты первого многочлена (целые числа).
+        @param b Коэффициенты второго многочлена (целые числа).
+        @param prime Один из модулей NTT_PRIMES.
+        @return Массив NumPy int64 длины len(a) + len(b) - 1.
+        @throws ValueError, если длина преобразования больше NTT_MAX_SIZE.
+        """
+        length = len(a) + len(b) - 1
+        size = PolynomialMultiplier._ntt_size(length)
+        if size > PolynomialMultiplier.NTT_MAX_SIZE:
+            raise ValueError("Длина NTT {} превышает допустимую {}".format(size, PolynomialMultiplier.NTT_MAX_SIZE))
+        fa = PolynomialMultiplier._ntt(PolynomialMultiplier._to_residues(a, prime, size), prime, False)
+        fb = PolynomialMultiplier._ntt(PolynomialMultiplier._to_residues(b, prime, size), prime, False)
+        return PolynomialMultiplier._ntt(fa * fb % prime, prime, True)[:length]
+
+    @staticmethod
+    def _to_residues(values, prime, size):
+        """Приводит целые числа по модулю prime и дополняет нулями до длины size."""
+        result = np.zeros(size, dtype=np.int64)
+        if np is not None and isinstance(values, np.ndarray) and values.dtype.kind in "iu":
+            result[:len(values)] = values % prime
+        else:
+            result[:len(values)] = [x % prime for x in values]
+        return result
+
+    @staticmethod
+    def _ntt(values, prime, invert):
+        """
+        @brief Итеративное NTT (Кули-Тьюки), каждый уровень - векторная операция.
+        @details Все промежуточные произведения меньше prime^2 < 2^60 и помещаются в int64.
+        """
+        size = len(values)
+        reversed_index, twiddle_table = PolynomialMultiplier._ntt_tables(prime, size, invert)
+        data = values[reversed_index]
+
+        length = 2
+        for twiddles in twiddle_table:
+            half = length // 2
+            blocks = data.reshape(-1, length)
+            upper = blocks[:, :half].copy()
+            lower = blocks[:, half:] * twiddles % prime
+            blocks[:, :half] = (upper + lower) % prime
+            blocks[:, half:] = (upper - lower) % prime
+            length <<= 1
+
+        if invert:
+            data = data * pow(size, prime - 2, prime) % prime
+        return data
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _ntt_tables(prime, size, invert):
+        """
+        @brief Перестановка бит-реверса и степени корней для NTT длины size (кэшируются).
+        @return Пара (индексы перестановки, кортеж массивов поворотных множителей по уровням).
+        """
+        bits = size.bit_length() - 1
+        index = np.arange(size)
+        reversed_index = np.zeros(size, dtype=np.int64)
+        for bit in range(bits):
+            reversed_index |= ((index >> bit) & 1) << (bits - 1 - bit)
+        twiddle_table = []
+        length = 2
+        while length <= size:
+            root = pow(PolynomialMultiplier.NTT_ROOT, (prime - 1) // length, prime)
+            if invert:
+                root = pow(root, prime - 2, prime)
+            twiddle_table.append(PolynomialMultiplier._powers_mod(root, length // 2, prime))
+            length <<= 1
+        # Таблицы разделяются между вызовами - защищаем их от записи
+        for table in [reversed_index] + twiddle_table:
+            table.setflags(write=False)
+        return reversed_index, tuple(twiddle_table)
+
+    @staticmethod
+    def _powers_mod(base, count, prime):
+        """Массив base^0 .. base^(count-1) по модулю prime (удвоением длины)."""
+        powers = np.ones(1, dtype=np.int64)
+        while len(powers) < count:
+            step = pow(base, len(powers), prime)
+            powers = np.concatenate((powers, powers * step % prime))
+        return powers[:count]
+
+    @staticmethod
+    def _garner_digits(residues):
+        """
+        @brief Смешанные цифры Гарнера: x = x12 + p1*p2*t3, где x12 = r1 + p1*t2.
+        @return Пара массивов int64 (x12, t3).
+        """
+        p1, p2, p3 = PolynomialMultiplier.NTT_PRIMES
+        r1, r2, r3 = residues
+        t2 = (r2 - r1) % p2 * pow(p1, -1, p2) % p2
+        x12 = r1 + p1 * t2  # < p1*p2 < 2^63
+        t3 = (r3 - x12 % p3) % p3 * pow(p1 * p2 % p3, -1, p3) % p3
+        return x12, t3
+
+    @staticmethod
+    def _garner(residues):
+        """
+        @brief Восстановление по китайской теореме об остатках (алгоритм Гарнера).
+        @return Список целых чисел Python в диапазоне [0, p1*p2*p3).
+        """
+        p1, p2, _ = PolynomialMultiplier.NTT_PRIMES
+        x12, t3 = PolynomialMultiplier._garner_digits(residues)
+        p12 = p1 * p2
+        return [x + p12 * t for x, t in zip(x12.tolist(), t3.tolist())]
+
+    def convolve_mod_any(self, a, b, modulus):
+        """
+        @brief Свертка по произвольному модулю < 2^31 через NTT по трем модулям.
+        @details Точная свертка восстанавливается по КТО сразу по модулю modulus
+                 векторными операциями int64 (без целых чисел Python). Если длина
+                 преобразования превышает NTT_MAX_SIZE, свертка считается блоками.
+        @param a Коэффициенты первого многочлена (целые числа в [0, modulus)).
+        @param b Коэффициенты второго многочлена (целые числа в [0, modulus)).
+        @param modulus Модуль результата.
+        @return Массив NumPy int64 или None, если точная свертка может превысить
+                диапазон восстановления по КТО.
+        """
+        if min(len(a), len(b)) * (modulus - 1) ** 2 >= PolynomialMultiplier._ntt_modulus() or modulus >= 1 << 31:
+            return None
+        length = len(a) + len(b) - 1
+        if PolynomialMultiplier._ntt_size(length) <= PolynomialMultiplier.NTT_MAX_SIZE:
+            return self._convolve_mod_exact(a, b, modulus)
+        result = np.zeros(length, dtype=np.int64)
+
+        def accumulate(part, offset):
+            window = result[offset:offset + len(part)]
+            window += part
+            window %= modulus
+
+        self._blockwise(a, b, lambda x, y: self._convolve_mod_exact(x, y, modulus), accumulate)
+        return result
+
+    def _convolve_mod_exact(self, a, b, modulus):
+        """Свертка по модулю modulus одним NTT по трем модулям (границы уже проверены)."""
+        if modulus in PolynomialMultiplier.NTT_PRIMES:
+            return self.convolve_mod(a, b, modulus)
+        residues = [self.convolve_mod(a, b, prime) for prime in PolynomialMultiplier.NTT_PRIMES]
+        p1, p2, _ = PolynomialMultiplier.NTT_PRIMES
+        x12, t3 = PolynomialMultiplier._garner_digits(residues)
+        return (x12 % modulus + (p1 * p2 % modulus) * t3) % modulus
+
+
+def multiply(a, b, method="auto"):
+    """
+    @brief Умножает многочлены, заданные последовательностями коэффициентов.
+
+    @param a Коэффициенты первого многочлена (от младшей степени к старшей)
+    @param b Коэффициенты второго многочлена
+    @param method Алгоритм: "auto", "schoolbook", "karatsuba", "fft" или "ntt"
+
+    @return Коэффициенты произведения
+
+    @code
+    multiply([1, 1], [1, -1])  # [1, 0, -1]
+    @endcode
+    """
+    return PolynomialMultiplier(method=method).multiply(a, b)
@@ -0,0 +1,230 @@
+try:
+    import numpy as np
+except ImportError:  # NumPy - необязательная зависимость
+    np = None
+
+
+class PolynomialRoots:
+    """
+    @brief Поиск всех комплексных корней многочленов, в том числе пакетами.
+    @details Для степеней до COMPANION_MAX_DEGREE корни - собственные значения
+             сопровождающей (companion) матрицы: матрицы всех многочленов одной
+             степени обрабатываются одним вызовом np.linalg.eigvals над стеком
+             (n, d, d). Для больших степеней используется итерация Аберта-Эрлиха:
+             все корни всех многочленов уточняются одновременно векторными
+             операциями, сходящиеся корни замораживаются (контроль сходимости по
+             относительной поправке TOLERANCE, не более MAX_ITERATIONS итераций).
+             Нулевые младшие коэффициенты отделяются как точные нулевые корни.
+             Требует NumPy.
+    """
+
+    METHODS = ("auto", "companion", "aberth")
+
+    # Наибольшая степень, для которой в режиме "auto" используется сопровождающая матрица
+    COMPANION_MAX_DEGREE = 128
+    # Относительная поправка, при которой корень считается найденным
+    TOLERANCE = 1e-12
+    # Наибольшее число итераций Аберта-Эрлиха
+    MAX_ITERATIONS = 200
+    # Допустимый рост |z|^d в битах, после которого p(z) вычисляется через 1/z
+    OVERFLOW_BITS = 512
+    # Ограничение числа элементов (многочлены * d^2) в одном блоке итерации Аберта
+    ABERTH_BLOCK = 1 << 22
+
+    def __init__(self, method="auto"):
+        """
+        @brief Создает решатель.
+        @param method Метод: "auto", "companion" или "aberth".
+        """
+        if np is None:
+            raise ImportError("Для поиска корней требуется пакет NumPy")
+        if method not in PolynomialRoots.METHODS:
+            raise ValueError("Неизвестный метод поиска корней: {}".format(method))
+        self.method = method
+
+    def select_method(self, degree):
+        """
+        @brief Выбирает метод для многочленов степени degree.
+        """
+        if self.method != "auto":
+            return self.method
+        return "companion" if degree <= PolynomialRoots.COMPANION_MAX_DEGREE else "aberth"
+
+    def roots(self, coeffs):
+        """
+        @brief Корни одного многочлена.
+        @param coeffs Коэффициенты (от младшей степени к старшей).
+        @return Одномерный комплексный массив из deg корней (с учетом кратности).
+        @throws ValueError для нулевого многочлена.
+        """
+        return self.batch(np.asarray(coeffs)[np.newaxis, :])[0]
+
+    def batch(self, matrix):
+        """
+        @brief Корни набора многочленов.
+        @param matrix Двумерный массив коэффициентов формы (n, ширина), строки
+               дополнены нулями (см. PolynomialArray).
+        @return Комплексный массив формы (n, наибольшая степень); у многочленов
+                меньшей степени лишние позиции заполнены nan.
+        @throws ValueError, если среди строк есть нулевой многочлен.
+        """
+        matrix = np.asarray(matrix)
+        if matrix.ndim != 2:
+            raise ValueError("Матрица коэффициентов должна быть двумерной")
+        nonzero = matrix != 0
+        if not nonzero.any(axis=1).all():
+            raise ValueError("Нулевой многочлен не имеет конечного множества корней")
+        degrees = matrix.shape[1] - 1 - np.argmax(nonzero[:, ::-1], axis=1)
+        # Нулевые младшие коэффициенты дают точные нулевые корни: x^s * g(x)
+        shifts = np.argmax(nonzero, axis=1)
+        reduced = degrees - shifts
+        max_degree = int(degrees.max()) if degrees.size else 0
+        result = np.full((matrix.shape[0], max_degree), np.nan, dtype=complex)
+        filled = np.arange(max_degree) < degrees[:, np.newaxis]
+        result[filled] = 0
+        kind = complex if matrix.dtype.kind == "c" else float
+        for degree in np.unique(reduced).tolist():
+            if degree == 0:
+                continue
+            rows = np.flatnonzero(reduced == degree)
+            columns = shifts[rows, np.newaxis] + np.arange(degree + 1)
+            coeffs = matrix[rows[:, np.newaxis], columns].astype(kind)
+            # Нормируем к приведенному виду: x^d + a_{d-1} x^{d-1} + ... + a_0
+            monic = coeffs[:, :degree] / coeffs[:, degree:]
+            if degree == 1:
+                found = -monic
+            elif self.select_method(degree) == "companion":
+                found = PolynomialRoots._companion(monic)
+            else:
+                found = PolynomialRoots._aberth(monic.astype(complex))
+            result[rows, :degree] = found
+        return result
+
+    @staticmethod
+    def _companion(monic):
+        """Собственные значения стека сопровождающих матриц (n, d, d)."""
+        count, degree = monic.shape
+        companion = np.zeros((count, degree, degree), dtype=monic.dtype)
+        companion[:, np.arange(1, degree), np.arange(degree - 1)] = 1
+        companion[:, :, -1] = -monic
+        return np.linalg.eigvals(companion)
+
+    @staticmethod
+    def _aberth(monic):
+        """Итерация Аберта-Эрлиха блоками строк ограниченного размера."""
+        count, degree = monic.shape
+        block = max(1, PolynomialRoots.ABERTH_BLOCK // (degree * degree))
+        return np.concatenate([PolynomialRoots._aberth_block(monic[start:start + block])
+                               for start in range(0, count, block)])
+
+    @staticmethod
+    def _aberth_block(monic):
+        """
+        @brief Одновременное уточнение всех корней блока многочленов.
+        @details z_k -= w_k, w_k = (p/p')(z_k) / (1 - (p/p')(z_k) * sum_{j!=k} 1/(z_k - z_j)).
+        """
+        count, degree = monic.shape
+        # Начальные приближения - на окружности радиуса |a_0|^(1/d) (среднее
+        # геометрическое модулей корней)
+        radius = np.abs(monic[:, 0]) ** (1.0 / degree)
+        radius[radius == 0] = 1.0
+        angles = 2 * np.pi * np.arange(degree) / degree + 0.4
+        z = radius[:, np.newaxis] * np.exp(1j * angles)
+        # Столбцы коэффициентов от старшего к младшему, непрерывно в памяти
+        columns = np.ascontiguousarray(monic.T[::-1])
+        active = np.ones(z.shape, dtype=bool)
+
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            for _ in range(PolynomialRoots.MAX_ITERATIONS):
+                rows = np.flatnonzero(active.any(axis=1))
+                if rows.size == 0:
+                    break
+                # Пока активны почти все строки, работаем со всем блоком без выборки
+                subset = rows.size < count // 2
+                zr = z[rows] if subset else z
+                # Схема Горнера для p (старший коэффициент 1) и p' одновременно
+                value = np.ones(zr.shape, dtype=complex)
+                slope = np.zeros(zr.shape, dtype=complex)
+                for column in columns:
+                    slope *= zr
+                    slope += value
+                    value *= zr
+                    value += (column[rows] if subset else column)[:, np.newaxis]
+                ratio = value / slope
+                vanished = value == 0
+                magnitude = np.abs(zr)
+                if degree * np.log2(max(magnitude.max(), 1.0)) > PolynomialRoots.OVERFLOW_BITS:
+                    # Вне единичного круга z^d может переполниться: p/p' вычисляется
+                    # через развернутый многочлен q(w) = w^d p(1/w), w = 1/z:
+                    # p'/p = (d - w q'(w) / q(w)) / z
+                    outside = magnitude > 1
+                    owner = np.nonzero(outside)[0]
+                    w = 1 / zr[outside]
+                    reversed_coeffs = (monic[rows] if subset else monic)[owner]
+                    q_value = reversed_coeffs[:, 0].copy()
+                    q_slope = np.zeros(w.shape, dtype=complex)
+                    for k in range(1, degree + 1):
+                        q_slope = q_slope * w + q_value
+                        q_value = q_value * w + (reversed_coeffs[:, k] if k < degree else 1)
+                    ratio[outside] = zr[outside] / (degree - w * q_slope / q_value)
+                    vanished[outside] = q_value == 0
+                repulsion = np.zeros(zr.shape, dtype=complex)
+                for j in range(degree):
+                    difference = zr - zr[:, j:j + 1]
+                    difference[:, j] = np.inf  # Исключаем слагаемое j = k
+                    np.reciprocal(difference, out=difference)
+                    repulsion += difference
+                repulsion *= ratio
+                np.subtract(1, repulsion, out=repulsion)
+                step = np.divide(ratio, repulsion, out=ratio)
+                step[vanished] = 0
+                # Вырожденные шаги (p' = 0, совпавшие приближения) - малое возмущение
+                broken = ~np.isfinite(step)
+                step[broken] = 1e-8 * (1 + np.abs(zr[broken]))
+                still = active[rows] if subset else active
+                step[~still] = 0
+                converged = np.abs(step) <= PolynomialRoots.TOLERANCE * np.maximum(1, np.abs(zr))
+                if subset:
+                    z[rows] = zr - step
+                    active[rows] = still & ~converged
+                else:
+                    z -= step
+                    active &= ~converged
+        return z
+
+
+def roots(coeffs, method="auto"):
+    """
+    @brief Находит все комплексные корни многочлена.
+
+    @param coeffs Коэффициенты (от младшей степени к старшей)
+    @param method "auto", "companion" или "aberth"
+
+    @return Комплексный массив NumPy корней (с учетом кратности)
+
+    @code
+    roots([-1, 0, 1])  # array([ 1.+0.j, -1.+0.j])
+    @endcode
+    """
+    return PolynomialRoots(method).roots(coeffs)
+
+
+def batch_roots(polynomials, method="auto"):
+    """
+    @brief Находит корни набора многочленов.
+
+    @param polynomials PolynomialArray, последовательность Polynomial или
+           двумерный массив коэффициентов
+    @param method "auto", "companion" или "aberth"
+
+    @return Комплексный массив формы (n, наибольшая степень), лишние позиции - nan
+    """
+    from PolynomialArray import PolynomialArray  # Отложенный импорт: PolynomialArray зависит от Polynomial
+    solver = PolynomialRoots(method)
+    if isinstance(polynomials, PolynomialArray):
+        matrix = polynomials.coeffs
+    elif isinstance(polynomials, np.ndarray):
+        matrix = polynomials
+    else:
+        matrix = PolynomialArray.from_polynomials(polynomials).coeffs
+    return solver.batch(matrix)
@@ -0,0 +1,123 @@
+import itertools
+import random
+
+from CantorSet import CantorSet
+
+
+class PowerSet:
+    """
+    @brief Ленивый булеан множества Кантора: подмножества строятся по запросу.
+    @details Подмножество задается битовой маской: бит i соответствует i-му
+             элементу множества (в порядке elements). Мощность, доступ по маске,
+             проверка принадлежности и случайная выборка не создают остальных
+             2^n подмножеств; итерация - генератор. Булеан фиксирует элементы
+             множества в момент создания и не отражает его последующих
+             изменений. Вложенные элементы неизменяемы (FrozenCantorSet) и
+             входят во все подмножества без копирования.
+    """
+
+    def __init__(self, cantor_set):
+        """
+        @brief Создает булеан множества.
+        @param cantor_set Объект CantorSet.
+        """
+        if not isinstance(cantor_set, CantorSet):
+            raise TypeError("Булеан строится только для CantorSet")
+        self._elements = cantor_set.elements
+        self._positions = {e: i for i, e in enumerate(self._elements)}
+
+    @property
+    def base(self):
+        """@brief Элементы исходного множества (копия списка)."""
+        return self._elements[:]
+
+    @property
+    def cardinality(self):
+        """@brief Число подмножеств 2^n (целое число любой величины)."""
+        return 1 << len(self._elements)
+
+    def __len__(self):
+        """
+        @brief Число подмножеств (len() ограничен sys.maxsize - для больших n см. cardinality).
+        """
+        return self.cardinality
+
+    def __getitem__(self, mask):
+        """
+        @brief Подмножество по битовой маске.
+        @param mask Целое число из [0, 2^n); отрицательные маски отсчитываются от конца.
+        @return Новый объект CantorSet.
+        @throws IndexError, если маска вне диапазона.
+        """
+        if mask < 0:
+            mask += self.cardinality
+        if not 0 <= mask < self.cardinality:
+            raise IndexError("Маска подмножества вне диапазона")
+        elements = self._elements
+        subset = {}
+        while mask:
+            low = mask & -mask
+            subset[elements[low.bit_length() - 1]] = None
+            mask ^= low
+        return PowerSet._build(subset)
+
+    @staticmethod
+    def _build(elements):
+        result = CantorSet()
+        result._elements = elements
+        return result
+
+    def __iter__(self):
+        """
+        @brief Перебирает подмножества в порядке возрастания маски.
+        """
+        for mask in range(self.cardinality):
+            yield self[mask]
+
+    def iter_by_size(self):
+        """
+        @brief Перебирает подмножества по возрастанию мощности, внутри мощности -
+               в лексикографическом порядке номеров элементов.
+        """
+        elements = self._elements
+        for size in range(len(elements) + 1):
+            for combo in itertools.combinations(elements, size):
+                yield PowerSet._build(dict.fromkeys(combo))
+
+    def index(self, subset):
+        """
+        @brief Битовая маска подмножества.
+        @param subset Объект CantorSet.
+        @return Маска или None, если subset не является подмножеством.
+        """
+        if not isinstance(subset, CantorSet):
+            return None
+        mask = 0
+        for element in subset._elements:
+            position = self._positions.get(element)
+            if position is None:
+                return None
+            mask |= 1 << position
+        return mask
+
+    def __contains__(self, subset):
+        """
+        @brief Проверяет, является ли subset подмножеством исходного множества (за O(|subset|)).
+        """
+        return self.index(subset) is not None
+
+    def sample(self, count=None, rng=None):
+        """
+        @brief Случайные подмножества (каждое подмножество равновероятно).
+        @param count Количество подмножеств; None - одно подмножество.
+        @param rng Генератор random.Random (по умолчанию - модуль random).
+        @return CantorSet или список из count множеств.
+        """
+        rng = rng or random
+        n = len(self._elements)
+        if count is None:
+            return self[rng.getrandbits(n) if n else 0]
+        return [self[rng.getrandbits(n) if n else 0] for _ in range(count)]
+
+    def __repr__(self):
+        return "PowerSet({})".format(PowerSet._build(dict.fromkeys(self._elements)))
@@ -0,0 +1,381 @@
+import numbers
+
+from Polynomial import Polynomial, np
+from PolynomialMultiplier import PolynomialMultiplier
+from CoefficientView import CoefficientView
+from PolynomialDivider import PolynomialDivider
+
+
+class SparsePolynomial(Polynomial):
+    """
+    @brief Разреженный многочлен: хранит только ненулевые члены {степень: коэффициент}.
+    @details Память пропорциональна числу ненулевых членов, а не степени, поэтому
+             многочлены вида x^N + 1 занимают O(1) памяти. Совместим с плотным
+             Polynomial через те же операторы; результат операций с участием
+             разреженного многочлена выбирает представление по плотности
+             (см. from_terms). Разреженный многочлен не хранит поле
+             коэффициентов: операции с многочленом над полем (CoefficientField)
+             выполняются плотно в этом поле и возвращают плотный Polynomial.
+    """
+
+    # Доля ненулевых коэффициентов, ниже которой выгоднее разреженное хранение
+    DENSITY_THRESHOLD = 0.25
+    # Минимальная степень, начиная с которой имеет смысл разреженное хранение
+    MIN_SPARSE_DEGREE = 64
+
+    def __init__(self, terms=None):
+        """
+        @brief Инициализирует разреженный многочлен.
+        @param terms Словарь {степень: коэффициент} или итерируемый объект пар
+               (степень, коэффициент). Нулевые коэффициенты отбрасываются,
+               повторяющиеся степени суммируются.
+        """
+        if terms is None:
+            terms = {}
+        items = terms.items() if isinstance(terms, dict) else terms
+        self._terms = {}
+        for exp, coef in items:
+            if not isinstance(exp, numbers.Integral) or exp < 0:
+                raise ValueError("Степень члена должна быть неотрицательным целым числом: {}".format(exp))
+            self._terms[exp] = self._terms.get(exp, 0) + coef
+        self._terms = {exp: coef for exp, coef in sorted(self._terms.items()) if coef != 0}
+        self._degree = max(self._terms) if self._terms else 0
+        self._storage = Polynomial.STORAGE_SPARSE
+
+        # Разреженный многочлен - тоже экземпляр Polynomial
+        Polynomial._instance_count += 1
+
+    @staticmethod
+    def from_terms(terms):
+        """
+        @brief Создает многочлен по членам, выбирая представление по плотности.
+        @param terms Словарь {степень: коэффициент} или итерируемый объект пар.
+        @return SparsePolynomial, если степень не меньше MIN_SPARSE_DEGREE и доля
+                ненулевых членов меньше DENSITY_THRESHOLD, иначе плотный Polynomial.
+        """
+        items = terms.items() if isinstance(terms, dict) else terms
+        merged = {}
+        for exp, coef in items:
+            if not isinstance(exp, numbers.Integral) or exp < 0:
+                raise ValueError("Степень члена должна быть неотрицательным целым числом: {}".format(exp))
+            merged[exp] = merged.get(exp, 0) + coef
+        nonzero = {exp: coef for exp, coef in merged.items() if coef != 0}
+        degree = max(nonzero) if nonzero else 0
+        if degree >= SparsePolynomial.MIN_SPARSE_DEGREE and \
+                len(nonzero) < SparsePolynomial.DENSITY_THRESHOLD * (degree + 1):
+            return SparsePolynomial(nonzero)
+        coeffs = [0] * (degree + 1)
+        for exp, coef in nonzero.items():
+            coeffs[exp] = coef
+        return Polynomial(coeffs)
+
+    # Управление доступом - свойства только для чтения
+    @property
+    def terms(self):
+        """@brief Получение словаря ненулевых членов (копия, только чтение)."""
+        return dict(self._terms)
+
+    @property
+    def _coeffs(self):
+        """Плотный список коэффициентов для методов базового класса (O(степень) памяти)."""
+        coeffs = [0] * (self._degree + 1)
+        for exp, coef in self._terms.items():
+            coeffs[exp] = coef
+        return coeffs
+
+    @property
+    def coeffs_view(self):
+        """@brief Коэффициенты без копирования (CoefficientView над словарем членов)."""
+        return CoefficientView(self._terms, self._degree + 1)
+
+    @property
+    def density(self):
+        """@brief Доля ненулевых коэффициентов среди degree + 1 позиций."""
+        return len(self._terms) / (self._degree + 1)
+
+    def to_dense(self):
+        """
+        @brief Создает плотную копию многочлена.
+        @return Объект Polynomial в режиме хранения "list".
+        """
+        return Polynomial(self._coeffs)
+
+    def to_sparse(self):
+        """
+        @brief Создает разреженную копию многочлена.
+        @return Новый объект SparsePolynomial.
+        """
+        return SparsePolynomial(self._terms)
+
+    def _nonzero_terms(self):
+        """Ненулевые члены в порядке возрастания степени."""
+        return iter(self._terms.items())
+
+    def _coefficient_values(self):
+        """Хранимые (ненулевые) коэффициенты."""
+        return list(self._terms.values()) or [0]
+
+    @staticmethod
+    def _terms_of(other):
+        """Словарь ненулевых членов любого многочлена (плотного или разреженного)."""
+        if isinstance(other, SparsePolynomial):
+            return other._terms
+        return dict(other._nonzero_terms())
+
+    # Константные методы
+    def get_coefficient(self, exp):
+        """
+        @brief Константный метод получения коэффициента при x^exp.
+        @param exp Степень.
+        @return Коэффициент при данной степени (или 0, если член отсутствует).
+        """
+        return self._terms.get(exp, 0)
+
+    def evaluate(self, x):
+        """
+        @brief Константный метод вычисления значения многочлена в точке x.
+        @details Степени x накапливаются по разностям соседних показателей, поэтому
+                 стоимость - O(t log N) для t членов степени N.
+        @param x Значение переменной.
+        @return Значение многочлена.
+        """
+        result = 0
+        power = 1
+        previous = 0
+        for exp, coef in self._terms.items():
+            power = power * x ** (exp - previous)
+            previous = exp
+            result = result + coef * power
+        return result
+
+    def _evaluate_array(self, points, dtype):
+        """Векторное вычисление по ненулевым членам."""
+        result = np.zeros(points.shape, dtype=dtype)
+        power = np.ones(points.shape, dtype=dtype)
+        previous = 0
+        for exp, coef in self._terms.items():
+            power *= points ** (exp - previous)
+            previous = exp
+            result += coef * power
+        return result
+
+    def __eq__(self, other):
+        """
+        @brief Проверяет равенство с плотным или разреженным многочленом.
+        """
+        if not isinstance(other, Polynomial):
+            return False
+        return self._terms == SparsePolynomial._terms_of(other)
+
+    # Арифметика над словарями членов
+    @staticmethod
+    def _merge(left, right, sign):
+        """Сумма (sign=1) или разность (sign=-1) словарей членов."""
+        result = dict(left)
+        for exp, coef in right.items():
+            result[exp] = result.get(exp, 0) + sign * coef
+        return result
+
+    @staticmethod
+    def _over_field(other):
+        """Является ли other многочленом над полем (операция выполняется плотно в поле)."""
+        return isinstance(other, Polynomial) and other._field is not None
+
+    @staticmethod
+    def _dense(terms):
+        """Плотный список коэффициентов по словарю членов."""
+        coeffs = [0] * (max(terms) + 1)
+        for exp, coef in terms.items():
+            coeffs[exp] = coef
+        return coeffs
+
+    @staticmethod
+    def _product(left, right):
+        """
+        @brief Произведение словарей членов.
+        @details Если попарных произведений не меньше DENSITY_THRESHOLD * (степень + 1),
+                 результат плотный, и операнды умножаются плотно движком
+                 Polynomial (Карацуба, FFT, NTT); иначе - попарно за O(t1 * t2).
+        """
+        if not left or not right:
+            return {}
+        degree = max(left) + max(right)
+        if len(left) * len(right) >= SparsePolynomial.DENSITY_THRESHOLD * (degree + 1):
+            a = SparsePolynomial._dense(left)
+            b = SparsePolynomial._dense(right)
+            multiplier = Polynomial.get_multiplier()
+            coeffs = multiplier.multiply(a, b)
+            if PolynomialMultiplier.coefficient_kind(a, b) in ("float", "complex"):
+                # БПФ оставляет шум округления в степенях, куда не попало ни одного
+                # произведения; их отмечает точная свертка носителей
+                support = multiplier.multiply([1 if c != 0 else 0 for c in a], [1 if c != 0 else 0 for c in b])
+                return {exp: coef for exp, coef in enumerate(coeffs) if coef != 0 and support[exp]}
+            return {exp: coef for exp, coef in enumerate(coeffs) if coef != 0}
+        result = {}
+        for exp_a, coef_a in left.items():
+            for exp_b, coef_b in right.items():
+                exp = exp_a + exp_b
+                result[exp] = result.get(exp, 0) + coef_a * coef_b
+        return result
+
+    def __add__(self, other):
+        """
+        @brief Сложение с многочленом (возвращает новый).
+        """
+        if not isinstance(other, Polynomial):
+            return NotImplemented
+        if SparsePolynomial._over_field(other):
+            return self.to_dense() + other
+        return SparsePolynomial.from_terms(SparsePolynomial._merge(self._terms, SparsePolynomial._terms_of(other), 1))
+
+    def __radd__(self, other):
+        """
+        @brief Сложение плотного многочлена с разреженным.
+        """
+        return self.__add__(other)
+
+    def __sub__(self, other):
+        """
+        @brief Вычитание многочлена (возвращает новый).
+        """
+        if not isinstance(other, Polynomial):
+            return NotImplemented
+        if SparsePolynomial._over_field(other):
+            return self.to_dense() - other
+        return SparsePolynomial.from_terms(SparsePolynomial._merge(self._terms, SparsePolynomial._terms_of(other), -1))
+
+    def __rsub__(self, other):
+        """
+        @brief Вычитание разреженного многочлена из плотного.
+        """
+        if not isinstance(other, Polynomial):
+            return NotImplemented
+        if SparsePolynomial._over_field(other):
+            return other - self.to_dense()
+        return SparsePolynomial.from_terms(SparsePolynomial._merge(SparsePolynomial._terms_of(other), self._terms, -1))
+
+    def __mul__(self, other):
+        """
+        @brief Умножение на многочлен или скаляр (возвращает новый).
+        """
+        if Polynomial._is_scalar(other):
+            return self._scale(other)
+        if not isinstance(other, Polynomial):
+            return NotImplemented
+        if SparsePolynomial._over_field(other):
+            return self.to_dense() * other
+        return SparsePolynomial.from_terms(SparsePolynomial._product(self._terms, SparsePolynomial._terms_of(other)))
+
+    def __rmul__(self, other):
+        """
+        @brief Умножение скаляра или плотного многочлена на разреженный.
+        """
+        if Polynomial._is_scalar(other):
+            return self._scale(other)
+        if not isinstance(other, Polynomial):
+            return NotImplemented
+        if SparsePolynomial._over_field(other):
+            return other * self.to_dense()
+        return SparsePolynomial.from_terms(SparsePolynomial._product(SparsePolynomial._terms_of(other), self._terms))
+
+    def _scale(self, factor):
+        """Умножает все члены на скаляр."""
+        return SparsePolynomial({exp: coef * factor for exp, coef in self._terms.items()})
+
+    def __truediv__(self, other):
+        """
+        @brief Деление на многочлен (возвращает частное).
+        @details Деление на константу выполняется почленно; в общем случае
+                 используется деление плотных многочленов.
+        """
+        if not isinstance(other, Polynomial):
+            return NotImplemented
+        if SparsePolynomial._over_field(other):
+            return self.to_dense() / other
+        if other._degree == 0:
+            c = other.get_coefficient(0)
+            if c == 0:
+                raise ZeroDivisionError("Деление на нулевой многочлен")
+            return SparsePolynomial({exp: coef / c for exp, coef in self._terms.items()})
+        return self.to_dense() / other
+
+    def __pow__(self, exponent, modulo=None):
+        """
+        @brief Возведение в степень бинарным методом над словарями членов.
+        @details Без модуля результат остается разреженным: (x^N + 1)^k не
+                 материализует N * k коэффициентов.
+        """
+        if modulo is not None or not isinstance(exponent, numbers.Integral):
+            return super().__pow__(exponent, modulo)
+        if exponent < 0:
+            raise ValueError("Показатель степени должен быть неотрицательным: {}".format(exponent))
+        result = {0: 1}
+        base = self._terms
+        while exponent:
+            if exponent & 1:
+                result = SparsePolynomial._product(result, base)
+            exponent >>= 1
+            if exponent:
+                base = SparsePolynomial._product(base, base)
+        return SparsePolynomial.from_terms(result)
+
+    def derivative(self):
+        """
+        @brief Производная по членам (возвращает новый).
+        """
+        return SparsePolynomial.from_terms({exp - 1: exp * coef for exp, coef in self._terms.items() if exp > 0})
+
+    def integral(self, constant=0):
+        """
+        @brief Первообразная по членам; коэффициенты делятся точно (см. Polynomial.integral).
+        """
+        terms = {exp + 1: PolynomialDivider.exact_div(coef, exp + 1) for exp, coef in self._terms.items()}
+        terms[0] = constant
+        return SparsePolynomial.from_terms(terms)
+
+    # Операции на месте изменяют словарь членов без смены представления;
+    # с многочленом над полем результат - новый плотный многочлен в этом поле
+    def _assign_terms(self, terms):
+        """Заменяет члены текущего объекта (на месте)."""
+        self._terms = {exp: coef for exp, coef in sorted(terms.items()) if coef != 0}
+        self._degree = max(self._terms) if self._terms else 0
+
+    def __iadd__(self, other):
+        """
+        @brief Сложение (in-place).
+        """
+        if SparsePolynomial._over_field(other):
+            return self + other
+        self._assign_terms(SparsePolynomial._merge(self._terms, SparsePolynomial._terms_of(other), 1))
+        return self
+
+    def __isub__(self, other):
+        """
+        @brief Вычитание (in-place).
+        """
+        if SparsePolynomial._over_field(other):
+            return self - other
+        self._assign_terms(SparsePolynomial._merge(self._terms, SparsePolynomial._terms_of(other), -1))
+        return self
+
+    def __imul__(self, other):
+        """
+        @brief Умножение (in-place).
+        """
+        if SparsePolynomial._over_field(other):
+            return self * other
+        if Polynomial._is_scalar(other):
+            self._assign_terms({exp: coef * other for exp, coef in self._terms.items()})
+        else:
+            self._assign_terms(SparsePolynomial._product(self._terms, SparsePolynomial._terms_of(other)))
+        return self
+
+    def __itruediv__(self, other):
+        """
+        @brief Деление (in-place, устанавливает текущий многочлен равным частному).
+        """
+        result = self / other
+        if SparsePolynomial._over_field(other):
+            return result
+        self._assign_terms(SparsePolynomial._terms_of(result))
+        return self
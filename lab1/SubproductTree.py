@@ -0,0 +1,155 @@
+from fractions import Fraction
+from itertools import zip_longest
+
+from PolynomialMultiplier import PolynomialMultiplier
+from PolynomialDivider import PolynomialDivider
+
+
+class SubproductTree:
+    """
+    @brief Дерево подпроизведений для многоточечного вычисления и интерполяции.
+    @details Листья - многочлены (x - x_i), каждый внутренний узел - произведение
+             двух дочерних. Узел уровня k с номером j соответствует точкам
+             [j * 2^k, (j + 1) * 2^k). Остаток от деления на корень последовательно
+             спускается по дереву; узлы не длиннее LEAF_SIZE точек вычисляются
+             схемой Горнера. Над полями с ограниченными коэффициентами (GF(p))
+             умножение и деление быстрые, и обе операции выполняются за
+             O(M(n) log n).
+
+             Спуск по дереву используется только над такими полями. Над int и
+             Fraction деление с остатком - деление столбиком (метод Ньютона для
+             Z и Q отключен), а остатки содержат очень большие числа, поэтому
+             спуск медленнее Горнера при любых n (512 точек: в 20 раз). Над
+             float и complex остатки по дереву численно неустойчивы (ошибка
+             растет экспоненциально с n даже для точек из [-1, 1]). В обоих
+             случаях evaluate считает значения схемой Горнера за O(n * deg);
+             interpolate над int и Fraction точна, но тоже не квазилинейна.
+    """
+
+    # Число точек узла, начиная с которого спуск заменяется схемой Горнера
+    LEAF_SIZE = 32
+
+    def __init__(self, points, multiplier=None, divider=None, field=None):
+        """
+        @brief Строит дерево подпроизведений по точкам.
+        @param points Последовательность точек x_i.
+        @param multiplier Движок умножения (по умолчанию - PolynomialMultiplier()).
+        @param divider Движок деления (по умолчанию - PolynomialDivider(multiplier)).
+        @param field Поле коэффициентов (CoefficientField) или None.
+        """
+        self.multiplier = multiplier if multiplier is not None else PolynomialMultiplier()
+        self.divider = divider if divider is not None else PolynomialDivider(self.multiplier)
+        self.field = field
+        self.points = [field.convert(x) for x in points] if field is not None else list(points)
+
+        level = [self._normalize([-x, 1]) for x in self.points]
+        self._levels = [level]
+        while len(level) > 1:
+            level = [self._multiply(level[i], level[i + 1]) if i + 1 < len(level) else level[i]
+                     for i in range(0, len(level), 2)]
+            self._levels.append(level)
+
+    def __len__(self):
+        return len(self.points)
+
+    @property
+    def root(self):
+        """@brief Коэффициенты многочлена M(x) = prod(x - x_i)."""
+        return list(self._levels[-1][0]) if self.points else [1]
+
+    def _normalize(self, coeffs):
+        """Приводит коэффициенты к полю и к списку Python."""
+        if self.field is not None:
+            coeffs = self.field.convert_all(coeffs)
+        return PolynomialDivider._as_list(coeffs)
+
+    def _multiply(self, a, b):
+        if self.field is not None:
+            return self._normalize(self.field.multiply(a, b))
+        return PolynomialDivider._as_list(self.multiplier.multiply(a, b))
+
+    def _remainder(self, a, b):
+        if len(a) < len(b):
+            return a
+        if self.field is not None:
+            return self._normalize(self.field.divmod(a, b)[1])
+        return self.divider.divmod(a, b)[1]
+
+    def _add(self, a, b):
+        total = [x + y for x, y in zip_longest(a, b, fillvalue=0)]
+        return self._normalize(total) if self.field is not None else total
+
+    def _horner(self, coeffs, x):
+        if self.field is not None:
+            return self.field.evaluate(coeffs, x)
+        result = 0
+        for coef in reversed(coeffs):
+            result = result * x + coef
+        return result
+
+    def _span(self, k, j):
+        """Диапазон индексов точек узла (k, j)."""
+        start = j << k
+        return start, min(start + (1 << k), len(self.points))
+
+    def evaluate(self, coeffs):
+        """
+        @brief Значения многочлена во всех точках дерева.
+        @param coeffs Коэффициенты многочлена (от младшей степени к старшей).
+        @return Список значений в порядке точек.
+        """
+        values = [0] * len(self.points)
+        if not self.points:
+            return values
+        coeffs = self._normalize(coeffs) if self.field is not None else list(coeffs)
+        if self.field is None or not self.field.bounded:
+            return [self._horner(coeffs, x) for x in self.points]
+        top = len(self._levels) - 1
+        stack = [(top, 0, self._remainder(coeffs, self._levels[top][0]))]
+        while stack:
+            k, j, remainder = stack.pop()
+            start, stop = self._span(k, j)
+            if stop - start <= SubproductTree.LEAF_SIZE:
+                for i in range(start, stop):
+                    values[i] = self._horner(remainder, self.points[i])
+                continue
+            children = self._levels[k - 1]
+            for child in (2 * j, 2 * j + 1):
+                if child < len(children):
+                    stack.append((k - 1, child, self._remainder(remainder, children[child])))
+        return values
+
+    def interpolate(self, values):
+        """
+        @brief Многочлен степени < n, принимающий в точках дерева заданные значения.
+        @details Формула Лагранжа: f = sum w_i * M(x) / (x - x_i), где
+                 w_i = y_i / M'(x_i); сумма собирается снизу вверх по дереву:
+                 f_узла = f_левого * M_правого + f_правого * M_левого.
+        @param values Значения y_i (по одному на точку).
+        @return Список коэффициентов.
+        @throws ValueError при повторяющихся точках или несовпадении длин.
+        """
+        if len(values) != len(self.points):
+            raise ValueError("Число значений не совпадает с числом точек")
+        if not self.points:
+            return [0]
+        root = self._levels[-1][0]
+        derivative = [i * root[i] for i in range(1, len(root))]
+        divide = self.field.div if self.field is not None else PolynomialDivider.exact_div
+        weights = []
+        for y, d in zip(values, self.evaluate(derivative)):
+            if d == 0:
+                raise ValueError("Точки интерполяции должны быть попарно различны")
+            weights.append([divide(self.field.convert(y) if self.field is not None else y, d)])
+
+        level = weights
+        for k in range(1, len(self._levels)):
+            below = self._levels[k - 1]
+            level = [self._add(self._multiply(level[i], below[i + 1]), self._multiply(level[i + 1], below[i]))
+                     if i + 1 < len(level) else level[i]
+                     for i in range(0, len(level), 2)]
+        coeffs = level[0]
+        if self.field is None:
+            # Целые коэффициенты, полученные через Fraction, возвращаем как int
+            coeffs = [int(c) if isinstance(c, Fraction) and c.denominator == 1 else c for c in coeffs]
+        return PolynomialDivider._trim_exact(coeffs) or [0]
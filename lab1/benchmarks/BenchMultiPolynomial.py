@@ -0,0 +1,100 @@
+"""
+@file BenchMultiPolynomial.py
+@brief Замер пропускной способности умножения разреженных многочленов нескольких переменных
+@details Для каждого числа членов t перемножаются два случайных разреженных
+         многочлена из t членов алгоритмами MultiPolynomial ("heap", "dict",
+         "numpy" и, для достаточно плотных образов, "kronecker"). Медленные
+         алгоритмы на чистом Python пропускаются для t больше --python-limit. Выводится время и пропускная
+         способность - число попарных произведений членов (t^2) в секунду.
+
+Запуск: python benchmarks/BenchMultiPolynomial.py [--terms 100 1000 10000] [--nvars 4] [--degree 15]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+# Добавляем путь к родительской директории для импорта модулей
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from MultiPolynomial import MultiPolynomial
+
+DEFAULT_TERMS = [100, 300, 1000, 3000, 10000]
+METHODS = ["heap", "dict", "numpy", "kronecker"]
+
+
+def random_polynomial(rng, terms, nvars, degree):
+    """
+    @brief Случайный многочлен из terms различных членов со степенями до degree.
+    """
+    result = {}
+    while len(result) < terms:
+        result[tuple(rng.randint(0, degree) for _ in range(nvars))] = rng.randint(1, 1000)
+    return MultiPolynomial(result)
+
+
+def measure(method, f, g, repeat):
+    """
+    @brief Возвращает лучшее время из repeat запусков умножения.
+    @param method Имя алгоритма MultiPolynomial.multiply.
+    @param f Первый множитель.
+    @param g Второй множитель.
+    @param repeat Количество повторов.
+    @return Время в секундах.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        f.multiply(g, method=method)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(sizes, nvars, degree, repeat, kronecker_limit, python_limit):
+    """
+    @brief Запускает замеры и печатает таблицу времени и пропускной способности.
+    """
+    rng = random.Random(0)
+    print("{:>8}{:>10}".format("t", "|f*g|") + "".join("{:>12}".format(m) for m in METHODS)
+          + "{:>16}".format("лучший, M/с"))
+    for size in sizes:
+        f = random_polynomial(rng, size, nvars, degree)
+        g = random_polynomial(rng, size, nvars, degree)
+        product = f.multiply(g)
+        row = "{:>8}{:>10}".format(size, len(product))
+        timings = {}
+        for method in METHODS:
+            if method in ("heap", "dict") and size > python_limit:
+                row += "{:>12}".format("-")
+                continue
+            if method == "kronecker" and (2 * degree + 1) ** nvars > kronecker_limit:
+                row += "{:>12}".format("-")
+                continue
+            timings[method] = measure(method, f, g, repeat)
+            row += "{:>12.4f}".format(timings[method])
+        best = min(timings.values())
+        row += "{:>16.2f}".format(size * size / best / 1e6)
+        print(row)
+
+
+def main():
+    """
+    @brief Точка входа: разбирает аргументы командной строки.
+    """
+    parser = argparse.ArgumentParser(description="Бенчмарк умножения многочленов нескольких переменных")
+    parser.add_argument("--terms", type=int, nargs="+", default=DEFAULT_TERMS)
+    parser.add_argument("--nvars", type=int, default=4)
+    parser.add_argument("--degree", type=int, default=15)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--kronecker-limit", type=int, default=1 << 20,
+                        help="максимальная длина одномерного образа для подстановки Кронекера")
+    parser.add_argument("--python-limit", type=int, default=3000,
+                        help="максимальное число членов для алгоритмов на чистом Python")
+    args = parser.parse_args()
+    run(args.terms, args.nvars, args.degree, args.repeat, args.kronecker_limit, args.python_limit)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+@file BenchMultiplication.py
+@brief Замер времени алгоритмов умножения многочленов и поиск точек перехода
+@details Для каждого размера n умножаются два многочлена длины n всеми применимыми
+         алгоритмами PolynomialMultiplier. По таблице видно, с какого n метод
+         Карацубы обгоняет наивное умножение, а БПФ/NTT - метод Карацубы.
+
+Запуск: python benchmarks/BenchMultiplication.py [--sizes 16 32 64 ...] [--repeat 3]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+# Добавляем путь к родительской директории для импорта модулей
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PolynomialMultiplier import PolynomialMultiplier, np
+
+DEFAULT_SIZES = [8, 16, 32, 64, 128, 256, 512, 1024, 2048, 4096]
+
+
+def measure(method, a, b, repeat):
+    """
+    @brief Возвращает лучшее время из repeat запусков умножения.
+    @param method Имя алгоритма PolynomialMultiplier.
+    @param a Коэффициенты первого многочлена.
+    @param b Коэффициенты второго многочлена.
+    @param repeat Количество повторов.
+    @return Время в секундах.
+    """
+    engine = PolynomialMultiplier(method=method)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        engine.multiply(a, b)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def find_crossover(sizes, slow, fast):
+    """
+    @brief Находит наименьший размер, начиная с которого fast стабильно быстрее slow.
+    @return Размер или None, если переход не найден.
+    """
+    crossover = None
+    for size in sizes:
+        if slow.get(size) is None or fast.get(size) is None:
+            continue
+        if fast[size] < slow[size]:
+            if crossover is None:
+                crossover = size
+        else:
+            crossover = None
+    return crossover
+
+
+def run(sizes, repeat, schoolbook_limit):
+    """
+    @brief Запускает замеры для целых и вещественных коэффициентов и печатает таблицы.
+    """
+    rng = random.Random(0)
+    methods = {"int": ["schoolbook", "karatsuba"], "float": ["schoolbook", "karatsuba"]}
+    if np is not None:
+        methods["int"].append("ntt")
+        methods["float"].append("fft")
+
+    for kind, kind_methods in methods.items():
+        print("\nКоэффициенты: {}".format(kind))
+        print("{:>8}".format("n") + "".join("{:>14}".format(m) for m in kind_methods))
+        timings = {m: {} for m in kind_methods}
+        for size in sizes:
+            if kind == "int":
+                a = [rng.randint(-1000, 1000) for _ in range(size)]
+                b = [rng.randint(-1000, 1000) for _ in range(size)]
+            else:
+                a = [rng.uniform(-1, 1) for _ in range(size)]
+                b = [rng.uniform(-1, 1) for _ in range(size)]
+            row = "{:>8}".format(size)
+            for method in kind_methods:
+                if method == "schoolbook" and size > schoolbook_limit:
+                    row += "{:>14}".format("-")
+                    continue
+                timings[method][size] = measure(method, a, b, repeat)
+                row += "{:>14.6f}".format(timings[method][size])
+            print(row)
+
+        print("Переход schoolbook -> karatsuba: n = {}".format(
+            find_crossover(sizes, timings["schoolbook"], timings["karatsuba"])))
+        fast = kind_methods[-1]
+        if fast not in ("schoolbook", "karatsuba"):
+            print("Переход karatsuba -> {}: n = {}".format(
+                fast, find_crossover(sizes, timings["karatsuba"], timings[fast])))
+
+    print("\nТекущие пороги: SCHOOLBOOK_THRESHOLD = {}, FFT_THRESHOLD = {}, NTT_THRESHOLD = {}".format(
+        PolynomialMultiplier.SCHOOLBOOK_THRESHOLD, PolynomialMultiplier.FFT_THRESHOLD,
+        PolynomialMultiplier.NTT_THRESHOLD))
+
+
+def main():
+    """
+    @brief Точка входа: разбирает аргументы командной строки.
+    """
+    parser = argparse.ArgumentParser(description="Бенчмарк алгоритмов умножения многочленов")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--schoolbook-limit", type=int, default=2048,
+                        help="максимальный размер для наивного умножения")
+    args = parser.parse_args()
+    run(args.sizes, args.repeat, args.schoolbook_limit)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+"""
+@file BenchSuite.py
+@brief Набор замеров производительности основных операций Polynomial и CantorSet
+@details Каждый замер - операция (сложение, умножение, деление, сдвиг и вычисление
+         значений многочлена; разбор, проверка принадлежности, объединение и
+         булеан множества) на входных данных нескольких размеров. Для каждой
+         пары (замер, размер) фиксируются лучшее время из --repeat запусков и
+         пиковый объем памяти, выделенной во время операции (tracemalloc,
+         отдельный запуск, чтобы трассировка не искажала время). Результаты
+         записываются в JSON и сравниваются с сохраненным базовым файлом:
+         замедление больше чем в --threshold раз считается регрессией.
+
+Запуск: python benchmarks/BenchSuite.py [--filter polynomial] [--scale 0.1] [--repeat 3]
+        [--output results.json] [--baseline benchmarks/baseline.json] [--save-baseline]
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+# Добавляем путь к родительской директории для импорта модулей
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Polynomial import Polynomial
+from CoefficientField import PrimeField
+from CantorSet import CantorSet
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+# Время (с), ниже которого разница считается шумом и не отмечается как регрессия
+TIME_NOISE_FLOOR = 1e-3
+
+
+# Генераторы входных данных
+def random_polynomial(rng, size, monic=False):
+    """
+    @brief Многочлен степени size - 1 со случайными целыми коэффициентами.
+    @param monic Старший коэффициент 1 (частное от деления на такой многочлен
+           целочисленное, без роста дробей).
+    """
+    coeffs = [rng.randint(-1000, 1000) for _ in range(size)]
+    coeffs[-1] = 1 if monic else rng.randint(1, 1000)
+    return Polynomial(coeffs)
+
+
+def random_set_string(rng, size, nested_every=10):
+    """
+    @brief Строковое представление множества из size элементов, где каждый
+           nested_every-й элемент - вложенное множество из двух элементов.
+    """
+    parts = []
+    for i in range(size):
+        if nested_every and i % nested_every == nested_every - 1:
+            parts.append("{{n{}, m{}}}".format(i, rng.randint(0, size)))
+        else:
+            parts.append("e{}".format(i))
+    rng.shuffle(parts)
+    return "{" + ", ".join(parts) + "}"
+
+
+# Замеры: функция подготовки получает (rng, size) и возвращает вызываемый
+# объект без аргументов - измеряется только он
+def setup_polynomial_add(rng, size):
+    a, b = random_polynomial(rng, size), random_polynomial(rng, size)
+    return lambda: a + b
+
+
+def setup_polynomial_mul(rng, size):
+    a, b = random_polynomial(rng, size), random_polynomial(rng, size)
+    return lambda: a * b
+
+
+def setup_polynomial_divmod(rng, size):
+    a, b = random_polynomial(rng, 2 * size), random_polynomial(rng, size, monic=True)
+    return lambda: divmod(a, b)
+
+
+def setup_polynomial_evaluate(rng, size):
+    p = random_polynomial(rng, size)
+    xs = [rng.uniform(-1, 1) for _ in range(size)]
+    return lambda: p.evaluate_many(xs)
+
+
+def setup_polynomial_shift(rng, size):
+    # Над int - синтетическое деление O(n^2) (см. Polynomial.shift)
+    p = random_polynomial(rng, size)
+    return lambda: p.shift(3)
+
+
+def setup_polynomial_shift_gf(rng, size):
+    # Над GF(p) - одна свертка NTT
+    field = PrimeField(998244353)
+    p = Polynomial([rng.randrange(field.p) for _ in range(size)], field=field)
+    return lambda: p.shift(3)
+
+
+def setup_cantor_parse(rng, size):
+    text = random_set_string(rng, size)
+    return lambda: CantorSet(text)
+
+
+def setup_cantor_contains(rng, size):
+    s = CantorSet(random_set_string(rng, size))
+    probes = ["e{}".format(rng.randint(0, 2 * size)) for _ in range(100)]
+    return lambda: [s.contains(x) for x in probes]
+
+
+def setup_cantor_union(rng, size):
+    a = CantorSet(random_set_string(rng, size))
+    b = CantorSet(random_set_string(rng, size))
+    return lambda: a + b
+
+
+def setup_cantor_bullean(rng, size):
+    s = CantorSet(random_set_string(rng, size, nested_every=4))
+    return lambda: s.bullean()
+
+
+BENCHMARKS = {
+    "polynomial.add": (setup_polynomial_add, [1000, 10000, 100000]),
+    "polynomial.mul": (setup_polynomial_mul, [100, 1000, 10000]),
+    "polynomial.divmod": (setup_polynomial_divmod, [100, 1000, 3000]),
+    "polynomial.evaluate": (setup_polynomial_evaluate, [100, 1000, 10000]),
+    "polynomial.shift": (setup_polynomial_shift, [100, 1000, 2000]),
+    "polynomial.shift_gf": (setup_polynomial_shift_gf, [1000, 10000, 100000]),
+    "cantor.parse": (setup_cantor_parse, [100, 1000, 3000]),
+    "cantor.contains": (setup_cantor_contains, [100, 1000, 10000]),
+    "cantor.union": (setup_cantor_union, [100, 1000, 3000]),
+    "cantor.bullean": (setup_cantor_bullean, [8, 12, 14]),
+}
+
+
+def measure(func, repeat):
+    """
+    @brief Измеряет время и пиковую память вызова func.
+    @param func Вызываемый объект без аргументов.
+    @param repeat Количество повторов для замера времени.
+    @return Пара (лучшее время в секундах, пик выделенной памяти в байтах).
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        func()
+        peak = tracemalloc.get_traced_memory()[1] - base
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+
+def run(names, scale, repeat, seed=0):
+    """
+    @brief Выполняет выбранные замеры и печатает таблицу.
+    @param names Имена замеров из BENCHMARKS.
+    @param scale Множитель размеров входных данных (размеры булеана не масштабируются).
+    @param repeat Количество повторов.
+    @return Словарь результатов {"meta": ..., "results": {имя: {размер: {...}}}}.
+    """
+    results = {}
+    print("{:<22}{:>10}{:>14}{:>14}".format("замер", "n", "время, с", "пик, КиБ"))
+    for name in names:
+        setup, sizes = BENCHMARKS[name]
+        if not name.endswith("bullean"):
+            sizes = sorted({max(1, int(size * scale)) for size in sizes})
+        results[name] = {}
+        for size in sizes:
+            func = setup(random.Random(seed), size)
+            elapsed, peak = measure(func, repeat)
+            results[name][str(size)] = {"time": elapsed, "peak_bytes": peak}
+            print("{:<22}{:>10}{:>14.6f}{:>14.1f}".format(name, size, elapsed, peak / 1024))
+    meta = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "repeat": repeat,
+        "scale": scale,
+    }
+    return {"meta": meta, "results": results}
+
+
+def compare(current, baseline, threshold):
+    """
+    @brief Сравнивает результаты с базовыми и печатает отношения времени и памяти.
+    @param current Результаты run().
+    @param baseline Базовые результаты того же формата.
+    @param threshold Допустимое отношение текущего значения к базовому.
+    @return Список регрессий (имя, размер, метрика, отношение).
+    """
+    regressions = []
+    print("\nСравнение с базовыми результатами ({}):".format(baseline.get("meta", {}).get("date", "?")))
+    print("{:<22}{:>10}{:>12}{:>12}".format("замер", "n", "время", "память"))
+    for name, by_size in current["results"].items():
+        for size, values in by_size.items():
+            reference = baseline.get("results", {}).get(name, {}).get(size)
+            if reference is None:
+                continue
+            ratios = {}
+            for metric in ("time", "peak_bytes"):
+                ratios[metric] = values[metric] / reference[metric] if reference[metric] else 1.0
+                if metric == "time" and values[metric] < TIME_NOISE_FLOOR:
+                    continue
+                if ratios[metric] > threshold:
+                    regressions.append((name, size, metric, ratios[metric]))
+            flag = " !" if any(r[:2] == (name, size) for r in regressions) else ""
+            print("{:<22}{:>10}{:>11.2f}x{:>11.2f}x{}".format(
+                name, size, ratios["time"], ratios["peak_bytes"], flag))
+    if regressions:
+        print("Регрессии (порог {:.2f}x): {}".format(threshold, len(regressions)))
+    else:
+        print("Регрессий нет (порог {:.2f}x)".format(threshold))
+    return regressions
+
+
+def main():
+    """
+    @brief Точка входа: разбирает аргументы командной строки.
+    @return Код завершения: 1 при найденных регрессиях, иначе 0.
+    """
+    parser = argparse.ArgumentParser(description="Набор замеров производительности Polynomial и CantorSet")
+    parser.add_argument("--filter", default="",
+                        help="выполнять только замеры, имя которых содержит эту подстроку")
+    parser.add_argument("--scale", type=float, default=1.0, help="множитель размеров входных данных")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="файл JSON для записи результатов")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="файл JSON с базовыми результатами")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="записать результаты как новые базовые")
+    parser.add_argument("--threshold", type=float, default=1.5,
+                        help="допустимое замедление относительно базовых результатов")
+    args = parser.parse_args()
+
+    names = [name for name in BENCHMARKS if args.filter in name]
+    if not names:
+        parser.error("нет замеров, содержащих '{}'".format(args.filter))
+    current = run(names, args.scale, args.repeat)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2, ensure_ascii=False)
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2, ensure_ascii=False)
+        print("\nБазовые результаты записаны в {}".format(args.baseline))
+        return 0
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        return 1 if compare(current, baseline, args.threshold) else 0
+    print("\nБазовый файл {} не найден (создается ключом --save-baseline)".format(args.baseline))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
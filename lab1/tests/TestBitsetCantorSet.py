@@ -0,0 +1,89 @@
+import unittest
+from AtomUniverse import AtomUniverse
+from BitsetCantorSet import BitsetCantorSet
+from CantorSet import CantorSet
+
+
+class TestAtomUniverse(unittest.TestCase):
+    def test_positions_and_masks(self):
+        universe = AtomUniverse(["a", "b"])
+        self.assertEqual(universe.position("b"), 1)
+        self.assertEqual(universe.position(" c "), 2)
+        self.assertEqual(len(universe), 3)
+        self.assertEqual(universe.mask(["a", "c", ""]), 0b101)
+        self.assertEqual(universe.atoms_of(0b110), ["b", "c"])
+        with self.assertRaises(TypeError):
+            universe.position(1)
+
+    def test_fixed_universe(self):
+        universe = AtomUniverse(["a"], fixed=True)
+        self.assertTrue(universe.fixed)
+        with self.assertRaises(ValueError):
+            universe.position("z")
+
+
+class TestBitsetCantorSet(unittest.TestCase):
+    def setUp(self):
+        self.universe = AtomUniverse("abcdef")
+
+    def make(self, data):
+        return BitsetCantorSet(data, self.universe)
+
+    def test_construction(self):
+        s = self.make("{a, c, c}")
+        self.assertEqual(s.elements, ["a", "c"])
+        self.assertEqual(s.size, 2)
+        self.assertEqual(s.mask, 0b101)
+        self.assertEqual(self.make(CantorSet("{c, a}")), s)
+        self.assertEqual(self.make(["a", "c"]), s)
+        self.assertTrue(BitsetCantorSet().is_empty())
+        with self.assertRaises(TypeError):
+            self.make("{a, {b}}")
+
+    def test_add_remove_contains(self):
+        s = self.make("{a}")
+        s.add("f")
+        self.assertTrue(s["f"] and s.contains("a"))
+        self.assertFalse(s["b"] or s["unknown"] or s[["unhashable"]])
+        s.remove("a")
+        self.assertFalse(s["a"])
+        with self.assertRaises(KeyError):
+            s.remove("a")
+        s.add("new")
+        self.assertIn("new", self.universe)
+
+    def test_algebra(self):
+        s1 = self.make("{a, b, c}")
+        s2 = self.make("{b, c, d}")
+        self.assertEqual((s1 + s2).elements, ["a", "b", "c", "d"])
+        self.assertEqual((s1 * s2).elements, ["b", "c"])
+        self.assertEqual((s1 - s2).elements, ["a"])
+        s3 = s1.clone()
+        s3 += s2
+        s3 -= self.make("{a}")
+        s3 *= self.make("{c, d, e}")
+        self.assertEqual(s3, self.make("{c, d}"))
+        self.assertEqual(s1.size, 3)
+        with self.assertRaises(ValueError):
+            s1 + BitsetCantorSet("{a}")
+        with self.assertRaises(TypeError):
+            s1 + CantorSet("{a}")
+
+    def test_equality_and_conversion(self):
+        s = self.make("{b, a}")
+        self.assertEqual(s, CantorSet("{a, b}"))
+        self.assertEqual(s, BitsetCantorSet("{a, b}"))
+        self.assertEqual(s.to_cantor_set(), CantorSet("{a, b}"))
+        self.assertEqual(repr(s), "{a, b}")
+        self.assertFalse(s == "{a, b}")
+
+    def test_large_vocabulary(self):
+        universe = AtomUniverse("w{}".format(i) for i in range(5000))
+        evens = BitsetCantorSet(("w{}".format(i) for i in range(0, 5000, 2)), universe)
+        thirds = BitsetCantorSet(("w{}".format(i) for i in range(0, 5000, 3)), universe)
+        self.assertEqual((evens * thirds).size, len(range(0, 5000, 6)))
+        self.assertEqual((evens + thirds).to_cantor_set(), evens.to_cantor_set() + thirds.to_cantor_set())
+
+
+if __name__ == "__main__":
+    unittest.main()
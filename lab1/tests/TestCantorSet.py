@@ -1,3 +1,4 @@
+import io
 import unittest
 from CantorSet import CantorSet
 
@@ -221,5 +222,89 @@ class TestCantorSet(unittest.TestCase):
         s.remove(inner)
         self.assertEqual(len(s.elements), 0)
 
+    def test_structural_hash(self):
+        s1 = CantorSet("{a, {b, c}, {}}")
+        s2 = CantorSet("{{}, {c, b}, a}")
+        self.assertEqual(hash(s1), hash(s2))
+        self.assertEqual(s1, s2)
+        s2.add("d")
+        self.assertNotEqual(s1, s2)
+        s2.remove("d")
+        self.assertEqual(hash(s1), hash(s2))
+        self.assertEqual(len({s1, s2, s1.clone()}), 1)
+
+    def test_hash_index_membership(self):
+        s = CantorSet(["e{}".format(i) for i in range(100000)])
+        self.assertEqual(s.size, 100000)
+        self.assertTrue(s.contains("e99999"))
+        self.assertFalse(s.contains(["unhashable"]))
+        for i in range(0, 100000, 2):
+            s.remove("e{}".format(i))
+        self.assertEqual(s.size, 50000)
+        self.assertFalse(s["e0"])
+        self.assertEqual(s.elements[:2], ["e1", "e3"])  # порядок добавления сохраняется
+        with self.assertRaises(KeyError):
+            s.remove(["unhashable"])
+
+    def test_nested_index_after_in_place_ops(self):
+        s = CantorSet("{a, {b}, {c}}")
+        s *= CantorSet("{{b}, {c}}")
+        self.assertTrue(s[CantorSet("{b}")])
+        s -= CantorSet("{{c}}")
+        self.assertEqual(s, CantorSet("{{b}}"))
+
+    def test_deep_nesting_eq_clone_repr(self):
+        depth = 20000
+        s1, s2 = CantorSet("{a}"), CantorSet("{a}")
+        for _ in range(depth):
+            outer1, outer2 = CantorSet(), CantorSet("{b}")
+            outer1.add(s1)
+            outer2.add(s2)
+            outer1.add("b")
+            s1, s2 = outer1, outer2
+        self.assertEqual(s1, s2)
+        copy = s1.clone()
+        self.assertEqual(copy, s1)
+        text = repr(s1)
+        self.assertEqual(len(text), len(repr(s2)))
+        self.assertTrue(text.startswith("{{{") and text.endswith("}, b}"))
+        self.assertEqual(CantorSet(text), s1)
+        buffer = io.StringIO()
+        copy.write_text(buffer)
+        self.assertEqual(buffer.getvalue(), text)
+
+    def test_repr_format(self):
+        self.assertEqual(repr(CantorSet()), "{}")
+        self.assertEqual(repr(CantorSet("{a, {}, {b, {c}}, d}")), "{a, {}, {b, {c}}, d}")
+
+    def test_union_all(self):
+        sets = [CantorSet("{a, {x}}"), CantorSet("{b, a}"), CantorSet("{{x}, c}")]
+        self.assertEqual(CantorSet.union_all(sets), CantorSet("{a, b, c, {x}}"))
+        self.assertEqual(CantorSet.union_all(iter(sets)).elements[:2], ["a", CantorSet("{x}")])
+        self.assertTrue(CantorSet.union_all([]).is_empty())
+        self.assertEqual(sets[1].size, 2)  # входные множества не меняются
+        with self.assertRaises(TypeError):
+            CantorSet.union_all(["{a}"])
+
+    def test_intersection_all(self):
+        sets = [CantorSet(["e{}".format(i) for i in range(0, 1000, k)]) for k in (2, 3, 5)]
+        expected = CantorSet(["e{}".format(i) for i in range(0, 1000, 30)])
+        self.assertEqual(CantorSet.intersection_all(sets), expected)
+        self.assertEqual(CantorSet.intersection_all(sets), sets[0] * sets[1] * sets[2])
+        self.assertTrue(CantorSet.intersection_all(sets + [CantorSet()]).is_empty())
+        self.assertEqual(CantorSet.intersection_all([sets[0]]), sets[0])
+        with self.assertRaises(ValueError):
+            CantorSet.intersection_all([])
+
+    def test_subset_superset(self):
+        small = CantorSet("{a, {b}}")
+        big = CantorSet("{{b}, a, c}")
+        self.assertTrue(small.is_subset(big) and small <= big)
+        self.assertTrue(big.is_superset(small) and big >= small)
+        self.assertFalse(big.is_subset(small) or big <= small)
+        self.assertTrue(small <= small.clone() and small >= small)
+        self.assertTrue(CantorSet().is_subset(small))
+        self.assertFalse(CantorSet("{a, {c}}").is_subset(big))
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,77 @@
+import io
+import os
+import tempfile
+import unittest
+from CantorSet import CantorSet
+from CantorSetCodec import CantorSetCodec
+from FrozenCantorSet import FrozenCantorSet
+
+
+class TestCantorSetCodec(unittest.TestCase):
+    def setUp(self):
+        self.codec = CantorSetCodec()
+
+    def test_round_trip(self):
+        for text in ["{}", "{a}", "{a, {b, c}, {}, {{b, c}, d}, привет}"]:
+            s = CantorSet(text)
+            restored = self.codec.loads(self.codec.dumps(s))
+            self.assertEqual(restored, s)
+            self.assertEqual(repr(restored), repr(s))
+            self.assertEqual(CantorSet.from_bytes(s.to_bytes()), s)
+
+    def test_nested_sets_stored_once(self):
+        inner = "{" + ", ".join("atom{}".format(i) for i in range(100)) + "}"
+        single = CantorSet("{" + inner + "}")
+        repeated = CantorSet("{" + ", ".join("{{{}, n{}}}".format(inner, i) for i in range(100)) + "}")
+        data = self.codec.dumps(repeated)
+        self.assertLess(len(data), 2 * len(self.codec.dumps(single)) + 100 * 40)
+        restored = self.codec.loads(data)
+        self.assertEqual(restored, repeated)
+        shared = {id(e.elements[0]) for e in restored.elements}
+        self.assertEqual(len(shared), 1)
+        self.assertIsInstance(restored.elements[0], FrozenCantorSet)
+
+    def test_stream_file_and_mmap(self):
+        s = CantorSet(["e{}".format(i) for i in range(1000)] + [CantorSet("{x, {y}}")])
+        stream = io.BytesIO()
+        self.codec.dump(s, stream)
+        stream.seek(0)
+        self.assertEqual(self.codec.load(stream), s)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "set.bin")
+            self.codec.dump_file(s, path)
+            self.assertEqual(self.codec.load_file(path), s)
+
+    def test_sections_are_aligned(self):
+        data = self.codec.dumps(CantorSet("{a, bb, {ccc}}"))
+        self.assertEqual(len(data) % CantorSetCodec.ALIGNMENT, 0)
+        self.assertEqual(data[:4], CantorSetCodec.MAGIC)
+
+    def test_deep_nesting(self):
+        s = CantorSet("{" * 20000 + "a" + "}" * 20000)
+        self.assertEqual(self.codec.loads(self.codec.dumps(s)), s)
+
+    def test_invalid_data(self):
+        data = self.codec.dumps(CantorSet("{a, {b}}"))
+        with self.assertRaises(ValueError):
+            self.codec.loads(b"XXXX" + data[4:])
+        with self.assertRaises(ValueError):
+            self.codec.loads(data[:-8])
+        with self.assertRaises(ValueError):
+            self.codec.loads(b"")
+        with self.assertRaises(TypeError):
+            self.codec.dumps("{a}")
+
+    def test_invalid_file(self):
+        data = self.codec.dumps(CantorSet("{a, {b}}"))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "set.bin")
+            for corrupt in (data[:-8], data[:20], b"XXXX" + data[4:]):
+                with open(path, "wb") as stream:
+                    stream.write(corrupt)
+                with self.assertRaises(ValueError):
+                    self.codec.load_file(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import io
+import os
+import tempfile
+import unittest
+from CantorSet import CantorSet
+from CantorSetParser import CantorSetParser
+from FrozenCantorSet import FrozenCantorSet
+
+
+class TestCantorSetParser(unittest.TestCase):
+    def test_parse_matches_constructor(self):
+        s = CantorSetParser().parse("{a, {b, c}, {}, a, { b ,c }}")
+        self.assertEqual(s, CantorSet("{a, {c, b}, {}}"))
+        self.assertEqual(s.size, 3)
+        self.assertEqual(s.elements[0], "a")
+
+    def test_chunks_split_atoms_and_braces(self):
+        text = "{alpha, {beta, gamma}, delta}"
+        for size in range(1, len(text) + 1):
+            parser = CantorSetParser()
+            for start in range(0, len(text), size):
+                parser.feed(text[start:start + size])
+            self.assertEqual(CantorSetParser._build(parser.finish()), CantorSet(text))
+
+    def test_stream_and_file(self):
+        text = "{" + ", ".join("{{x{}, {{y{}}}}}".format(i, i % 7) for i in range(2000)) + "}"
+        expected = CantorSet(text)
+        self.assertEqual(CantorSet.from_stream(io.StringIO(text)), expected)
+        self.assertEqual(CantorSetParser().parse_stream(io.StringIO(text), chunk_size=3), expected)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "set.txt")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+            self.assertEqual(CantorSet.from_file(path), expected)
+
+    def test_deep_nesting_without_recursion(self):
+        depth = 50000
+        s = CantorSet("{" * depth + "a" + "}" * depth)
+        level = 1
+        element = s.elements[0]
+        while isinstance(element, CantorSet) and element.size:
+            element = element.elements[0]
+            level += 1
+        self.assertEqual(element, "a")
+        self.assertEqual(level, depth)
+        self.assertIsInstance(s.elements[0], FrozenCantorSet)
+
+    def test_large_literal(self):
+        text = "{" + ", ".join("e{}".format(i) for i in range(200000)) + "}"
+        s = CantorSet(text)
+        self.assertEqual(s.size, 200000)
+        self.assertTrue(s["e199999"])
+
+    def test_format_errors(self):
+        for text in ["", "a, b", "{a", "{a}}", "{a} b", "{a {b}}", "x{a}", "{{a}"]:
+            with self.assertRaises(ValueError, msg=text):
+                CantorSet(text)
+
+
+if __name__ == "__main__":
+    unittest.main()
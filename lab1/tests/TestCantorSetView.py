@@ -0,0 +1,87 @@
+import unittest
+from CantorSet import CantorSet
+from CantorSetView import CantorSetView, ProductView, FilterView, MapView
+
+
+class TestCantorSetView(unittest.TestCase):
+    def setUp(self):
+        self.left = CantorSet("{a, b}")
+        self.right = CantorSet("{x, y, z}")
+
+    def test_product_len_iteration_and_membership(self):
+        product = self.left.product(self.right)
+        self.assertIsInstance(product, ProductView)
+        self.assertEqual(len(product), 6)
+        self.assertEqual(sorted(product), [("a", "x"), ("a", "y"), ("a", "z"),
+                                           ("b", "x"), ("b", "y"), ("b", "z")])
+        self.assertIn(("b", "y"), product)
+        self.assertNotIn(("y", "b"), product)
+        self.assertNotIn(("a",), product)
+        self.assertNotIn("a", product)
+
+    def test_product_materializes_kuratowski_pairs(self):
+        result = ProductView(CantorSet("{a}"), CantorSet("{a, b}")).materialize()
+        self.assertEqual(result, CantorSet("{{{a}}, {{a}, {a, b}}}"))
+        triple = ProductView(self.left, self.right, CantorSet("{c}")).materialize()
+        self.assertEqual(triple.size, 6)
+        self.assertTrue(triple.contains(ProductView.pair(("a", "x", "c"))))
+
+    def test_product_reflects_source_changes(self):
+        product = self.left.product(self.right)
+        self.left.add("c")
+        self.assertEqual(len(product), 9)
+        self.assertIn(("c", "x"), product)
+
+    def test_filter(self):
+        base = CantorSet("{a1, b2, a3, {a4}}")
+        view = base.filter(lambda e: isinstance(e, str) and e.startswith("a"))
+        self.assertIsInstance(view, FilterView)
+        self.assertEqual(len(view), 2)
+        self.assertEqual(list(view), ["a1", "a3"])
+        self.assertIn("a3", view)
+        self.assertNotIn("b2", view)
+        self.assertNotIn("a9", view)
+        self.assertEqual(view.materialize(), CantorSet("{a1, a3}"))
+
+    def test_map_deduplicates(self):
+        base = CantorSet("{a1, a2, b1}")
+        view = base.map(lambda e: e[0])
+        self.assertIsInstance(view, MapView)
+        self.assertEqual(list(view), ["a", "b"])
+        self.assertEqual(len(view), 2)
+        self.assertIn("b", view)
+        self.assertNotIn("c", view)
+        self.assertEqual(view.materialize(), CantorSet("{a, b}"))
+
+    def test_map_to_sets_and_chaining(self):
+        view = self.right.map(lambda e: CantorSet([e])).filter(lambda s: not s.contains("z"))
+        self.assertEqual(view.materialize(), CantorSet("{{x}, {y}}"))
+        chained = self.left.product(self.right).filter(lambda t: t[1] != "y").map(lambda t: t[0] + t[1])
+        self.assertEqual(chained.materialize(), CantorSet("{ax, az, bx, bz}"))
+
+    def test_materialize_rejects_non_elements(self):
+        with self.assertRaises(TypeError):
+            self.right.map(len).materialize()
+        with self.assertRaises(ValueError):
+            ProductView()
+
+    def test_incomplete_view_cannot_be_created(self):
+        class IterOnly(CantorSetView):
+            def __iter__(self):
+                return iter(())
+
+        with self.assertRaises(TypeError):
+            CantorSetView()
+        with self.assertRaises(TypeError):
+            IterOnly()
+
+    def test_large_product_is_lazy(self):
+        base = CantorSet(["e{}".format(i) for i in range(1000)])
+        product = ProductView(base, base, base)
+        self.assertEqual(len(product), 10 ** 9)
+        self.assertIn(("e1", "e500", "e999"), product)
+        self.assertEqual(next(iter(product)), ("e0", "e0", "e0"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+import random
+import unittest
+from fractions import Fraction
+from Polynomial import Polynomial
+from CoefficientField import CoefficientField, IntegerRing, RationalField, PrimeField
+from PolynomialMultiplier import PolynomialMultiplier, multiply
+
+
+class TestCoefficientField(unittest.TestCase):
+    def setUp(self):
+        self.rng = random.Random(6)
+        self.gf = PrimeField(1000003)
+
+    def test_incomplete_field_cannot_be_created(self):
+        class NoDivision(CoefficientField):
+            def convert(self, value):
+                return value
+
+        with self.assertRaises(TypeError):
+            CoefficientField()
+        with self.assertRaises(TypeError):
+            NoDivision()
+
+    def test_prime_field_validation(self):
+        self.assertEqual(PrimeField(7).p, 7)
+        self.assertEqual(repr(PrimeField(7)), "GF(7)")
+        for bad in (1, 4, 561, 1000001):
+            with self.assertRaises(ValueError):
+                PrimeField(bad)
+        self.assertEqual(PrimeField(7), PrimeField(7))
+        self.assertNotEqual(PrimeField(7), PrimeField(11))
+
+    def test_conversion(self):
+        gf7 = PrimeField(7)
+        self.assertEqual(Polynomial([10, -1, 7], field=gf7).coeffs, [3, 6])
+        self.assertEqual(gf7.convert(Fraction(1, 2)), 4)
+        self.assertEqual(Polynomial([1, 2.0], field=IntegerRing()).coeffs, [1, 2])
+        with self.assertRaises(ValueError):
+            Polynomial([0.5], field=IntegerRing())
+        q = Polynomial([1, 0.5], field=RationalField())
+        self.assertEqual(q.coeffs, [1, Fraction(1, 2)])
+
+    def test_integer_ring_division(self):
+        zz = IntegerRing()
+        p = Polynomial([-1, 0, 0, 1], field=zz)
+        q, r = divmod(p, Polynomial([-1, 1], field=zz))
+        self.assertEqual(q.coeffs, [1, 1, 1])
+        self.assertEqual(r.coeffs, [0])
+        with self.assertRaises(ValueError):
+            divmod(Polynomial([1, 0, 1], field=zz), Polynomial([0, 2], field=zz))
+
+    def test_rational_field_division(self):
+        qq = RationalField()
+        a = Polynomial([1, 2, 3, 4], field=qq)
+        b = Polynomial([3, 5], field=qq)
+        q, r = divmod(a, b)
+        self.assertEqual(q * b + r, a)
+        self.assertTrue(all(isinstance(c, Fraction) for c in q.coeffs))
+
+    def test_mixed_fields_rejected(self):
+        with self.assertRaises(ValueError):
+            Polynomial([1], field=PrimeField(7)) + Polynomial([1], field=PrimeField(11))
+
+    def test_prime_field_arithmetic(self):
+        gf7 = PrimeField(7)
+        a = Polynomial([3, 4, 5], field=gf7)
+        b = Polynomial([6, 1], field=gf7)
+        self.assertEqual((a + b).coeffs, [2, 5, 5])
+        self.assertEqual((a * b).coeffs, [4, 6, 6, 5])
+        q, r = divmod(a, b)
+        self.assertEqual(q * b + r, a)
+        self.assertEqual(r.degree, 0)
+
+    def test_large_product_matches_reduced_exact_product(self):
+        a = [self.rng.randrange(self.gf.p) for _ in range(5000)]
+        b = [self.rng.randrange(self.gf.p) for _ in range(4500)]
+        product = Polynomial(a, field=self.gf) * Polynomial(b, field=self.gf)
+        expected = [x % self.gf.p for x in multiply(a, b, method="karatsuba")]
+        self.assertEqual(product.coeffs, expected)
+
+    def test_large_product_past_ntt_max_size(self):
+        # Длина NTT ограничена NTT_MAX_SIZE; граница уменьшена, чтобы тест был быстрым
+        limit = PolynomialMultiplier.NTT_MAX_SIZE
+        PolynomialMultiplier.NTT_MAX_SIZE = 1 << 10
+        try:
+            for gf in (PrimeField(998244353), PrimeField(2147483647)):
+                a = [self.rng.randrange(gf.p) for _ in range(1500)]
+                b = [self.rng.randrange(gf.p) for _ in range(900)]
+                product = Polynomial(a, field=gf) * Polynomial(b, field=gf)
+                expected = [x % gf.p for x in multiply(a, b, method="karatsuba")]
+                self.assertEqual(product.coeffs, expected)
+        finally:
+            PolynomialMultiplier.NTT_MAX_SIZE = limit
+
+    def test_newton_division(self):
+        b = Polynomial([self.rng.randrange(self.gf.p) for _ in range(300)] + [1], field=self.gf)
+        q = Polynomial([self.rng.randrange(self.gf.p) for _ in range(400)], field=self.gf)
+        r = Polynomial([1, 2, 3], field=self.gf)
+        quotient, remainder = divmod(b * q + r, b)
+        self.assertEqual(quotient, q)
+        self.assertEqual(remainder, r)
+
+    def test_evaluate(self):
+        gf7 = PrimeField(7)
+        p = Polynomial([1, 2, 3], field=gf7)  # 1 + 2x + 3x^2
+        self.assertEqual(p(2), 3)
+        self.assertEqual(p.evaluate_many([0, 1, 2, 9]), [1, 6, 3, 3])
+
+    def test_with_storage_keeps_field(self):
+        gf7 = PrimeField(7)
+        p = Polynomial([5, 6], field=gf7)
+        for storage in ("list", "numpy"):
+            q = p.with_storage(storage)
+            self.assertEqual(q.storage, storage)
+            self.assertEqual(q.field, gf7)
+            self.assertEqual((q + Polynomial([3, 1], field=gf7)).coeffs, [1])
+            self.assertEqual((q * 3).coeffs, [1, 4])
+        with self.assertRaises(ValueError):
+            p.with_storage("sparse")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import copy
+import pickle
+import unittest
+from CantorSet import CantorSet
+from FrozenCantorSet import FrozenCantorSet
+
+
+class TestFrozenCantorSet(unittest.TestCase):
+    def test_interning_by_structure(self):
+        a = FrozenCantorSet("{a, {b, c}, {}}")
+        b = FrozenCantorSet(["a", CantorSet("{c, b}"), CantorSet()])
+        self.assertIs(a, b)
+        self.assertIs(FrozenCantorSet(a), a)
+        self.assertIs(FrozenCantorSet(CantorSet("{{}, a, {b, c}}")), a)
+        self.assertIsNot(FrozenCantorSet("{a}"), a)
+
+    def test_equality_and_hash_match_cantor_set(self):
+        frozen = FrozenCantorSet("{a, {b}}")
+        mutable = CantorSet("{{b}, a}")
+        self.assertEqual(frozen, mutable)
+        self.assertEqual(mutable, frozen)
+        self.assertEqual(hash(frozen), hash(mutable))
+        self.assertTrue(CantorSet("{x, {a, {b}}}")[frozen])
+
+    def test_immutable(self):
+        s = FrozenCantorSet("{a}")
+        with self.assertRaises(TypeError):
+            s.add("b")
+        with self.assertRaises(TypeError):
+            s.remove("a")
+        original = s
+        s += CantorSet("{b}")
+        self.assertIs(s, FrozenCantorSet("{a, b}"))
+        self.assertIs(original, FrozenCantorSet("{a}"))
+        self.assertIs(s.clone(), s)
+        thawed = s.thaw()
+        thawed.add("c")
+        self.assertFalse(s["c"])
+
+    def test_nested_elements_are_shared(self):
+        inner = CantorSet("{x, {y, {z}}}")
+        outer = CantorSet()
+        outer.add(inner)
+        copies = [CantorSet(outer), outer.clone(), outer * outer, outer + CantorSet("{w}")]
+        nested = [next(e for e in s.elements if isinstance(e, CantorSet)) for s in copies]
+        self.assertTrue(all(e is nested[0] for e in nested))
+        self.assertIsInstance(nested[0], FrozenCantorSet)
+        inner.add("q")  # изменение исходного множества не влияет на вложенную копию
+        self.assertFalse(nested[0]["q"])
+        subsets = CantorSet("{a, {b}}").bullean()
+        shared = [e for s in subsets for e in s.elements if isinstance(e, CantorSet)]
+        self.assertEqual(len(shared), 2)
+        self.assertIs(shared[0], shared[1])
+
+    def test_repetitive_data_is_stored_once(self):
+        sets = [CantorSet("{{{a, b}, {c}}, {{a, b}}, n%d}" % i) for i in range(1000)]
+        nested = {id(e) for s in sets for e in s.elements if isinstance(e, CantorSet)}
+        self.assertEqual(len(nested), 2)
+
+    def test_copy_and_pickle_keep_interning(self):
+        original = CantorSet("{x, {p, q}, {}}")
+        for copied in (copy.copy(original), copy.deepcopy(original),
+                       pickle.loads(pickle.dumps(original))):
+            self.assertEqual(copied, original)
+        frozen = FrozenCantorSet("{a, {b}}")
+        self.assertIs(copy.copy(frozen), frozen)
+        self.assertIs(copy.deepcopy(frozen), frozen)
+        self.assertIs(pickle.loads(pickle.dumps(frozen)), frozen)
+        for key, instance in FrozenCantorSet._interned.items():
+            self.assertEqual(frozenset(instance._elements), key)
+        self.assertEqual(CantorSet("{{}, z}"), CantorSet(["z", CantorSet()]))
+        self.assertEqual(FrozenCantorSet().size, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
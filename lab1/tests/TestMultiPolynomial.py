@@ -0,0 +1,169 @@
+import random
+import unittest
+from fractions import Fraction
+from Polynomial import Polynomial
+from MultiPolynomial import MultiPolynomial, np
+from PolynomialMultiplier import PolynomialMultiplier
+
+
+class TestMultiPolynomial(unittest.TestCase):
+    def setUp(self):
+        self.rng = random.Random(11)
+
+    def random_poly(self, nvars, count, degree, coeffs=(-9, 9)):
+        terms = {}
+        for _ in range(count):
+            exps = tuple(self.rng.randint(0, degree) for _ in range(nvars))
+            terms[exps] = self.rng.randint(*coeffs)
+        return MultiPolynomial(terms, nvars=nvars)
+
+    def test_init_merges_and_drops_zeros(self):
+        p = MultiPolynomial([((1, 0), 2), ((1, 0), 3), ((0, 1), 0)])
+        self.assertEqual(p.terms, {(1, 0): 5})
+        self.assertEqual(p.nvars, 2)
+        self.assertEqual(len(MultiPolynomial({}, nvars=3)), 0)
+        with self.assertRaises(ValueError):
+            MultiPolynomial({(1, 0): 1, (1,): 2})
+        with self.assertRaises(ValueError):
+            MultiPolynomial({(-1, 0): 1})
+        with self.assertRaises(ValueError):
+            MultiPolynomial({})
+
+    def test_degree_and_repr(self):
+        p = MultiPolynomial({(0, 0): 1, (1, 0): 2, (1, 2): 3})
+        self.assertEqual(p.degree, 3)
+        self.assertEqual(p.degrees(), (1, 2))
+        self.assertEqual(repr(p), "1 + 2*x0 + 3*x0*x1^2")
+        self.assertEqual(repr(MultiPolynomial({}, nvars=2)), "0")
+
+    def test_arithmetic(self):
+        x = MultiPolynomial.variable(0, 2)
+        y = MultiPolynomial.variable(1, 2)
+        p = (x + y) * (x - y)
+        self.assertEqual(p, x * x - y * y)
+        self.assertEqual(p.terms, {(0, 2): -1, (2, 0): 1})
+        self.assertEqual((x + 1) ** 2, x * x + 2 * x + 1)
+        self.assertEqual(x - x, 0)
+        self.assertEqual(3 - x, -x + 3)
+        with self.assertRaises(ValueError):
+            x + MultiPolynomial.variable(0, 3)
+
+    def test_multiplication_methods_agree(self):
+        for nvars in (1, 2, 4):
+            f = self.random_poly(nvars, 60, 4)
+            g = self.random_poly(nvars, 40, 4)
+            expected = f.multiply(g, method="dict")
+            self.assertEqual(f.multiply(g, method="heap"), expected)
+            self.assertEqual(f.multiply(g, method="kronecker"), expected)
+            if np is not None:
+                self.assertEqual(f.multiply(g, method="numpy"), expected)
+            self.assertEqual(f * g, expected)
+        with self.assertRaises(ValueError):
+            f.multiply(g, method="unknown")
+
+    @unittest.skipIf(np is None, "NumPy не установлен")
+    def test_kronecker_float_product_has_no_round_off_terms(self):
+        terms = {(self.rng.randrange(40), self.rng.randrange(40)): self.rng.uniform(-1, 1) for _ in range(60)}
+        f = MultiPolynomial(terms, nvars=2)
+        g = MultiPolynomial({(b, a): c for (a, b), c in terms.items()}, nvars=2)
+        kronecker = f.multiply(g, method="kronecker")
+        expected = f.multiply(g, method="dict")
+        self.assertEqual(set(kronecker.terms), set(expected.terms))
+        for monomial, coef in expected.terms.items():
+            self.assertAlmostEqual(kronecker.terms[monomial], coef, places=9)
+
+    def test_auto_follows_density(self):
+        sparse_f = self.random_poly(3, 40, 1000)
+        sparse_g = self.random_poly(3, 40, 1000)
+        dense_f = self.random_poly(2, 200, 15)
+        dense_g = self.random_poly(2, 200, 15)
+        self.assertEqual(sparse_f._auto_method(sparse_g, [2000] * 3), "heap")
+        self.assertEqual(dense_f._auto_method(dense_g, [30] * 2), "kronecker")
+        middle = self.random_poly(4, 300, 20)
+        expected = "numpy" if np is not None else "heap"
+        self.assertEqual(middle._auto_method(middle, [40] * 4), expected)
+        big = MultiPolynomial({(0,): 10 ** 30, (10 ** 6,): 1})
+        self.assertEqual(big._auto_method(big, [2 * 10 ** 6]), "heap")
+
+        calls = []
+
+        class RecordingMultiplier(PolynomialMultiplier):
+            def multiply(self, a, b):
+                calls.append((len(a), len(b)))
+                return super().multiply(a, b)
+
+        heap_product = MultiPolynomial._heap_product
+        default = Polynomial.get_multiplier()
+        try:
+            MultiPolynomial._heap_product = staticmethod(
+                lambda left, right: calls.append("heap") or heap_product(left, right))
+            Polynomial.set_multiplier(RecordingMultiplier())
+            self.assertEqual(sparse_f * sparse_g, sparse_f.multiply(sparse_g, method="dict"))
+            self.assertEqual(calls, ["heap"])
+            del calls[:]
+            self.assertEqual(dense_f * dense_g, dense_f.multiply(dense_g, method="dict"))
+            self.assertEqual(len(calls), 1)
+            self.assertNotEqual(calls, ["heap"])
+        finally:
+            MultiPolynomial._heap_product = staticmethod(heap_product)
+            Polynomial.set_multiplier(default)
+
+    def test_heap_product_is_sorted_and_exact(self):
+        f = self.random_poly(3, 50, 40, coeffs=(10 ** 20, 10 ** 21))
+        g = self.random_poly(3, 50, 40, coeffs=(-10 ** 21, -10 ** 20))
+        product = f.multiply(g, method="heap")
+        self.assertEqual(list(product.terms), sorted(product.terms))
+        self.assertEqual(product, f.multiply(g, method="dict"))
+        self.assertEqual(f * g, product)
+        with self.assertRaises(ValueError):
+            f.multiply(g, method="numpy")
+        h = MultiPolynomial({(0, 1): Fraction(1, 2)}) * MultiPolynomial({(1, 0): Fraction(2, 3)})
+        self.assertEqual(h.terms, {(1, 1): Fraction(1, 3)})
+
+    @unittest.skipIf(np is None, "NumPy не установлен")
+    def test_numpy_product_in_blocks(self):
+        f = self.random_poly(4, 300, 10)
+        g = self.random_poly(4, 300, 10)
+        expected = f.multiply(g, method="heap")
+        block = MultiPolynomial.VECTOR_BLOCK
+        MultiPolynomial.VECTOR_BLOCK = 1000
+        try:
+            self.assertEqual(f.multiply(g, method="numpy"), expected)
+        finally:
+            MultiPolynomial.VECTOR_BLOCK = block
+        x = MultiPolynomial({(1,): 0.5})
+        self.assertEqual((x * x).terms, {(2,): 0.25})
+        self.assertIsInstance(next(iter((x * x).terms.values())), float)
+
+    def test_evaluate(self):
+        p = MultiPolynomial({(0, 0): 1, (1, 0): 2, (1, 2): 3})
+        self.assertEqual(p.evaluate((2, 3)), 1 + 4 + 54)
+        self.assertEqual(p(2, 3), 59)
+        with self.assertRaises(ValueError):
+            p.evaluate((1,))
+
+    def test_evaluate_many(self):
+        p = self.random_poly(3, 30, 4)
+        points = [tuple(self.rng.randint(-3, 3) for _ in range(3)) for _ in range(50)]
+        self.assertEqual(p.evaluate_many(points), [p.evaluate(pt) for pt in points])
+        if np is not None:
+            array = np.array([[self.rng.uniform(-1, 1) for _ in range(3)] for _ in range(500)])
+            values = p.evaluate_many(array)
+            self.assertIsInstance(values, np.ndarray)
+            for row, value in zip(array.tolist(), values.tolist()):
+                self.assertAlmostEqual(value, p.evaluate(row), places=9)
+
+    def test_polynomial_conversion(self):
+        q = Polynomial([1, 0, 3])
+        p = MultiPolynomial.from_polynomial(q, nvars=3, index=1)
+        self.assertEqual(p.terms, {(0, 0, 0): 1, (0, 2, 0): 3})
+        self.assertEqual(p.to_polynomial(), q)
+        self.assertEqual(MultiPolynomial({}, nvars=2).to_polynomial(), Polynomial([0]))
+        with self.assertRaises(ValueError):
+            MultiPolynomial({(1, 1): 1}).to_polynomial()
+        x = MultiPolynomial.variable(0, 1)
+        self.assertEqual((x * Polynomial([1, 1])).to_polynomial(), Polynomial([0, 1, 1]))
+
+
+if __name__ == "__main__":
+    unittest.main()
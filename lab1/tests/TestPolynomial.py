@@ -1,6 +1,13 @@
+import array
 import unittest
+from fractions import Fraction
 from Polynomial import Polynomial
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 class TestPolynomial(unittest.TestCase):
     def setUp(self):
         Polynomial.reset_instance_count()
@@ -80,6 +87,20 @@ class TestPolynomial(unittest.TestCase):
         self.assertEqual(p(1), 1)   # 1 -1 +1 = 1
         self.assertEqual(p(2), 1 - 2 + 4)  # = 3
 
+    def test_evaluate_many(self):
+        p = Polynomial([1, -1, 1])  # 1 - x + x^2
+        self.assertEqual(p.evaluate_many([0, 1, 2]), [1, 1, 3])
+        self.assertEqual(p([0, 1, 2]), [1, 1, 3])
+        self.assertEqual(list(p(array.array('d', [0.0, 2.0]))), [1.0, 3.0])
+        self.assertEqual(p.evaluate_many([]), [])
+        with self.assertRaises(TypeError):
+            p.evaluate_many("12")
+
+    def test_evaluate_many_exact_integers(self):
+        p = Polynomial([0, 0, 0, 1])  # x^3
+        big = 10 ** 7
+        self.assertEqual(p.evaluate_many([big]), [big ** 3])
+
     def test_addition(self):
         p1 = Polynomial([1, 2, 3])
         p2 = Polynomial([3, 4])
@@ -201,5 +222,250 @@ class TestPolynomial(unittest.TestCase):
         with self.assertRaises(ZeroDivisionError):
             p / Polynomial([])
 
+
+@unittest.skipIf(np is None, "NumPy не установлен")
+class TestPolynomialNumpyStorage(unittest.TestCase):
+    def setUp(self):
+        Polynomial.reset_instance_count()
+
+    def test_storage_selection(self):
+        self.assertEqual(Polynomial([1, 2]).storage, "list")
+        self.assertEqual(Polynomial(np.array([1, 2])).storage, "numpy")
+        self.assertEqual(Polynomial([1, 2], storage="numpy").storage, "numpy")
+        with self.assertRaises(ValueError):
+            Polynomial([1, 2], storage="unknown")
+        with self.assertRaises(ValueError):
+            Polynomial(np.zeros((2, 2)))
+
+    def test_trim_and_coeffs(self):
+        p = Polynomial(np.array([1, 2, 0, 0]))
+        self.assertEqual(p.degree, 1)
+        self.assertEqual(p.coeffs, [1, 2])
+        self.assertIsInstance(p.coeffs, list)
+        self.assertEqual(Polynomial(np.zeros(5)).coeffs, [0.0])
+
+    def test_input_array_is_copied(self):
+        arr = np.array([1, 2, 3])
+        p = Polynomial(arr)
+        arr[0] = 100
+        self.assertEqual(p[0], 1)
+
+    def test_add_sub_mixed_storage(self):
+        p = Polynomial(np.array([1, 2, 3]))
+        q = Polynomial([3, 4])
+        self.assertEqual((p + q).coeffs, [4, 6, 3])
+        self.assertEqual((q + p).storage, "numpy")
+        self.assertEqual((p - Polynomial([1, 2, 3])).coeffs, [0])
+        p += q
+        self.assertEqual(p.coeffs, [4, 6, 3])
+        self.assertEqual(p.storage, "numpy")
+
+    def test_scalar_multiply_and_eq(self):
+        p = Polynomial(np.array([1, -2, 3]))
+        self.assertEqual(p * 2, Polynomial([2, -4, 6]))
+        self.assertEqual(2 * p, Polynomial([2, -4, 6]))
+        self.assertEqual(Polynomial([1, 2]) * 3, Polynomial([3, 6]))
+        self.assertNotEqual(p, Polynomial([1, -2]))
+
+    def test_int64_overflow_is_exact(self):
+        big = 2 ** 62
+        p = Polynomial(np.array([big, 1]))
+        self.assertEqual((p + p).coeffs, [2 * big, 2])
+        self.assertEqual((p - Polynomial([-big])).coeffs, [2 * big, 1])
+        self.assertEqual((p * 8).coeffs, [8 * big, 8])
+        self.assertEqual((p + p).storage, "numpy")
+        unsigned = Polynomial(np.array([1, 2], dtype=np.uint8))
+        self.assertEqual((unsigned - Polynomial(np.array([3, 3], dtype=np.uint8))).coeffs, [-2, -1])
+        p += p
+        self.assertEqual(p.coeffs, [2 * big, 2])
+        p *= 4
+        self.assertEqual(p.coeffs, [8 * big, 8])
+
+    def test_instance_count(self):
+        p = Polynomial(np.array([1, 2]))
+        q = p.with_storage("list")
+        self.assertEqual(q.storage, "list")
+        self.assertEqual(q, p)
+        self.assertEqual(Polynomial.get_instance_count(), 2)
+
+    def test_evaluate_many_numpy(self):
+        p = Polynomial([1.0, -1.0, 1.0])
+        xs = np.linspace(-2.0, 2.0, 9)
+        expected = 1.0 - xs + xs ** 2
+        np.testing.assert_allclose(p(xs), expected)
+        grid = xs.reshape(3, 3)
+        self.assertEqual(p(grid).shape, (3, 3))
+        values = p(array.array('d', [0.0, 2.0]))
+        self.assertIsInstance(values, np.ndarray)
+        self.assertEqual(p(np.float64(2.0)), 3.0)
+
+    def test_evaluate_integer_array_is_exact(self):
+        p = Polynomial([0] * 20 + [1])
+        values = p(np.array([10, -3]))
+        self.assertEqual(values.tolist(), [10 ** 20, 3 ** 20])
+        self.assertEqual(p.evaluate_many(array.array('q', [10])).tolist(), [10 ** 20])
+        self.assertEqual(Polynomial(np.array([0] * 20 + [1]))(10), 10 ** 20)
+        self.assertEqual(p.to_sparse()(np.array([10])).tolist(), [10 ** 20])
+        small = Polynomial([1, 2, 3])(np.array([1, 2]))
+        self.assertEqual(small.dtype, np.int64)
+        self.assertEqual(small.tolist(), [6, 17])
+
+    def test_division_does_not_modify_operand(self):
+        p = Polynomial(np.array([-1.0, 0.0, 1.0]))
+        q = p / Polynomial([-1, 1])
+        self.assertEqual(q.coeffs, [1, 1])
+        self.assertEqual(p.coeffs, [-1, 0, 1])
+
+
+class TestPolynomialInPlace(unittest.TestCase):
+    def setUp(self):
+        Polynomial.reset_instance_count()
+
+    def test_in_place_does_not_create_objects(self):
+        p = Polynomial([1, 2, 3])
+        q = Polynomial([1, 1])
+        buffer = p._coeffs
+        p += q
+        p -= Polynomial.one()
+        p *= 2
+        self.assertEqual(Polynomial.get_instance_count(), 3)
+        self.assertIs(p._coeffs, buffer)
+        self.assertEqual(p.coeffs, [2, 6, 6])
+        p *= q
+        p /= Polynomial([2])
+        self.assertEqual(p.coeffs, [1, 4, 6, 3])
+
+    def test_in_place_grows_and_trims(self):
+        p = Polynomial([1])
+        p += Polynomial([0, 0, 5])
+        self.assertEqual(p.degree, 2)
+        p -= Polynomial([0, 0, 5])
+        self.assertEqual(p.coeffs, [1])
+        self.assertEqual(p.degree, 0)
+        p += p
+        self.assertEqual(p.coeffs, [2])
+
+    def test_in_place_with_sparse_operand(self):
+        from SparsePolynomial import SparsePolynomial
+        p = Polynomial([1, 2])
+        p += SparsePolynomial({5: 1})
+        self.assertEqual(p.storage, "list")
+        self.assertEqual(p.coeffs, [1, 2, 0, 0, 0, 1])
+        p *= SparsePolynomial({1: 1})
+        self.assertEqual(p.coeffs, [0, 1, 2, 0, 0, 0, 1])
+
+    def test_in_place_prime_field(self):
+        from CoefficientField import PrimeField
+        gf = PrimeField(7)
+        p = Polynomial([5, 6], field=gf)
+        p += Polynomial([3, 1], field=gf)
+        self.assertEqual(p.coeffs, [1])
+        p *= 10
+        self.assertEqual(p.coeffs, [3])
+        with self.assertRaises(ValueError):
+            p += Polynomial([1], field=PrimeField(11))
+
+    def test_coeffs_view(self):
+        p = Polynomial([1, 2, 3])
+        view = p.coeffs_view
+        self.assertEqual(list(view), [1, 2, 3])
+        self.assertEqual(view[-1], 3)
+        self.assertEqual(view[1:], [2, 3])
+        self.assertEqual(len(view), 3)
+        with self.assertRaises(TypeError):
+            view[0] = 5
+        with self.assertRaises(IndexError):
+            view[3]
+        from SparsePolynomial import SparsePolynomial
+        sparse_view = SparsePolynomial({0: 1, 100: 2}).coeffs_view
+        self.assertEqual(len(sparse_view), 101)
+        self.assertEqual((sparse_view[0], sparse_view[50], sparse_view[100]), (1, 0, 2))
+
+    @unittest.skipIf(np is None, "NumPy не установлен")
+    def test_numpy_in_place_and_view(self):
+        p = Polynomial(np.array([1.0, 2.0, 3.0]))
+        buffer = p._coeffs
+        p += Polynomial([1.0, 1.0])
+        p *= 0.5
+        p /= Polynomial([2.0])
+        self.assertIs(p._coeffs, buffer)
+        self.assertEqual(p.coeffs, [0.5, 0.75, 0.75])
+        view = p.coeffs_view
+        self.assertTrue(np.shares_memory(view, buffer))
+        with self.assertRaises(ValueError):
+            view[0] = 1.0
+        q = Polynomial([1, 2])
+        q += Polynomial(np.array([0.5]))
+        self.assertEqual(q.storage, "numpy")
+        self.assertEqual(q.coeffs, [1.5, 2.0])
+        self.assertEqual(Polynomial.get_instance_count(), 5)
+
+
+class TestPolynomialAlgebra(unittest.TestCase):
+    def test_pow(self):
+        p = Polynomial([1, 1])
+        self.assertEqual((p ** 5).coeffs, [1, 5, 10, 10, 5, 1])
+        self.assertEqual(p ** 0, Polynomial.one())
+        self.assertEqual(pow(p, 5, Polynomial([0, 0, 1])).coeffs, [1, 5])
+        q = Polynomial([2, -1, 3, 0, 1])
+        expected = Polynomial.one()
+        for _ in range(9):
+            expected = expected * q
+        self.assertEqual(q ** 9, expected)
+        with self.assertRaises(ValueError):
+            p ** -1
+
+    def test_sparse_pow_stays_sparse(self):
+        from SparsePolynomial import SparsePolynomial
+        p = Polynomial.monomial(10 ** 6) + Polynomial.one()
+        q = p ** 3
+        self.assertIsInstance(q, SparsePolynomial)
+        self.assertEqual(q.terms, {0: 1, 10 ** 6: 3, 2 * 10 ** 6: 3, 3 * 10 ** 6: 1})
+
+    def test_compose(self):
+        p = Polynomial([1, 2, 3])
+        q = Polynomial([0, 1, 1])
+        self.assertEqual(p.compose(q).coeffs, [1, 2, 5, 6, 3])
+        self.assertEqual(p.compose(Polynomial([2])).coeffs, [17])
+        big = Polynomial([(i * 7) % 11 - 5 for i in range(100)])
+        inner = Polynomial([1, -2, 1])
+        composed = big.compose(inner)
+        self.assertEqual(composed.degree, 198)
+        for x in (-2, 0, 3):
+            self.assertEqual(composed(x), big(inner(x)))
+
+    def test_shift(self):
+        p = Polynomial([1, 2, 3])
+        self.assertEqual(p.shift(1).coeffs, [6, 8, 3])
+        self.assertEqual(p.shift(1).shift(-1), p)
+        floats = Polynomial([0.5, -1.0, 0.25, 2.0] * 20)
+        shifted = floats.shift(0.5)
+        for x in (-0.5, 0.0, 0.25):
+            self.assertAlmostEqual(shifted(x), floats(x + 0.5), places=9)
+
+    def test_prime_field_shift(self):
+        from CoefficientField import PrimeField
+        gf = PrimeField(998244353)
+        p = Polynomial([(i * 31337) % 1000 for i in range(300)], field=gf)
+        shifted = p.shift(5)
+        self.assertEqual(shifted.shift(-5), p)
+        self.assertEqual(shifted(7), p(12))
+
+    def test_derivative_and_integral(self):
+        p = Polynomial([1, 2, 3])
+        self.assertEqual(p.derivative().coeffs, [2, 6])
+        self.assertEqual(Polynomial([5]).derivative(), Polynomial.zero())
+        self.assertEqual(p.integral().coeffs, [0, 1, 1, 1])
+        self.assertEqual(Polynomial([1, 1]).integral(3).coeffs, [3, 1, Fraction(1, 2)])
+        self.assertEqual(p.integral().derivative(), p)
+
+    @unittest.skipIf(np is None, "NumPy не установлен")
+    def test_numpy_derivative_and_integral(self):
+        p = Polynomial(np.array([1.0, 2.0, 3.0]))
+        self.assertEqual(p.derivative().coeffs, [2.0, 6.0])
+        self.assertEqual(p.integral().coeffs, [0.0, 1.0, 1.0, 1.0])
+        self.assertEqual(p.integral().storage, "numpy")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,67 @@
+import random
+import unittest
+from Polynomial import Polynomial
+
+try:
+    import numpy as np
+    from PolynomialArray import PolynomialArray
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, "NumPy не установлен")
+class TestPolynomialArray(unittest.TestCase):
+    def setUp(self):
+        self.rng = random.Random(9)
+        self.polys = [Polynomial([1, 2, 3]), Polynomial([0, 1]), Polynomial([5])]
+        self.batch = PolynomialArray.from_polynomials(self.polys)
+
+    def test_round_trip(self):
+        self.assertEqual(self.batch.shape, (3, 3))
+        self.assertEqual(self.batch.coeffs.tolist(), [[1, 2, 3], [0, 1, 0], [5, 0, 0]])
+        self.assertEqual(self.batch.to_polynomials(), self.polys)
+        self.assertEqual(self.batch[1], Polynomial([0, 1]))
+        self.assertEqual(len(self.batch[1:]), 2)
+        self.assertEqual(self.batch.degrees.tolist(), [2, 1, 0])
+        numpy_polys = self.batch.to_polynomials(storage="numpy")
+        self.assertEqual(numpy_polys[0].storage, "numpy")
+
+    def test_from_mixed_storage(self):
+        polys = [Polynomial(np.array([1.5, 2.0])), Polynomial.monomial(100), Polynomial([])]
+        batch = PolynomialArray.from_polynomials(polys)
+        self.assertEqual(batch.shape, (3, 101))
+        self.assertEqual(batch[1], Polynomial.monomial(100))
+        self.assertEqual(batch[2], Polynomial.zero())
+        with self.assertRaises(TypeError):
+            PolynomialArray.from_polynomials([1, 2])
+
+    def test_add_sub(self):
+        total = self.batch + self.batch
+        self.assertEqual(total.to_polynomials(), [p + p for p in self.polys])
+        shifted = self.batch - Polynomial([0, 0, 0, 1])
+        self.assertEqual(shifted.to_polynomials(), [p - Polynomial([0, 0, 0, 1]) for p in self.polys])
+        self.assertEqual((Polynomial([1]) + self.batch)[2], Polynomial([6]))
+        self.assertEqual((self.batch - self.batch).shape, (3, 1))
+        with self.assertRaises(ValueError):
+            self.batch + PolynomialArray([[1], [2]])
+
+    def test_multiplication(self):
+        self.assertEqual((self.batch * self.batch).to_polynomials(), [p * p for p in self.polys])
+        self.assertEqual((2 * self.batch)[0], Polynomial([2, 4, 6]))
+        polys = [Polynomial([self.rng.randint(-9, 9) for _ in range(100)]) for _ in range(5)]
+        batch = PolynomialArray.from_polynomials(polys)
+        self.assertEqual((batch * batch).to_polynomials(), [p * p for p in polys])
+
+    def test_evaluate(self):
+        self.assertEqual(self.batch(2).tolist(), [17, 2, 5])
+        self.assertEqual(self.batch.evaluate([1, 2, 3]).tolist(), [6, 2, 5])
+        values = self.batch.evaluate_many([0, 1, -1])
+        self.assertEqual(values.tolist(), [p.evaluate_many([0, 1, -1]) for p in self.polys])
+
+    def test_derivative(self):
+        self.assertEqual(self.batch.derivative().to_polynomials(),
+                         [Polynomial([2, 6]), Polynomial([1]), Polynomial([0])])
+
+
+if __name__ == "__main__":
+    unittest.main()
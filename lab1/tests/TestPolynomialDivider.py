@@ -0,0 +1,115 @@
+import random
+import unittest
+from fractions import Fraction
+from Polynomial import Polynomial
+from PolynomialDivider import PolynomialDivider, poly_divmod
+from PolynomialMultiplier import multiply
+
+
+class TestPolynomialDivider(unittest.TestCase):
+    def setUp(self):
+        self.rng = random.Random(3)
+
+    def test_divmod_with_remainder(self):
+        # (2x^3 + 3x^2 + x + 5) = (x + 1)(2x^2 + x) + 5
+        q, r = poly_divmod([5, 1, 3, 2], [1, 1])
+        self.assertEqual(q, [0, 1, 2])
+        self.assertEqual(r, [5])
+
+    def test_exact_fractions_for_integers(self):
+        q, r = poly_divmod([1, 0, 1], [0, 2])  # (x^2 + 1) / 2x
+        self.assertEqual(q, [0, Fraction(1, 2)])
+        self.assertEqual(r, [1])
+        self.assertIsInstance(q[1], Fraction)
+
+    def test_true_mode_gives_floats(self):
+        q, _ = poly_divmod([1, 0, 1], [0, 2], mode="true")
+        self.assertIsInstance(q[1], float)
+        with self.assertRaises(ValueError):
+            poly_divmod([1], [1], mode="floor")
+
+    def test_lower_degree_and_zero_divisor(self):
+        self.assertEqual(poly_divmod([1, 2], [0, 0, 1]), ([0], [1, 2]))
+        with self.assertRaises(ZeroDivisionError):
+            poly_divmod([1, 2], [0, 0])
+        with self.assertRaises(ZeroDivisionError):
+            poly_divmod([1, 2], [])
+
+    def test_inverse_series(self):
+        divider = PolynomialDivider()
+        # 1 / (1 - x) = 1 + x + x^2 + ...
+        self.assertEqual(divider.inverse_series([1, -1], 6), [1] * 6)
+        with self.assertRaises(ZeroDivisionError):
+            divider.inverse_series([0, 1], 3)
+
+    def test_newton_matches_long_division(self):
+        b = [self.rng.uniform(-1, 1) for _ in range(300)] + [300.0]
+        q = [self.rng.uniform(-1, 1) for _ in range(400)]
+        r = [self.rng.uniform(-1, 1) for _ in range(300)]
+        a = multiply(b, q)
+        a = [x + (r[i] if i < len(r) else 0) for i, x in enumerate(a)]
+        quotient, remainder = poly_divmod(a, b)
+        self.assertEqual(len(quotient), len(q))
+        for expected, actual in zip(q, quotient):
+            self.assertAlmostEqual(expected, actual, places=9)
+        for expected, actual in zip(r, remainder):
+            self.assertAlmostEqual(expected, actual, places=6)
+
+    def test_newton_falls_back_for_roots_outside_unit_disk(self):
+        b = multiply([-1.3, 1.0], [1.0] * 100)  # (x - 1.3)(1 + x + ... + x^99)
+        q = [self.rng.uniform(-1, 1) for _ in range(100)]
+        r = [self.rng.uniform(-1, 1) for _ in range(100)]
+        a = multiply(b, q)
+        a = [x + (r[i] if i < len(r) else 0) for i, x in enumerate(a)]
+        quotient, remainder = poly_divmod(a, b)
+        self.assertEqual(len(quotient), len(q))
+        for expected, actual in zip(q, quotient):
+            self.assertAlmostEqual(expected, actual, places=3)
+
+    def test_float_remainder_noise_is_trimmed(self):
+        b = [self.rng.uniform(-1, 1) for _ in range(5)] + [1.0]
+        q = [self.rng.uniform(-1, 1) for _ in range(7)]
+        _, remainder = poly_divmod(multiply(b, q), b)
+        self.assertEqual(len(remainder), 1)
+        self.assertAlmostEqual(remainder[0], 0.0, places=9)
+
+
+class TestPolynomialDivmodOperators(unittest.TestCase):
+    def test_divmod_operators(self):
+        p = Polynomial([5, 1, 3, 2])
+        d = Polynomial([1, 1])
+        q, r = divmod(p, d)
+        self.assertEqual(q.coeffs, [0, 1, 2])
+        self.assertEqual(r.coeffs, [5])
+        self.assertEqual(p // d, q)
+        self.assertEqual(p % d, r)
+        self.assertEqual(d * q + r, p)
+
+    def test_integer_results_stay_exact(self):
+        p = Polynomial([-1, 0, 0, 1])  # x^3 - 1
+        q, r = divmod(p, Polynomial([-1, 1]))
+        self.assertEqual(q.coeffs, [1, 1, 1])
+        self.assertTrue(all(isinstance(c, int) for c in q.coeffs))
+        self.assertEqual(r.coeffs, [0])
+
+    def test_fraction_coefficients(self):
+        p = Polynomial([Fraction(1, 3), Fraction(1, 2), Fraction(2, 3)])
+        d = Polynomial([Fraction(1, 5), Fraction(3, 7)])
+        q, r = divmod(p, d)
+        self.assertEqual(d * q + r, p)
+        self.assertEqual(r.degree, 0)
+
+    def test_truediv_keeps_float_semantics(self):
+        q = Polynomial([1, 0, 1]) / Polynomial([0, 2])
+        self.assertEqual(q.coeffs, [0, 0.5])
+        self.assertIsInstance(q.coeffs[1], float)
+
+    def test_division_by_zero(self):
+        with self.assertRaises(ZeroDivisionError):
+            divmod(Polynomial([1, 2]), Polynomial([0]))
+        with self.assertRaises(ZeroDivisionError):
+            Polynomial([1, 2]) % Polynomial([])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+import random
+import unittest
+from fractions import Fraction
+from Polynomial import Polynomial
+from PolynomialMultiplier import PolynomialMultiplier, multiply
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class TestPolynomialMultiplier(unittest.TestCase):
+    def setUp(self):
+        self.rng = random.Random(42)
+
+    def _random_ints(self, n, bound=1000):
+        return [self.rng.randint(-bound, bound) for _ in range(n)]
+
+    def test_small_products(self):
+        for method in ("schoolbook", "karatsuba"):
+            self.assertEqual(multiply([1, 1], [1, -1], method=method), [1, 0, -1])
+            self.assertEqual(multiply([2], [3, 4], method=method), [6, 8])
+        self.assertEqual(multiply([], [1, 2]), [])
+
+    def test_karatsuba_matches_schoolbook(self):
+        for n, m in ((100, 100), (257, 60), (40, 300)):
+            a = self._random_ints(n)
+            b = self._random_ints(m)
+            self.assertEqual(multiply(a, b, method="karatsuba"),
+                             multiply(a, b, method="schoolbook"))
+
+    def test_karatsuba_exact_fractions(self):
+        a = [Fraction(self.rng.randint(1, 9), self.rng.randint(1, 9)) for _ in range(80)]
+        b = [Fraction(self.rng.randint(1, 9), self.rng.randint(1, 9)) for _ in range(70)]
+        result = multiply(a, b)
+        self.assertEqual(result, multiply(a, b, method="schoolbook"))
+        self.assertTrue(all(isinstance(x, Fraction) for x in result))
+
+    def test_invalid_method(self):
+        with self.assertRaises(ValueError):
+            PolynomialMultiplier(method="unknown")
+
+    def test_coefficient_kind(self):
+        self.assertEqual(PolynomialMultiplier.coefficient_kind([1, 2], [3]), "int")
+        self.assertEqual(PolynomialMultiplier.coefficient_kind([1, 2.5]), "float")
+        self.assertEqual(PolynomialMultiplier.coefficient_kind([1j], [1.0]), "complex")
+        self.assertEqual(PolynomialMultiplier.coefficient_kind([Fraction(1, 2)], [1.0]), "other")
+
+    def test_polynomial_uses_engine(self):
+        a = self._random_ints(200)
+        b = self._random_ints(150)
+        expected = multiply(a, b, method="schoolbook")
+        p = Polynomial(a)
+        self.assertEqual((p * Polynomial(b)).coeffs, expected)
+        p *= Polynomial(b)
+        self.assertEqual(p.coeffs, expected)
+
+    def test_set_multiplier(self):
+        default = Polynomial.get_multiplier()
+        try:
+            Polynomial.set_multiplier(PolynomialMultiplier(method="karatsuba"))
+            self.assertEqual((Polynomial([1, 1]) * Polynomial([1, -1])).coeffs, [1, 0, -1])
+            with self.assertRaises(TypeError):
+                Polynomial.set_multiplier("karatsuba")
+        finally:
+            Polynomial.set_multiplier(default)
+
+
+@unittest.skipIf(np is None, "NumPy не установлен")
+class TestFastMultiplication(unittest.TestCase):
+    def setUp(self):
+        self.rng = random.Random(7)
+
+    def test_method_selection(self):
+        engine = PolynomialMultiplier()
+        self.assertEqual(engine.select_method([1] * 10, [1] * 10), "schoolbook")
+        self.assertEqual(engine.select_method([1] * 64, [1] * 64), "karatsuba")
+        self.assertEqual(engine.select_method([1] * 200, [1] * 200), "karatsuba")
+        self.assertEqual(engine.select_method([1] * 500, [1] * 500), "ntt")
+        self.assertEqual(engine.select_method([1.0] * 500, [1] * 500), "fft")
+        self.assertEqual(engine.select_method([Fraction(1)] * 500, [1] * 500), "karatsuba")
+
+    def test_ntt_is_exact(self):
+        a = [self.rng.randint(-10 ** 9, 10 ** 9) for _ in range(1000)]
+        b = [self.rng.randint(-10 ** 9, 10 ** 9) for _ in range(700)]
+        self.assertEqual(multiply(a, b, method="ntt"), multiply(a, b, method="karatsuba"))
+
+    def test_ntt_falls_back_for_huge_coefficients(self):
+        a = [10 ** 30 + i for i in range(200)]
+        b = [10 ** 30 - i for i in range(200)]
+        self.assertEqual(multiply(a, b, method="ntt"), multiply(a, b, method="karatsuba"))
+
+    def test_ntt_rejects_oversized_transform(self):
+        # Длина свертки 2^23 + 1 требует NTT длины 2^24: у 998244353 нет корня такого порядка
+        half = [0] * ((1 << 22) + 1)
+        with self.assertRaises(ValueError):
+            PolynomialMultiplier().convolve_mod(half, half, PolynomialMultiplier.NTT_PRIMES[0])
+
+    def test_ntt_splits_past_max_size(self):
+        # Тот же путь, что и за границей 2^23, на уменьшенной границе
+        limit = PolynomialMultiplier.NTT_MAX_SIZE
+        PolynomialMultiplier.NTT_MAX_SIZE = 1 << 10
+        try:
+            n = (1 << 10) - 1
+            a = [1] + [0] * (n - 1) + [1]
+            b = [1] + [0] * 398 + [1]
+            product = multiply(a, b, method="ntt")
+            self.assertEqual({i: c for i, c in enumerate(product) if c}, {0: 1, 399: 1, n: 1, n + 399: 1})
+            c = [self.rng.randint(-10 ** 9, 10 ** 9) for _ in range(1500)]
+            d = [self.rng.randint(-10 ** 9, 10 ** 9) for _ in range(900)]
+            self.assertEqual(multiply(c, d, method="ntt"), multiply(c, d, method="karatsuba"))
+        finally:
+            PolynomialMultiplier.NTT_MAX_SIZE = limit
+
+    def test_ntt_rejects_floats(self):
+        with self.assertRaises(ValueError):
+            multiply([1.5] * 4, [1] * 4, method="ntt")
+
+    def test_fft_matches_schoolbook(self):
+        a = [self.rng.uniform(-1, 1) for _ in range(600)]
+        b = [self.rng.uniform(-1, 1) for _ in range(400)]
+        np.testing.assert_allclose(multiply(a, b, method="fft"),
+                                   multiply(a, b, method="schoolbook"), atol=1e-9)
+        c = [complex(x, -x) for x in a[:300]]
+        np.testing.assert_allclose(multiply(c, b, method="fft"),
+                                   multiply(c, b, method="schoolbook"), atol=1e-9)
+
+    def test_small_int64_arrays_do_not_overflow(self):
+        a = np.full(10, 2 ** 40, dtype=np.int64)
+        product = multiply(a, a)
+        self.assertEqual(product.tolist(), [min(i + 1, 19 - i) * 2 ** 80 for i in range(19)])
+        self.assertEqual(multiply(a, a, method="karatsuba").tolist(), product.tolist())
+        small = np.arange(1, 11)
+        self.assertEqual(multiply(small, small).dtype, np.int64)
+
+    def test_numpy_storage_product(self):
+        a = np.arange(1, 301)
+        b = np.arange(300, 0, -1)
+        p = Polynomial(a) * Polynomial(b)
+        self.assertEqual(p.storage, "numpy")
+        self.assertEqual(p.coeffs, np.convolve(a, b).tolist())
+
+
+if __name__ == "__main__":
+    unittest.main()
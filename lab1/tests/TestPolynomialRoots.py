@@ -0,0 +1,74 @@
+import random
+import unittest
+from Polynomial import Polynomial
+from CoefficientField import PrimeField
+
+try:
+    import numpy as np
+    from PolynomialArray import PolynomialArray
+    from PolynomialRoots import PolynomialRoots, roots, batch_roots
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, "NumPy не установлен")
+class TestPolynomialRoots(unittest.TestCase):
+    def setUp(self):
+        self.rng = random.Random(10)
+
+    def assertSameRoots(self, actual, expected, places=7):
+        actual = sorted(actual, key=lambda z: (round(z.real, 6), round(z.imag, 6)))
+        expected = sorted(expected, key=lambda z: (round(z.real, 6), round(z.imag, 6)))
+        self.assertEqual(len(actual), len(expected))
+        for a, e in zip(actual, expected):
+            self.assertAlmostEqual(abs(a - e), 0, places=places)
+
+    def test_polynomial_roots(self):
+        self.assertSameRoots(Polynomial([2, 3, 1]).roots(), [-1, -2])
+        self.assertSameRoots(Polynomial([1, 0, 1]).roots(), [1j, -1j])
+        self.assertEqual(len(Polynomial([5]).roots()), 0)
+        with self.assertRaises(ValueError):
+            Polynomial.zero().roots()
+        with self.assertRaises(ValueError):
+            Polynomial([1, 1], field=PrimeField(7)).roots()
+
+    def test_zero_roots_are_exact(self):
+        found = roots([0, 0, -2, 2])  # 2x^3 - 2x^2
+        self.assertEqual(sorted(found, key=abs)[:2], [0, 0])
+        self.assertSameRoots(found, [0, 0, 1])
+
+    def test_methods_agree(self):
+        coeffs = [self.rng.uniform(-1, 1) for _ in range(200)]
+        self.assertSameRoots(roots(coeffs, method="aberth"), roots(coeffs, method="companion"), places=6)
+        with self.assertRaises(ValueError):
+            PolynomialRoots(method="newton")
+
+    def test_high_degree_aberth(self):
+        coeffs = [self.rng.gauss(0, 1) for _ in range(1001)]
+        found = roots(coeffs)
+        self.assertEqual(len(found), 1000)
+        values = np.polynomial.polynomial.polyval(found, coeffs)
+        scale = np.polynomial.polynomial.polyval(np.abs(found), np.abs(coeffs))
+        self.assertLess((np.abs(values) / scale).max(), 1e-10)
+
+    def test_batch_roots(self):
+        polys = [Polynomial([1, 1]), Polynomial([-1, 0, 0, 1]), Polynomial([4])]
+        result = batch_roots(polys)
+        self.assertEqual(result.shape, (3, 3))
+        self.assertAlmostEqual(result[0, 0], -1)
+        self.assertTrue(np.isnan(result[0, 1:]).all())
+        self.assertSameRoots(result[1], [1, np.exp(2j * np.pi / 3), np.exp(-2j * np.pi / 3)])
+        self.assertTrue(np.isnan(result[2]).all())
+        self.assertTrue(np.array_equal(PolynomialArray.from_polynomials(polys).roots(), result, equal_nan=True))
+
+    def test_batch_quartics(self):
+        matrix = np.random.default_rng(10).standard_normal((2000, 5))
+        for method in ("companion", "aberth"):
+            found = batch_roots(matrix, method=method)
+            values = sum(matrix[:, [i]] * found ** i for i in range(5))
+            scale = sum(np.abs(matrix[:, [i]]) * np.abs(found) ** i for i in range(5))
+            self.assertLess((np.abs(values) / scale).max(), 1e-10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import random
+import unittest
+from CantorSet import CantorSet
+from PowerSet import PowerSet
+
+
+class TestPowerSet(unittest.TestCase):
+    def setUp(self):
+        self.base = CantorSet("{a, b, {c}}")
+        self.power = self.base.power_set()
+
+    def test_len_and_indexing(self):
+        self.assertEqual(len(self.power), 8)
+        self.assertEqual(self.power[0], CantorSet())
+        self.assertEqual(self.power[0b101], CantorSet("{a, {c}}"))
+        self.assertEqual(self.power[-1], self.base)
+        with self.assertRaises(IndexError):
+            self.power[8]
+
+    def test_iteration_matches_bullean(self):
+        subsets = list(self.power)
+        self.assertEqual(len(subsets), 8)
+        bullean = self.base.bullean()
+        self.assertEqual(len(bullean), 8)
+        self.assertEqual(set(map(hash, subsets)), set(map(hash, bullean)))
+        self.assertEqual([s.size for s in bullean], [0, 1, 1, 1, 2, 2, 2, 3])
+
+    def test_membership_and_index(self):
+        self.assertIn(CantorSet("{{c}, b}"), self.power)
+        self.assertNotIn(CantorSet("{a, d}"), self.power)
+        self.assertNotIn("a", self.power)
+        subset = CantorSet("{b, {c}}")
+        self.assertEqual(self.power[self.power.index(subset)], subset)
+
+    def test_large_base_is_lazy(self):
+        base = CantorSet(["e{}".format(i) for i in range(200)])
+        power = PowerSet(base)
+        self.assertEqual(power.cardinality, 2 ** 200)
+        subset = power[(1 << 199) | 1]
+        self.assertEqual(subset, CantorSet("{e0, e199}"))
+        self.assertIn(subset, power)
+        samples = power.sample(5, rng=random.Random(1))
+        self.assertEqual(len(samples), 5)
+        self.assertTrue(all(s in power for s in samples))
+        with self.assertRaises(OverflowError):
+            len(power)
+
+    def test_snapshot(self):
+        base = CantorSet("{a}")
+        power = base.power_set()
+        base.add("b")
+        self.assertEqual(len(power), 2)
+        self.assertLessEqual(power.sample(rng=random.Random(0)).size, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+import random
+import unittest
+from Polynomial import Polynomial
+from SparsePolynomial import SparsePolynomial
+from PolynomialMultiplier import PolynomialMultiplier
+from CoefficientField import PrimeField
+
+
+class TestSparsePolynomial(unittest.TestCase):
+    def setUp(self):
+        Polynomial.reset_instance_count()
+
+    def test_high_degree_monomial_is_sparse(self):
+        p = Polynomial.monomial(10 ** 7)
+        self.assertIsInstance(p, SparsePolynomial)
+        self.assertEqual(p.degree, 10 ** 7)
+        self.assertEqual(p.terms, {10 ** 7: 1})
+        self.assertEqual(p[10 ** 7], 1)
+        self.assertEqual(p[5], 0)
+        self.assertEqual(repr(p), "1*x^10000000")
+
+    def test_low_degree_monomial_stays_dense(self):
+        p = Polynomial.monomial(3, 5)
+        self.assertNotIsInstance(p, SparsePolynomial)
+        self.assertEqual(p.coeffs, [0, 0, 0, 5])
+
+    def test_from_terms_density(self):
+        self.assertIsInstance(Polynomial.from_terms({0: 1, 1000: 2}), SparsePolynomial)
+        dense = Polynomial.from_terms({i: 1 for i in range(100)})
+        self.assertNotIsInstance(dense, SparsePolynomial)
+        self.assertEqual(dense.degree, 99)
+        with self.assertRaises(ValueError):
+            Polynomial.from_terms({-1: 1})
+
+    def test_init_drops_zeros_and_merges(self):
+        p = SparsePolynomial([(5, 2), (5, -2), (3, 1), (0, 0)])
+        self.assertEqual(p.terms, {3: 1})
+        self.assertEqual(p.degree, 3)
+        self.assertEqual(SparsePolynomial().degree, 0)
+        self.assertEqual(SparsePolynomial(), Polynomial.zero())
+
+    def test_instance_count(self):
+        SparsePolynomial({100: 1})
+        Polynomial.monomial(1000)
+        self.assertEqual(Polynomial.get_instance_count(), 2)
+
+    def test_mixed_add_sub(self):
+        x_n = Polynomial.monomial(1000)
+        dense = Polynomial([1, 2, 3])
+        s = x_n + dense
+        self.assertIsInstance(s, SparsePolynomial)
+        self.assertEqual(s.terms, {0: 1, 1: 2, 2: 3, 1000: 1})
+        self.assertEqual(dense + x_n, s)
+        self.assertEqual((dense - x_n).terms, {0: 1, 1: 2, 2: 3, 1000: -1})
+        self.assertEqual(s - x_n, dense)
+        self.assertNotIsInstance(s - x_n, SparsePolynomial)
+
+    def test_mixed_multiplication(self):
+        p = Polynomial.monomial(1000) + Polynomial.one()  # x^1000 + 1
+        q = p * p
+        self.assertEqual(q.terms, {0: 1, 1000: 2, 2000: 1})
+        r = Polynomial([1, 1]) * p
+        self.assertEqual(r.terms, {0: 1, 1: 1, 1000: 1, 1001: 1})
+        self.assertEqual((3 * p).terms, {0: 3, 1000: 3})
+        self.assertEqual((p * 0).terms, {})
+
+    def test_dense_product_uses_multiplier(self):
+        calls = []
+
+        class RecordingMultiplier(PolynomialMultiplier):
+            def multiply(self, a, b):
+                calls.append((len(a), len(b)))
+                return super().multiply(a, b)
+
+        rng = random.Random(4)
+        dense = Polynomial([rng.randint(-9, 9) for _ in range(2001)])
+        sparse = SparsePolynomial({0: 1, 3: 2, 100: -1, 1500: 4})
+        expected = sparse.to_dense() * dense
+        default = Polynomial.get_multiplier()
+        try:
+            Polynomial.set_multiplier(RecordingMultiplier())
+            self.assertEqual(sparse * dense, expected)
+            self.assertEqual(dense * sparse, expected)
+            self.assertEqual(len(calls), 2)
+            # Разреженное произведение по-прежнему считается попарно
+            p = SparsePolynomial({0: 1, 10 ** 6: 1})
+            self.assertEqual((p ** 3).terms, {0: 1, 10 ** 6: 3, 2 * 10 ** 6: 3, 3 * 10 ** 6: 1})
+            self.assertEqual(len(calls), 2)
+        finally:
+            Polynomial.set_multiplier(default)
+
+    def test_float_dense_product_keeps_sparse_support(self):
+        p = SparsePolynomial({0: 0.5, 200: 1.5})
+        q = Polynomial([0.25] * 100)
+        coeffs = (p * q).coeffs
+        self.assertEqual(coeffs[100:200], [0] * 100)
+        for coef in coeffs[:100]:
+            self.assertAlmostEqual(coef, 0.125)
+
+    def test_operations_with_field_operand(self):
+        gf = PrimeField(7)
+        g = Polynomial([3, 5, 6], field=gf)
+        x = SparsePolynomial({0: 5, 200: 6})
+        for result in (x * g, g * x, x + g, g - x):
+            self.assertEqual(result.field, gf)
+            self.assertTrue(all(0 <= c < 7 for c in result.coeffs))
+        self.assertEqual((x * g).coeffs[:3], [1, 4, 2])
+        self.assertEqual((x * g).coeffs[-3:], [4, 2, 1])
+        y = SparsePolynomial({0: 5, 200: 6})
+        y *= g
+        self.assertEqual(y, x * g)
+        self.assertEqual(y.field, gf)
+
+    def test_evaluate(self):
+        p = SparsePolynomial({0: 1, 100: 1})
+        self.assertEqual(p(2), 2 ** 100 + 1)
+        self.assertEqual(p.evaluate_many([1, -1]), [2, 2])
+        self.assertEqual(p([0.5]), [1.0 + 0.5 ** 100])
+
+    def test_equality_with_dense(self):
+        sparse = SparsePolynomial({0: 1, 2: 3})
+        dense = Polynomial([1, 0, 3])
+        self.assertEqual(sparse, dense)
+        self.assertEqual(dense, sparse)
+        self.assertEqual(sparse.coeffs, [1, 0, 3])
+        self.assertEqual(dense.to_sparse(), sparse)
+        self.assertEqual(sparse.to_dense().coeffs, [1, 0, 3])
+        self.assertNotEqual(sparse, Polynomial([1, 0, 4]))
+
+    def test_in_place_operations(self):
+        p = SparsePolynomial({1000: 1})
+        p += Polynomial.one()
+        p *= 2
+        self.assertIsInstance(p, SparsePolynomial)
+        self.assertEqual(p.terms, {0: 2, 1000: 2})
+        p -= SparsePolynomial({1000: 2})
+        self.assertEqual(p.terms, {0: 2})
+        self.assertEqual(p.degree, 0)
+        p /= Polynomial([2])
+        self.assertEqual(p.terms, {0: 1})
+
+    def test_division(self):
+        p = SparsePolynomial({0: 4, 200: 2})
+        self.assertEqual((p / Polynomial([2])).terms, {0: 2, 200: 1})
+        with self.assertRaises(ZeroDivisionError):
+            p / Polynomial([0])
+        q = Polynomial([-1, 0, 1]) / SparsePolynomial({0: -1, 1: 1})
+        self.assertEqual(q.coeffs, [1, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import random
+import unittest
+from fractions import Fraction
+from Polynomial import Polynomial
+from SubproductTree import SubproductTree
+from CoefficientField import PrimeField
+
+
+class TestSubproductTree(unittest.TestCase):
+    def setUp(self):
+        self.rng = random.Random(7)
+
+    def test_root_is_product_of_linear_factors(self):
+        tree = SubproductTree([1, 2, 3])
+        self.assertEqual(tree.root, [-6, 11, -6, 1])  # (x-1)(x-2)(x-3)
+        self.assertEqual(len(tree), 3)
+        self.assertEqual(SubproductTree([]).root, [1])
+
+    def test_evaluate_at_matches_horner(self):
+        p = Polynomial([self.rng.randint(-9, 9) for _ in range(300)])
+        xs = list(range(-150, 150))
+        self.assertEqual(p.evaluate_at(xs), [p(x) for x in xs])
+        self.assertEqual(p.evaluate_at([]), [])
+
+    def test_evaluate_at_floats(self):
+        p = Polynomial([self.rng.uniform(-1, 1) for _ in range(60)])
+        xs = [self.rng.uniform(-1, 1) for _ in range(60)]
+        for expected, actual in zip(p.evaluate_many(xs), p.evaluate_at(xs)):
+            self.assertAlmostEqual(expected, actual, places=6)
+
+    def test_evaluate_at_many_floats_is_stable(self):
+        n = 512
+        p = Polynomial([self.rng.uniform(-1, 1) for _ in range(n)])
+        xs = [self.rng.uniform(-1, 1) for _ in range(n)]
+        expected = [p(x) for x in xs]
+        for actual in (p.evaluate_at(xs), SubproductTree(xs).evaluate(p.coeffs)):
+            self.assertEqual(len(actual), n)
+            for e, a in zip(expected, actual):
+                self.assertAlmostEqual(e, a, places=9)
+
+    def test_tree_descent_only_over_bounded_fields(self):
+        class CountingTree(SubproductTree):
+            calls = 0
+
+            def _remainder(self, a, b):
+                CountingTree.calls += 1
+                return SubproductTree._remainder(self, a, b)
+
+        xs = list(range(100))
+        p = Polynomial([self.rng.randint(-9, 9) for _ in range(100)])
+        for points, coeffs in ((xs, p.coeffs), ([Fraction(x, 3) for x in xs], p.coeffs)):
+            tree = CountingTree(points)
+            CountingTree.calls = 0
+            self.assertEqual(tree.evaluate(coeffs), [p(x) for x in points])
+            self.assertEqual(CountingTree.calls, 0)
+        gf = PrimeField(998244353)
+        tree = CountingTree(xs, field=gf)
+        self.assertEqual(tree.evaluate(p.coeffs), [gf.convert(p(x)) for x in xs])
+        self.assertGreater(CountingTree.calls, 0)
+
+    def test_interpolate_integers(self):
+        self.assertEqual(Polynomial.interpolate([0, 1, 2], [1, 2, 5]).coeffs, [1, 0, 1])
+        p = Polynomial([self.rng.randint(-9, 9) for _ in range(100)])
+        xs = list(range(-50, 50))
+        q = Polynomial.interpolate(xs, p.evaluate_at(xs))
+        self.assertEqual(q, p)
+        self.assertTrue(all(isinstance(c, int) for c in q.coeffs))
+
+    def test_interpolate_fractions(self):
+        q = Polynomial.interpolate([0, 2], [0, 1])
+        self.assertEqual(q.coeffs, [0, Fraction(1, 2)])
+
+    def test_interpolate_errors(self):
+        with self.assertRaises(ValueError):
+            Polynomial.interpolate([1, 1], [2, 3])
+        with self.assertRaises(ValueError):
+            Polynomial.interpolate([1, 2], [2])
+
+    def test_prime_field_round_trip(self):
+        gf = PrimeField(998244353)
+        p = Polynomial([self.rng.randrange(gf.p) for _ in range(500)], field=gf)
+        xs = self.rng.sample(range(gf.p), 500)
+        values = p.evaluate_at(xs)
+        self.assertEqual(values, p.evaluate_many(xs))
+        self.assertEqual(Polynomial.interpolate(xs, values, field=gf), p)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,21 +1,89 @@
+from array import array
+from typing import Any, List
+
+try:
+    import numpy as np
+except ImportError:  # NumPy необязателен: без него работает только чистый Python
+    np = None
+
+
 class CountingSorter:
     """
     Класс, реализующий сортировку подсчётом над массивом неотрицательных целых чисел.
 
     Контракт:
-    - Вход: список неотрицательных целых чисел, параметр reverse
-    - Выход: новый отсортированный список
+    - Вход: список, array.array или numpy.ndarray неотрицательных целых чисел, параметр reverse
+    - Выход: новый отсортированный контейнер того же типа
     - Ошибки: ValueError при наличии отрицательных чисел
     - Сложность: O(n + k), память O(k)
+
+    Бэкенды:
+    - "numpy": bincount + repeat над массивом NumPy; array.array и ndarray
+      читаются без копирования, список преобразуется один раз
+    - "python": три цикла на чистом Python (подсчёт, префиксные суммы, укладка)
+    - "auto": NumPy для целочисленных входов от VECTOR_MIN_SIZE элементов,
+      иначе чистый Python
     """
 
-    def __init__(self, reverse: bool = False) -> None:
+    BACKENDS = ("auto", "numpy", "python")
+    # Меньшие входы быстрее сортируются циклами Python, чем преобразуются в ndarray
+    VECTOR_MIN_SIZE = 64
+
+    def __init__(self, reverse: bool = False, backend: str = "auto") -> None:
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown backend: {backend!r}, expected one of {self.BACKENDS}")
+        if backend == "numpy" and np is None:
+            raise ValueError("NumPy backend requested but NumPy is not installed")
         self.reverse = reverse
+        self.backend = backend
+
+    def sort(self, arr: Any) -> Any:
+        if len(arr) == 0:
+            return self._wrap(arr, [])
+
+        if self.backend != "python" and np is not None:
+            values = self._as_ndarray(arr)
+            if values is not None:
+                return self._wrap(arr, self._sort_numpy(values))
+            if self.backend == "numpy":
+                raise TypeError("NumPy backend requires integer input")
+
+        return self._wrap(arr, self._sort_python(arr))
+
+    def _as_ndarray(self, arr: Any) -> Any:
+        """Целочисленный ndarray над данными входа или None, если вектора не подходят."""
+        if isinstance(arr, np.ndarray):
+            values = arr
+        elif isinstance(arr, array):
+            if arr.typecode not in "bBhHiIlLqQ":
+                return None
+            values = np.frombuffer(arr, dtype=np.dtype(arr.typecode))  # Без копирования
+        elif self.backend == "auto" and len(arr) < self.VECTOR_MIN_SIZE:
+            return None
+        elif not set(map(type, arr)) <= {int}:
+            return None  # bool и подклассы int потеряли бы свой тип в массиве
+        else:
+            values = np.asarray(arr)
+        if values.ndim != 1 or values.dtype.kind not in "iu":
+            return None  # bool, float и большие целые (dtype object) - в чистый Python
+        return values
+
+    def _sort_numpy(self, values: Any) -> Any:
+        min_val = values.min()
+        if min_val < 0:
+            raise ValueError("Counting sort requires non-negative integers")
+        max_val = values.max()
 
-    def sort(self, arr: List[int]) -> List[int]:
-        if not arr:
-            return []
+        # Подсчёт вхождений и развёртка значений по счётчикам
+        count = np.bincount((values - min_val).astype(np.intp, copy=False))
+        output = np.repeat(np.arange(min_val, max_val + 1, dtype=values.dtype), count)
 
+        if self.reverse:
+            output = output[::-1]
+
+        return output
+
+    def _sort_python(self, arr: Any) -> List[int]:
         # Проверить на отрицательные числа
         if any(x < 0 for x in arr):
             raise ValueError("Counting sort requires non-negative integers")
@@ -47,8 +115,21 @@ class CountingSorter:
 
         return output
 
+    @staticmethod
+    def _wrap(arr: Any, output: Any) -> Any:
+        """Результат в контейнере того же типа, что и вход."""
+        if np is not None and isinstance(arr, np.ndarray):
+            return np.asarray(output, dtype=arr.dtype)
+        if isinstance(arr, array):
+            if np is not None and isinstance(output, np.ndarray):
+                return array(arr.typecode, np.ascontiguousarray(output, dtype=arr.typecode).tobytes())
+            return array(arr.typecode, output)
+        if np is not None and isinstance(output, np.ndarray):
+            return output.tolist()
+        return output
+
 
-def counting_sort(arr: List[int], reverse: bool = False) -> List[int]:
+def counting_sort(arr: List[int], reverse: bool = False, backend: str = "auto") -> List[int]:
     """
     @brief Сортирует список неотрицательных целых чисел используя алгоритм сортировки подсчётом
 
@@ -59,8 +140,9 @@ def counting_sort(arr: List[int], reverse: bool = False) -> List[int]:
 
     @param arr Список неотрицательных целых чисел для сортировки
     @param reverse Если True, сортировка по убыванию; иначе по возрастанию
+    @param backend "auto", "numpy" или "python" (см. CountingSorter)
     
-    @return Отсортированный список
+    @return Отсортированный контейнер того же типа (list, array.array или numpy.ndarray)
     
     @throws ValueError если список содержит отрицательные целые числа
 
@@ -74,4 +156,4 @@ def counting_sort(arr: List[int], reverse: bool = False) -> List[int]:
     print(sorted_arr)  # [1, 2, 2, 3, 3, 4, 8]
     @endcode
     """
-    return CountingSorter(reverse=reverse).sort(arr)
+    return CountingSorter(reverse=reverse, backend=backend).sort(arr)
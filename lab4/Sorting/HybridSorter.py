@@ -0,0 +1,257 @@
+from bisect import bisect_left, bisect_right
+from typing import Any, Callable, Generic, List, Optional, TypeVar
+
+T = TypeVar('T')
+
+
+class HybridSorter(Generic[T]):
+    """
+    Гибридная устойчивая сортировка: бинарные вставки для малых участков и
+    слияние естественных серий с галопом для больших входов.
+
+    Контракт:
+    - Вход: список элементов (сравнимых напрямую или через key), опциональные key и reverse
+    - Выход: новый отсортированный список, исходный список не изменяется
+    - Стабильность: сохраняет порядок элементов с одинаковым ключом (и при reverse=True)
+    - Сравнения: только оператор < над ключами; key вызывается один раз на элемент
+    - Сложность: O(n log n) худший, O(n) на уже упорядоченных сериях; память O(n)
+
+    Алгоритм:
+    - входы до INSERTION_THRESHOLD элементов сортируются бинарными вставками
+    - иначе вход делится на естественные серии (неубывающие или строго убывающие,
+      последние разворачиваются); короткие серии добиваются вставками до min_run
+    - серии сливаются попарно со стека с инвариантами длин, как в timsort;
+      если одна сторона слияния выигрывает MIN_GALLOP раз подряд, следующий
+      блок ее элементов находится экспоненциальным поиском и копируется срезом
+    - reverse=True: вход разворачивается, сортируется по возрастанию и
+      разворачивается обратно, что сохраняет порядок равных элементов
+    """
+
+    INSERTION_THRESHOLD = 64
+    MIN_GALLOP = 7
+
+    def __init__(self, key: Optional[Callable[[T], Any]] = None, reverse: bool = False) -> None:
+        self.key = key
+        self.reverse = reverse
+
+    def sort(self, arr: List[T]) -> List[T]:
+        items = list(arr)
+        if self.reverse:
+            items.reverse()
+
+        # Ключи вычисляются один раз; без key ключами служат сами элементы
+        if self.key is None:
+            keys, values = items, None
+        else:
+            keys, values = [self.key(item) for item in items], items
+
+        n = len(keys)
+        if n <= self.INSERTION_THRESHOLD:
+            self._binary_insertion(keys, values, 0, n, 1)
+        else:
+            self._merge_runs(keys, values)
+
+        if self.reverse:
+            items.reverse()
+
+        return items
+
+    # Бинарные вставки
+    @staticmethod
+    def _binary_insertion(keys: list, values: Optional[list], lo: int, hi: int, start: int) -> None:
+        """Сортирует keys[lo:hi], если keys[lo:start] уже упорядочен."""
+        for i in range(max(start, lo + 1), hi):
+            key_val = keys[i]
+            # Правая граница равных ключей - устойчивость
+            pos = bisect_right(keys, key_val, lo, i)
+            if pos != i:
+                # Сдвиг среза внутри участка (insert/pop сдвигали бы весь хвост списка)
+                keys[pos + 1:i + 1] = keys[pos:i]
+                keys[pos] = key_val
+                if values is not None:
+                    value = values[i]
+                    values[pos + 1:i + 1] = values[pos:i]
+                    values[pos] = value
+
+    # Естественные серии
+    @staticmethod
+    def _min_run(n: int) -> int:
+        """Минимальная длина серии из [32, 64]: n / min_run близко к степени двойки."""
+        remainder = 0
+        while n >= 64:
+            remainder |= n & 1
+            n >>= 1
+        return n + remainder
+
+    @staticmethod
+    def _count_run(keys: list, values: Optional[list], lo: int, n: int) -> int:
+        """Длина серии с позиции lo; строго убывающая серия разворачивается на месте."""
+        hi = lo + 1
+        if hi == n:
+            return 1
+        if keys[hi] < keys[lo]:
+            hi += 1
+            while hi < n and keys[hi] < keys[hi - 1]:
+                hi += 1
+            keys[lo:hi] = keys[lo:hi][::-1]
+            if values is not None:
+                values[lo:hi] = values[lo:hi][::-1]
+        else:
+            hi += 1
+            while hi < n and not keys[hi] < keys[hi - 1]:
+                hi += 1
+        return hi - lo
+
+    def _merge_runs(self, keys: list, values: Optional[list]) -> None:
+        n = len(keys)
+        min_run = self._min_run(n)
+        stack = []  # Серии [начало, длина], ожидающие слияния
+        lo = 0
+        while lo < n:
+            run = self._count_run(keys, values, lo, n)
+            if run < min_run:
+                forced = min(min_run, n - lo)
+                self._binary_insertion(keys, values, lo, lo + forced, lo + run)
+                run = forced
+            stack.append([lo, run])
+            self._merge_collapse(keys, values, stack)
+            lo += run
+
+        while len(stack) > 1:
+            i = len(stack) - 2
+            if i > 0 and stack[i - 1][1] < stack[i + 1][1]:
+                i -= 1
+            self._merge_at(keys, values, stack, i)
+
+    def _merge_collapse(self, keys: list, values: Optional[list], stack: list) -> None:
+        """Сливает серии, пока длины на стеке не убывают быстрее чисел Фибоначчи."""
+        while len(stack) > 1:
+            i = len(stack) - 2
+            if (i > 0 and stack[i - 1][1] <= stack[i][1] + stack[i + 1][1]) or \
+                    (i > 1 and stack[i - 2][1] <= stack[i - 1][1] + stack[i][1]):
+                if stack[i - 1][1] < stack[i + 1][1]:
+                    i -= 1
+            elif stack[i][1] > stack[i + 1][1]:
+                break
+            self._merge_at(keys, values, stack, i)
+
+    def _merge_at(self, keys: list, values: Optional[list], stack: list, i: int) -> None:
+        base, length = stack[i]
+        mid, right_length = stack[i + 1]
+        stack[i] = [base, length + right_length]
+        del stack[i + 1]
+        self._merge(keys, values, base, mid, mid + right_length)
+
+    # Слияние с галопом
+    def _merge(self, keys: list, values: Optional[list], lo: int, mid: int, hi: int) -> None:
+        """Сливает соседние упорядоченные участки [lo, mid) и [mid, hi)."""
+        # Начало левой серии и конец правой, уже стоящие на своих местах
+        lo = self._gallop_right(keys, keys[mid], lo, mid)
+        if lo == mid:
+            return
+        hi = self._gallop_left(keys, keys[mid - 1], mid, hi)
+
+        # Левая часть копируется во временный буфер, правая читается на месте
+        left_keys = keys[lo:mid]
+        left_values = values[lo:mid] if values is not None else None
+        i, left_length, j, dest = 0, len(left_keys), mid, lo
+        left_wins = right_wins = 0
+        while i < left_length and j < hi:
+            if keys[j] < left_keys[i]:
+                keys[dest] = keys[j]
+                if values is not None:
+                    values[dest] = values[j]
+                j += 1
+                dest += 1
+                right_wins += 1
+                left_wins = 0
+                if right_wins >= self.MIN_GALLOP:
+                    # Блок правых элементов, строго меньших текущего левого
+                    end = self._gallop_left(keys, left_keys[i], j, hi)
+                    keys[dest:dest + end - j] = keys[j:end]
+                    if values is not None:
+                        values[dest:dest + end - j] = values[j:end]
+                    dest += end - j
+                    j = end
+                    right_wins = 0
+            else:
+                keys[dest] = left_keys[i]
+                if values is not None:
+                    values[dest] = left_values[i]
+                i += 1
+                dest += 1
+                left_wins += 1
+                right_wins = 0
+                if left_wins >= self.MIN_GALLOP:
+                    # Блок левых элементов, не больших текущего правого
+                    end = self._gallop_right(left_keys, keys[j], i, left_length)
+                    keys[dest:dest + end - i] = left_keys[i:end]
+                    if values is not None:
+                        values[dest:dest + end - i] = left_values[i:end]
+                    dest += end - i
+                    i = end
+                    left_wins = 0
+
+        # Остаток правой части уже на месте, остаток левой - перед ним
+        keys[dest:dest + left_length - i] = left_keys[i:]
+        if values is not None:
+            values[dest:dest + left_length - i] = left_values[i:]
+
+    @staticmethod
+    def _gallop_left(a: list, x: Any, lo: int, hi: int) -> int:
+        """Первый индекс в [lo, hi) с не a[i] < x: экспоненциальный поиск от lo, затем бинарный."""
+        if lo >= hi or not a[lo] < x:
+            return lo
+        prev, step = lo, 1
+        while True:
+            cur = prev + step
+            if cur >= hi:
+                cur = hi
+                break
+            if not a[cur] < x:
+                break
+            prev, step = cur, step << 1
+        return bisect_left(a, x, prev + 1, cur)
+
+    @staticmethod
+    def _gallop_right(a: list, x: Any, lo: int, hi: int) -> int:
+        """Первый индекс в [lo, hi) с x < a[i]: экспоненциальный поиск от lo, затем бинарный."""
+        if lo >= hi or x < a[lo]:
+            return lo
+        prev, step = lo, 1
+        while True:
+            cur = prev + step
+            if cur >= hi:
+                cur = hi
+                break
+            if x < a[cur]:
+                break
+            prev, step = cur, step << 1
+        return bisect_right(a, x, prev + 1, cur)
+
+
+def hybrid_sort(arr: List[T], key: Optional[Callable[[T], Any]] = None, reverse: bool = False) -> List[T]:
+    """
+    @brief Сортирует список гибридной устойчивой сортировкой
+
+    @details Малые входы сортируются бинарными вставками, большие - слиянием
+             естественных серий с галопом (см. HybridSorter). Результат совпадает
+             с insertion_sort при тех же key и reverse, включая порядок равных элементов.
+
+    @param arr Список для сортировки
+    @param key Опциональная функция для извлечения ключа сравнения из каждого элемента
+    @param reverse Если True, сортировка по убыванию; иначе по возрастанию
+
+    @return Отсортированный список
+
+    @note Временная сложность: O(n log n) в худшем случае, O(n) на упорядоченных данных
+    @note Пространственная сложность: O(n)
+
+    @code
+    # Пример использования:
+    arr = [64, 34, 25, 12, 22, 11, 90]
+    sorted_arr = hybrid_sort(arr, reverse=True)
+    print(sorted_arr)  # [90, 64, 34, 25, 22, 12, 11]
+    @endcode
+    """
+    return HybridSorter(key=key, reverse=reverse).sort(arr)
@@ -1,5 +1,7 @@
 from typing import List, TypeVar, Callable, Optional, Any, Generic
 
+from HybridSorter import HybridSorter
+
 T = TypeVar('T')
 
 
@@ -12,35 +14,41 @@ class InsertionSorter(Generic[T]):
     - Выход: новый отсортированный список, исходный список не изменяется
     - Стабильность: сохраняет порядок элементов с одинаковым ключом
     - Сложность: O(n^2) худший, O(n) лучший; память O(1)
+    - hybrid_threshold: входы длиннее порога передаются HybridSorter
+      (тот же результат за O(n log n)); None - всегда сортировать вставками
     """
 
-    def __init__(self, key: Optional[Callable[[T], Any]] = None, reverse: bool = False) -> None:
+    # Порог, который использует insertion_sort по умолчанию
+    DEFAULT_HYBRID_THRESHOLD = HybridSorter.INSERTION_THRESHOLD
+
+    def __init__(self, key: Optional[Callable[[T], Any]] = None, reverse: bool = False,
+                 hybrid_threshold: Optional[int] = None) -> None:
         self.key = key
         self.reverse = reverse
+        self.hybrid_threshold = hybrid_threshold
 
     def sort(self, arr: List[T]) -> List[T]:
+        if self.hybrid_threshold is not None and len(arr) > self.hybrid_threshold:
+            return HybridSorter(key=self.key, reverse=self.reverse).sort(arr)
+
         result = arr.copy()
         n = len(result)
 
+        # Функция извлечения ключа выбирается один раз, а не на каждой итерации
+        compare_func = self.key if self.key is not None else (lambda x: x)
+
         for i in range(1, n):
             key_item = result[i]
+            key_val = compare_func(key_item)
             j = i - 1
 
-            # Извлечь значения для сравнения
-            if self.key is None:
-                key_val = key_item
-                compare_func = lambda x: x
-            else:
-                key_val = self.key(key_item)
-                compare_func = self.key
-
             # Переместить элементы относительно key_item
             if self.reverse:
                 while j >= 0 and compare_func(result[j]) < key_val:
                     result[j + 1] = result[j]
                     j -= 1
             else:
-                while j >= 0 and compare_func(result[j]) > key_val:
+                while j >= 0 and key_val < compare_func(result[j]):
                     result[j + 1] = result[j]
                     j -= 1
 
@@ -49,7 +57,8 @@ class InsertionSorter(Generic[T]):
         return result
 
 
-def insertion_sort(arr: List[T], key: Optional[Callable[[T], Any]] = None, reverse: bool = False) -> List[T]:
+def insertion_sort(arr: List[T], key: Optional[Callable[[T], Any]] = None, reverse: bool = False,
+                   hybrid_threshold: Optional[int] = InsertionSorter.DEFAULT_HYBRID_THRESHOLD) -> List[T]:
     """
     @brief Сортирует список используя алгоритм сортировки вставками
 
@@ -61,11 +70,14 @@ def insertion_sort(arr: List[T], key: Optional[Callable[[T], Any]] = None, rever
     @param arr Список для сортировки
     @param key Опциональная функция для извлечения ключа сравнения из каждого элемента
     @param reverse Если True, сортировка по убыванию; иначе по возрастанию
+    @param hybrid_threshold Списки длиннее порога сортируются HybridSorter с тем же
+           результатом (включая порядок равных элементов); None - только вставки
     
     @return Отсортированный список
     
-    @note Временная сложность: O(n^2) в худшем случае, O(n) в лучшем случае
-    @note Пространственная сложность: O(1)
+    @note Временная сложность: O(n^2) в худшем случае, O(n) в лучшем случае;
+          выше порога - O(n log n)
+    @note Пространственная сложность: O(1); выше порога - O(n)
 
     @code
     # Пример использования:
@@ -74,4 +86,4 @@ def insertion_sort(arr: List[T], key: Optional[Callable[[T], Any]] = None, rever
     print(sorted_arr)  # [11, 12, 22, 25, 34, 64, 90]
     @endcode
     """
-    return InsertionSorter(key=key, reverse=reverse).sort(arr)
+    return InsertionSorter(key=key, reverse=reverse, hybrid_threshold=hybrid_threshold).sort(arr)
@@ -0,0 +1,188 @@
+import operator
+from itertools import chain
+from typing import Any, List
+
+from CountingSorter import CountingSorter, np
+
+
+class IntegerSorter:
+    """
+    Адаптивная сортировка целых чисел любого знака и диапазона.
+
+    Контракт:
+    - Вход: список, array.array или numpy.ndarray целых чисел (в том числе отрицательных),
+      параметры reverse, digit_bits и backend
+    - Выход: новый отсортированный контейнер того же типа
+    - Ошибки: ValueError при неверных параметрах, TypeError для нецелых элементов
+      (целыми считаются объекты, поддерживающие operator.index)
+    - bool и другие подклассы int сортируются устойчиво по своему целому значению,
+      в выход попадают исходные объекты
+    - Сложность: O(n + k) подсчётом при диапазоне k <= COUNTING_RANGE_FACTOR * n,
+      иначе O(n * ceil(log2(k) / digit_bits)) поразрядной сортировкой (LSD);
+      память O(n + 2^digit_bits)
+
+    Отрицательные числа обрабатываются сдвигом на минимум: сортируются
+    неотрицательные смещения x - min, после чего минимум прибавляется обратно.
+    Поэтому ни массив подсчёта, ни число разрядов не зависят от знака.
+    Бэкенды - как у CountingSorter ("auto", "numpy", "python"). Бэкенд "python"
+    создаёт 2^digit_bits корзин на каждый проход, поэтому ширина его разряда
+    ограничена PYTHON_MAX_DIGIT_BITS.
+    """
+
+    BACKENDS = CountingSorter.BACKENDS
+    # Подсчёт выбирается, пока массив подсчёта не больше COUNTING_RANGE_FACTOR * n
+    COUNTING_RANGE_FACTOR = 4
+    # Наибольшая ширина разряда поразрядной сортировки на чистом Python
+    PYTHON_MAX_DIGIT_BITS = 16
+
+    def __init__(self, reverse: bool = False, digit_bits: int = 8, backend: str = "auto") -> None:
+        if not 1 <= digit_bits <= 24:
+            raise ValueError("digit_bits must be between 1 and 24")
+        self.reverse = reverse
+        self.digit_bits = digit_bits
+        self.backend = backend
+        self._counting = CountingSorter(backend=backend)  # Проверка бэкенда и разбор входа
+
+    def sort(self, arr: Any) -> Any:
+        if len(arr) == 0:
+            return CountingSorter._wrap(arr, [])
+
+        if self.backend != "python" and np is not None:
+            values = self._counting._as_ndarray(arr)
+            if values is not None:
+                return CountingSorter._wrap(arr, self._sort_numpy(values))
+            if self.backend == "numpy":
+                raise TypeError("NumPy backend requires integer input")
+
+        return CountingSorter._wrap(arr, self._sort_python(arr))
+
+    def _use_counting(self, span: int, n: int) -> bool:
+        return span + 1 <= self.COUNTING_RANGE_FACTOR * n
+
+    def _sort_python(self, arr: Any) -> List[int]:
+        if not set(map(type, arr)) <= {int}:
+            return self._sort_objects(arr)
+
+        min_val = min(arr)
+        span = max(arr) - min_val
+
+        if self._use_counting(span, len(arr)):
+            # Подсчёт вхождений смещений и развёртка по счётчикам
+            count = [0] * (span + 1)
+            for num in arr:
+                count[num - min_val] += 1
+            output = []
+            for offset, times in enumerate(count):
+                if times:
+                    output.extend([offset + min_val] * times)
+        else:
+            # LSD: стабильное распределение по корзинам от младшего разряда к старшему
+            keys = [num - min_val for num in arr]
+            bits = min(self.digit_bits, self.PYTHON_MAX_DIGIT_BITS)
+            mask = (1 << bits) - 1
+            for shift in range(0, span.bit_length(), bits):
+                buckets = [[] for _ in range(mask + 1)]
+                for key in keys:
+                    buckets[(key >> shift) & mask].append(key)
+                keys = list(chain.from_iterable(buckets))
+            output = [key + min_val for key in keys]
+
+        if self.reverse:
+            output.reverse()
+
+        return output
+
+    def _sort_objects(self, arr: Any) -> List[Any]:
+        """Устойчивая сортировка целых объектов (bool, IntEnum, ...) с сохранением самих объектов."""
+        items = list(arr)
+        try:
+            keys = [operator.index(item) for item in items]
+        except TypeError:
+            raise TypeError("IntegerSorter requires integer elements") from None
+        if self.reverse:
+            # Разворот до и после сортировки сохраняет порядок равных элементов
+            items.reverse()
+            keys.reverse()
+
+        min_val = min(keys)
+        span = max(keys) - min_val
+        pairs = [(key - min_val, item) for key, item in zip(keys, items)]
+
+        if self._use_counting(span, len(pairs)):
+            buckets = [[] for _ in range(span + 1)]
+            for offset, item in pairs:
+                buckets[offset].append(item)
+            output = list(chain.from_iterable(buckets))
+        else:
+            bits = min(self.digit_bits, self.PYTHON_MAX_DIGIT_BITS)
+            mask = (1 << bits) - 1
+            for shift in range(0, span.bit_length(), bits):
+                buckets = [[] for _ in range(mask + 1)]
+                for pair in pairs:
+                    buckets[(pair[0] >> shift) & mask].append(pair)
+                pairs = list(chain.from_iterable(buckets))
+            output = [item for _, item in pairs]
+
+        if self.reverse:
+            output.reverse()
+
+        return output
+
+    def _sort_numpy(self, values: Any) -> Any:
+        min_val = int(values.min())
+        span = int(values.max()) - min_val
+
+        # Смещения в uint64: вычитание по модулю 2^64 верно, так как span < 2^64
+        base = np.uint64(min_val % (1 << 64))
+        keys = values.astype(np.uint64) - base
+
+        if self._use_counting(span, len(values)):
+            count = np.bincount(keys.astype(np.intp))
+            keys = np.repeat(np.arange(span + 1, dtype=np.uint64), count)
+        else:
+            mask = np.uint64((1 << self.digit_bits) - 1)
+            # Для разрядов до 16 бит устойчивый argsort NumPy сам работает подсчётом
+            digit_type = np.uint16 if self.digit_bits <= 16 else np.uint32
+            for shift in range(0, span.bit_length(), self.digit_bits):
+                digits = ((keys >> np.uint64(shift)) & mask).astype(digit_type)
+                keys = keys[np.argsort(digits, kind="stable")]
+
+        output = (keys + base).astype(values.dtype)
+
+        if self.reverse:
+            output = output[::-1]
+
+        return output
+
+
+def integer_sort(arr: List[int], reverse: bool = False, digit_bits: int = 8, backend: str = "auto") -> List[int]:
+    """
+    @brief Сортирует целые числа любого знака, выбирая подсчёт или поразрядную сортировку
+
+    @details При диапазоне значений, сравнимом с длиной входа, используется сортировка
+             подсчётом; при широком диапазоне (например, [0, 10**9]) - поразрядная
+             сортировка LSD по digit_bits бит за проход, которой не нужен массив
+             размером во весь диапазон. Отрицательные числа сдвигаются на минимум.
+
+    @param arr Список (array.array, numpy.ndarray) целых чисел
+    @param reverse Если True, сортировка по убыванию; иначе по возрастанию
+    @param digit_bits Ширина разряда поразрядной сортировки в битах (1..24; бэкенд
+           "python" использует не больше IntegerSorter.PYTHON_MAX_DIGIT_BITS)
+    @param backend "auto", "numpy" или "python" (см. CountingSorter)
+
+    @return Отсортированный контейнер того же типа
+
+    @throws ValueError при неверных digit_bits или backend
+    @throws TypeError для нецелых элементов
+
+    @note Временная сложность: O(n + k) или O(n * log(k) / digit_bits)
+    @note Пространственная сложность: O(n + 2^digit_bits)
+
+    @code
+    # Пример использования:
+    arr = [10**9, -5, 0, 42, -10**12]
+    sorted_arr = integer_sort(arr)
+    print(sorted_arr)  # [-1000000000000, -5, 0, 42, 1000000000]
+    @endcode
+    """
+    return IntegerSorter(reverse=reverse, digit_bits=digit_bits, backend=backend).sort(arr)
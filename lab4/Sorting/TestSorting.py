@@ -4,8 +4,15 @@
 @details Комплексный набор тестов для функций insertion_sort и counting_sort
 """
 
+import random
 import unittest
-from sorting import insertion_sort, counting_sort, counting_sort_generic
+from array import array
+from sorting import insertion_sort, counting_sort, counting_sort_generic, integer_sort, hybrid_sort
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 class TestInsertionSort(unittest.TestCase):
@@ -146,6 +153,63 @@ class TestInsertionSortCustomObjects(unittest.TestCase):
         self.assertEqual(result[2].name, "zebra")
 
 
+class TestHybridSort(unittest.TestCase):
+    """Тестовые случаи для функции hybrid_sort и делегирования из insertion_sort"""
+
+    def setUp(self):
+        rng = random.Random(5)
+        self.inputs = [
+            [],
+            [rng.randrange(10) for _ in range(50)],
+            [rng.randrange(10) for _ in range(3000)],
+            [rng.random() for _ in range(3000)],
+            list(range(2000)) + list(range(1000, 0, -1)),
+            [rng.randrange(3) for _ in range(700)] * 3,
+        ]
+
+    def test_matches_sorted(self):
+        """Тест совпадения с sorted на разных распределениях"""
+        for data in self.inputs:
+            for reverse in (False, True):
+                self.assertEqual(hybrid_sort(data, reverse=reverse), sorted(data, reverse=reverse))
+
+    def test_stability_with_key_and_reverse(self):
+        """Тест стабильности с ключом в обоих направлениях"""
+        for data in self.inputs:
+            pairs = [(value, i) for i, value in enumerate(data)]
+            for reverse in (False, True):
+                expected = sorted(pairs, key=lambda p: p[0], reverse=reverse)
+                self.assertEqual(hybrid_sort(pairs, key=lambda p: p[0], reverse=reverse), expected)
+
+    def test_insertion_sort_delegates_above_threshold(self):
+        """Тест что insertion_sort на больших входах совпадает с чистыми вставками"""
+        pairs = [(value, i) for i, value in enumerate(self.inputs[2][:500])]
+        for reverse in (False, True):
+            expected = insertion_sort(pairs, key=lambda p: p[0], reverse=reverse, hybrid_threshold=None)
+            self.assertEqual(insertion_sort(pairs, key=lambda p: p[0], reverse=reverse), expected)
+
+    def test_large_input(self):
+        """Тест что 100000 элементов сортируются за O(n log n)"""
+        data = list(range(100000, 0, -1))
+        data[::7] = range(len(data[::7]))
+        arr = data[:]
+        self.assertEqual(insertion_sort(arr), sorted(data))
+        self.assertEqual(arr, data)
+
+    def test_only_less_than_is_used(self):
+        """Тест что достаточно оператора <"""
+        class OnlyLess:
+            def __init__(self, value):
+                self.value = value
+
+            def __lt__(self, other):
+                return self.value < other.value
+
+        objects = [OnlyLess(v) for v in self.inputs[2]]
+        result = hybrid_sort(objects, reverse=True)
+        self.assertEqual([o.value for o in result], sorted(self.inputs[2], reverse=True))
+
+
 class TestCountingSort(unittest.TestCase):
     """Тестовые случаи для функции counting_sort"""
     
@@ -221,6 +285,134 @@ class TestCountingSort(unittest.TestCase):
         self.assertEqual(result, [1, 1, 2, 3, 4, 5, 6, 9])
 
 
+@unittest.skipIf(np is None, "NumPy не установлен")
+class TestCountingSortNumpy(unittest.TestCase):
+    """Тестовые случаи для векторизованного бэкенда counting_sort"""
+
+    def setUp(self):
+        rng = random.Random(7)
+        self.data = [rng.randrange(1000) for _ in range(5000)]
+
+    def test_list_matches_python_backend(self):
+        """Тест совпадения бэкендов на списке"""
+        result = counting_sort(self.data, backend="numpy")
+        self.assertIsInstance(result, list)
+        self.assertEqual(result, counting_sort(self.data, backend="python"))
+        self.assertEqual(counting_sort(self.data, reverse=True), sorted(self.data, reverse=True))
+
+    def test_array_returns_array(self):
+        """Тест что array.array возвращается как array.array того же типа"""
+        arr = array("H", self.data)
+        result = counting_sort(arr)
+        self.assertIsInstance(result, array)
+        self.assertEqual(result.typecode, "H")
+        self.assertEqual(result.tolist(), sorted(self.data))
+        self.assertEqual(arr.tolist(), self.data)
+
+    def test_ndarray_returns_ndarray(self):
+        """Тест что ndarray возвращается как ndarray того же dtype"""
+        values = np.array(self.data, dtype=np.uint32)
+        result = counting_sort(values, reverse=True)
+        self.assertIsInstance(result, np.ndarray)
+        self.assertEqual(result.dtype, np.uint32)
+        self.assertEqual(result.tolist(), sorted(self.data, reverse=True))
+
+    def test_negative_raises_error(self):
+        """Тест что отрицательные числа вызывают ValueError"""
+        with self.assertRaisesRegex(ValueError, "non-negative integers"):
+            counting_sort(np.array([3, -1, 2]))
+
+    def test_non_integer_falls_back_to_python(self):
+        """Тест что большие целые и bool сортируются чистым Python"""
+        big = [2 ** 70 + i for i in range(100, 0, -1)]
+        self.assertEqual(counting_sort(big), sorted(big))
+        self.assertEqual(counting_sort([True, False] * 50), [False] * 50 + [True] * 50)
+        with self.assertRaises(TypeError):
+            counting_sort([0.5] * 100, backend="numpy")
+
+    def test_mixed_bool_and_int_keep_types(self):
+        """Тест что bool в списке вместе с int не превращаются в int"""
+        data = [True, 2, False, 0, 1] * 20
+        result = counting_sort(data)
+        self.assertEqual(result, sorted(data))
+        self.assertEqual([type(x) for x in result], [type(x) for x in sorted(data)])
+        with self.assertRaises(TypeError):
+            counting_sort(data, backend="numpy")
+
+    def test_unknown_backend(self):
+        """Тест что неизвестный бэкенд вызывает ValueError"""
+        with self.assertRaises(ValueError):
+            counting_sort([1], backend="gpu")
+
+
+class TestIntegerSort(unittest.TestCase):
+    """Тестовые случаи для функции integer_sort"""
+
+    def setUp(self):
+        rng = random.Random(11)
+        self.wide = [rng.randrange(-10 ** 12, 10 ** 12) for _ in range(2000)]
+        self.narrow = [rng.randrange(-50, 50) for _ in range(2000)]
+
+    def test_wide_range_does_not_allocate_range(self):
+        """Тест широкого диапазона: [0, 10**9] сортируется поразрядно"""
+        for backend in ("python", "auto"):
+            self.assertEqual(integer_sort([10 ** 9, 0, 5], backend=backend), [0, 5, 10 ** 9])
+
+    def test_negative_numbers(self):
+        """Тест отрицательных чисел в узком и широком диапазонах"""
+        for data in (self.narrow, self.wide):
+            for backend in ("python", "auto"):
+                self.assertEqual(integer_sort(data, backend=backend), sorted(data))
+                self.assertEqual(integer_sort(data, reverse=True, backend=backend), sorted(data, reverse=True))
+
+    def test_digit_bits(self):
+        """Тест разной ширины разряда"""
+        for bits in (1, 3, 11, 16):
+            self.assertEqual(integer_sort(self.wide, digit_bits=bits, backend="python"), sorted(self.wide))
+        with self.assertRaises(ValueError):
+            integer_sort([1], digit_bits=0)
+
+    def test_big_integers(self):
+        """Тест целых чисел произвольной длины"""
+        data = [2 ** 100, -(2 ** 90), 0, 2 ** 64 + 1, -1]
+        self.assertEqual(integer_sort(data), sorted(data))
+
+    def test_non_integer_elements_raise_type_error(self):
+        """Тест что нецелые элементы вызывают TypeError"""
+        for backend in ("python", "auto"):
+            with self.assertRaises(TypeError):
+                integer_sort([0.5, 1e9], backend=backend)
+            with self.assertRaises(TypeError):
+                integer_sort(["a", 1], backend=backend)
+
+    def test_bools_keep_their_objects(self):
+        """Тест что bool возвращаются как bool, равные элементы - в исходном порядке"""
+        data = [True, 5, 2, False, 1, 0, True]
+        for backend in ("python", "auto"):
+            result = integer_sort(data, backend=backend)
+            self.assertEqual([(type(x), x) for x in result], [(type(x), x) for x in sorted(data)])
+            result = integer_sort(data, reverse=True, backend=backend)
+            self.assertEqual([(type(x), x) for x in result], [(type(x), x) for x in sorted(data, reverse=True)])
+        wide = [True, 10 ** 9, False, 1, -(10 ** 9)]
+        self.assertEqual([(type(x), x) for x in integer_sort(wide)], [(type(x), x) for x in sorted(wide)])
+
+    def test_python_digit_bits_are_capped(self):
+        """Тест что digit_bits=24 на чистом Python не создаёт 2^24 корзин"""
+        self.assertEqual(integer_sort(self.wide, digit_bits=24, backend="python"), sorted(self.wide))
+
+    @unittest.skipIf(np is None, "NumPy не установлен")
+    def test_numpy_containers(self):
+        """Тест ndarray и array.array на полном диапазоне int64"""
+        values = np.array(self.wide + [np.iinfo(np.int64).min, np.iinfo(np.int64).max], dtype=np.int64)
+        result = integer_sort(values)
+        self.assertIsInstance(result, np.ndarray)
+        self.assertEqual(result.tolist(), sorted(values.tolist()))
+        arr = array("b", self.narrow)
+        result = integer_sort(arr, reverse=True)
+        self.assertIsInstance(result, array)
+        self.assertEqual(result.tolist(), sorted(self.narrow, reverse=True))
+
+
 class TestCountingSortGeneric(unittest.TestCase):
     """Тестовые случаи для функции counting_sort_generic"""
     
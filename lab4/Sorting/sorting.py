@@ -0,0 +1,20 @@
+"""
+@file sorting.py
+@brief Общая точка импорта алгоритмов сортировки
+@details Собирает классы и функции сортировки из модулей пакета, чтобы main.py
+         и тесты импортировали их из одного места.
+"""
+
+from InsertionSorter import InsertionSorter, insertion_sort
+from HybridSorter import HybridSorter, hybrid_sort
+from CountingSorter import CountingSorter, counting_sort
+from CountingSorterGeneric import CountingSorterGeneric, counting_sort_generic
+from IntegerSorter import IntegerSorter, integer_sort
+
+__all__ = [
+    "InsertionSorter", "insertion_sort",
+    "HybridSorter", "hybrid_sort",
+    "CountingSorter", "counting_sort",
+    "CountingSorterGeneric", "counting_sort_generic",
+    "IntegerSorter", "integer_sort",
+]